@@ -0,0 +1,136 @@
+# Copyright (c) 2025 Darshan P. All rights reserved.
+
+# This work is licensed under the terms of the MIT license.
+# For a copy, see <https://opensource.org/licenses/MIT>.
+
+'''
+Startup cost of the command line tool, as seen by a hook that runs it synchronously for every device:
+- `interpreter`: a bare `python3 -c pass`, the floor every run pays.
+- `json`: `main.py --format json <descriptors>` from spawn to exit.
+- `first descriptor`: `main.py --stream` from spawn to the first NDJSON line on stdout.
+- `-X importtime` of the json run, cumulative per module, for the modules that have dominated startup before
+  (extras.db, extras.classes, babel, graphviz, PIL). Modules the run never imports show as "-".
+
+Times are medians over fresh interpreters. The gated numbers are overheads above `interpreter`, which keeps the
+baseline comparable across machines of similar speed. `--save-baseline` writes them to `cliStartup.baseline.json`
+next to this script; `--check` compares against that file and exits with status 1 if an overhead grew by more than
+`--tolerance` (relative) and `--slack` milliseconds, or if the json run imports graphviz, PIL or babel. When the
+bare interpreter starts slower than it did for the baseline, the baseline overheads are scaled up by the same ratio.
+
+Usage: python3 benchmarks/cliStartup.py [--runs N] [--save-baseline | --check] [--tolerance X] [--slack MS]
+'''
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cliStartup.baseline.json")
+MODULES = ("extras.db", "extras.classes", "babel", "graphviz", "PIL")
+RENDERER = ("babel", "graphviz", "PIL")
+
+# A full-speed mouse: device, configuration, interface, HID, endpoint and string descriptors
+DEVICE = ("12 01 00 02 00 00 00 40 6d 04 77 c0 00 01 01 02 00 01 09 02 22 00 01 01 00 a0 32 09 04 00 00 01 03 01 02 00 "
+          "09 21 11 01 00 01 22 34 00 07 05 81 03 08 00 0a 04 03 09 04")
+
+def timed(command: list, stdin: str = None) -> float:
+    start = time.perf_counter()
+    subprocess.run(command, cwd=ROOT, input=stdin, capture_output=True, text=True, check=True)
+    return (time.perf_counter() - start) * 1000
+
+def first_line(command: list, stdin: str) -> float:
+    '''Time until the first line appears on stdout, with stdin kept open like a live stream.'''
+    start = time.perf_counter()
+    process = subprocess.Popen(command, cwd=ROOT, stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+    process.stdin.write(stdin)
+    process.stdin.flush()
+    process.stdout.readline()
+    elapsed = (time.perf_counter() - start) * 1000
+    process.stdin.close()
+    process.wait()
+    return elapsed
+
+def import_times(command: list) -> dict:
+    '''Cumulative `-X importtime` microseconds of each module in MODULES, None if it was not imported.'''
+    out = subprocess.run([command[0], "-X", "importtime"] + command[1:], cwd=ROOT, capture_output=True, text=True, check=True)
+    found = {}
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        name = name.strip()
+        if name in MODULES:
+            try:
+                found[name] = int(cumulative)
+            except ValueError:  # Header line
+                pass
+    return {module: found.get(module) for module in MODULES}
+
+def median(samples: list) -> float:
+    return round(statistics.median(samples), 2)
+
+def measure(runs: int) -> dict:
+    python = sys.executable
+    json_command = [python, "main.py", "--format", "json"] + DEVICE.split()
+    stream_command = [python, "main.py", "--stream"]
+    timed(json_command)  # Warm up the bytecode cache
+
+    interpreter, cli, first = [], [], []
+    for _ in range(runs):
+        interpreter.append(timed([python, "-c", "pass"]))
+        cli.append(timed(json_command))
+        first.append(first_line(stream_command, DEVICE + "\n"))
+    base = statistics.median(interpreter)
+    return {
+        "interpreter_ms": median(interpreter),
+        "overhead_ms": {"json": median([t - base for t in cli]), "first_descriptor": median([t - base for t in first])},
+        "imports_us": import_times(json_command),
+    }
+
+def compare(current: dict, baseline: dict, tolerance: float, slack: float) -> list:
+    problems = []
+    # A loaded or slower machine starts the bare interpreter slower too: scale the baseline by as much, never down
+    speed = max(1.0, current["interpreter_ms"] / baseline["interpreter_ms"])
+    for name, value in current["overhead_ms"].items():
+        allowed = baseline["overhead_ms"].get(name, value) * speed * tolerance + slack
+        if value > allowed:
+            problems.append(f"{name}: {value:.1f} ms over startup, baseline allows {allowed:.1f} ms")
+    for module in RENDERER:
+        if current["imports_us"].get(module) is not None:
+            problems.append(f"the json path imports {module}")
+    return problems
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="CLI startup benchmark")
+    parser.add_argument('--runs', type=int, default=15, help="Fresh interpreters per measurement (default 15)")
+    parser.add_argument('--save-baseline', action='store_true', help=f"Write the results to {os.path.basename(BASELINE)}")
+    parser.add_argument('--check', action='store_true', help="Compare against the stored baseline, exit with status 1 on a regression")
+    parser.add_argument('--tolerance', type=float, default=1.25, help="Allowed relative growth of an overhead (default 1.25)")
+    parser.add_argument('--slack', type=float, default=10.0, metavar='MS', help="Allowed absolute growth on top of --tolerance (default 10)")
+    args = parser.parse_args()
+
+    current = measure(args.runs)
+    print(f"{'interpreter':<18} {current['interpreter_ms']:>9.1f} ms")
+    for name, value in current["overhead_ms"].items():
+        print(f"{name:<18} {value:>9.1f} ms over interpreter start")
+    print("\n-X importtime of the json run (cumulative)")
+    for module, us in current["imports_us"].items():
+        print(f"{module:<18} {'-' if us is None else f'{us / 1000:.1f} ms':>12}")
+
+    if args.save_baseline:
+        with open(BASELINE, 'w', encoding='utf-8') as f:
+            json.dump(current, f, indent=2)
+            f.write("\n")
+        print(f"\nSaved baseline to {BASELINE}")
+    if args.check:
+        with open(BASELINE, encoding='utf-8') as f:
+            problems = compare(current, json.load(f), args.tolerance, args.slack)
+        print()
+        for problem in problems:
+            print(f"FAIL: {problem}")
+        print("OK: startup within baseline" if not problems else f"{len(problems)} startup regression(s)")
+        sys.exit(1 if problems else 0)
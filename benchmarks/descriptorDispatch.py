@@ -0,0 +1,95 @@
+# Copyright (c) 2025 Darshan P. All rights reserved.
+
+# This work is licensed under the terms of the MIT license.
+# For a copy, see <https://opensource.org/licenses/MIT>.
+
+'''
+Decode throughput of `ParseDescriptors` on a synthetic composite device with many interfaces: AudioControl and
+AudioStreaming interfaces with their class-specific descriptors, HID interfaces and SuperSpeed endpoint companions.
+
+With `--baseline REV`, the `descriptors.py` of that git revision (e.g. the last one with the if/elif dispatch)
+is decoded on the same input for comparison.
+
+Usage: python3 benchmarks/descriptorDispatch.py [--functions N] [--baseline REV]
+'''
+
+import argparse
+import os
+import sys
+import timeit
+from struct import pack
+from revisions import load_revision
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+def audio_function(first_interface: int) -> bytes:
+    '''One AudioControl interface and one AudioStreaming interface with two alternate settings.'''
+    ac, streaming = first_interface & 0xFF, (first_interface + 1) & 0xFF
+    out = pack("<8B", 8, 11, ac, 2, 1, 0, 0, 0)  # Interface Association
+    out += pack("<9B", 9, 4, ac, 0, 0, 1, 1, 0, 0)
+    out += pack("<BBBHHBB", 9, 0x24, 1, 0x0100, 39, 1, streaming)  # HEADER
+    out += pack("<BBBBHBBHBB", 12, 0x24, 2, 1, 0x0201, 0, 2, 3, 0, 0)  # INPUT_TERMINAL
+    out += pack("<10B", 10, 0x24, 6, 2, 1, 1, 1, 2, 2, 0)  # FEATURE_UNIT
+    out += pack("<BBBBHBBB", 9, 0x24, 3, 3, 0x0101, 0, 2, 0)  # OUTPUT_TERMINAL
+    out += pack("<9B", 9, 4, streaming, 0, 0, 1, 2, 0, 0)
+    for alternate in (1, 2):
+        out += pack("<9B", 9, 4, streaming, alternate, 1, 1, 2, 0, 0)
+        out += pack("<BBBBBH", 7, 0x24, 1, 1, 1, 1)  # AS_GENERAL
+        out += pack("<8B", 11, 0x24, 2, 1, 2, 2, 16, 1) + (44100).to_bytes(3, 'little')  # FORMAT_TYPE I
+        out += pack("<BBBBHB", 9, 5, 0x01, 0x05, 192, 1) + bytes(2)
+        out += pack("<BBBBH", 6, 48, 0, 0, 192)  # SuperSpeed companion
+        out += pack("<BBBBBH", 7, 0x25, 1, 1, 0, 0)  # EP_GENERAL
+    return out
+
+def hid_function(interface: int) -> bytes:
+    out = pack("<9B", 9, 4, interface & 0xFF, 0, 2, 3, 1, 1, 0)
+    out += pack("<BBHBBBH", 9, 0x21, 0x0111, 0, 1, 0x22, 52)
+    for address in (0x81, 0x01):
+        out += pack("<BBBBHB", 7, 5, address, 0x03, 8, 10)
+        out += pack("<BBBBH", 6, 48, 0, 0, 8)
+    return out
+
+def composite_device(functions: int) -> bytes:
+    body = b""
+    interface = 0
+    for i in range(functions):
+        if i % 2 == 0:
+            body += audio_function(interface)
+            interface += 2
+        else:
+            body += hid_function(interface)
+            interface += 1
+    # Interface numbers and wTotalLength wrap for oversized devices, which the decoder does not check
+    config = pack("<BBHBBBBB", 9, 2, (9 + len(body)) & 0xFFFF, min(interface, 0xFF), 1, 0, 0x80, 250)
+    device = pack("<BBHBBBBHHHBBBB", 18, 1, 0x0320, 0xEF, 2, 1, 9, 0x046d, 0xc077, 0x0100, 1, 2, 0, 1)
+    strings = pack("<BBH", 4, 3, 0x0409) + bytes([12, 3]) + "Bench".encode('utf-16-le')
+    return device + strings + config + body
+
+def measure(parse, data: bytes) -> tuple:
+    count = len(parse(data).nodes)
+    number = max(1, 20000 // count)
+    seconds = min(timeit.repeat(lambda: parse(data), number=number, repeat=7)) / number
+    return count, seconds
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Descriptor dispatch benchmark")
+    parser.add_argument('--functions', type=int, default=64, help="Number of audio/HID functions in the device (default 64)")
+    parser.add_argument('--baseline', type=str, default=None, metavar='REV', help="Also decode with descriptors.py from this git revision")
+    args = parser.parse_args()
+
+    import descriptors
+    data = composite_device(args.functions)
+    cases = [("current", descriptors.ParseDescriptors)]
+    if args.baseline:
+        cases.insert(0, (args.baseline, load_revision(args.baseline).ParseDescriptors))
+
+    print(f"{len(data)} bytes, {args.functions} functions")
+    print(f"{'Revision':<12} {'descriptors':>11} {'total (ms)':>11} {'per descriptor (us)':>20}")
+    results = []
+    for name, parse in cases:
+        count, seconds = measure(parse, data)
+        results.append(seconds)
+        print(f"{name:<12} {count:>11} {seconds * 1000:>11.3f} {seconds / count * 1e6:>20.3f}")
+    if len(results) == 2:
+        print(f"\nspeedup: {results[0] / results[1]:.2f}x")
@@ -0,0 +1,73 @@
+# Copyright (c) 2025 Darshan P. All rights reserved.
+
+# This work is licensed under the terms of the MIT license.
+# For a copy, see <https://opensource.org/licenses/MIT>.
+
+'''
+Bulk decoding of captured interrupt-IN reports: `reports.DecodeReports` over a NumPy buffer against decoding
+each report in Python with the same layout. The layout is a mouse with report ID, 16 buttons, 12-bit X/Y and a
+signed wheel, the kind of device that sends 1000 reports a second. The Python decoder runs on at most the first
+100000 reports and its time is scaled to the full buffer. `tests/test_reports.py` checks that both decoders agree.
+
+Usage: python3 benchmarks/hidReportArrays.py [--reports N]
+'''
+
+import argparse
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+MOUSE = bytes([0x05, 0x01, 0x09, 0x02, 0xA1, 0x01, 0x85, 0x02, 0x09, 0x01, 0xA1, 0x00,
+               0x05, 0x09, 0x19, 0x01, 0x29, 0x10, 0x15, 0x00, 0x25, 0x01, 0x95, 0x10, 0x75, 0x01, 0x81, 0x02,
+               0x05, 0x01, 0x09, 0x30, 0x09, 0x31, 0x16, 0x01, 0xF8, 0x26, 0xFF, 0x07, 0x75, 0x0C, 0x95, 0x02, 0x81, 0x06,
+               0x09, 0x38, 0x15, 0x81, 0x25, 0x7F, 0x75, 0x08, 0x95, 0x01, 0x81, 0x06,
+               0xC0, 0xC0])
+
+def decode_python(report, data: bytes) -> list:
+    '''Per-report reference decoder: one big integer per report, fields cut out with shifts.'''
+    length = report.byte_length
+    fields = [[] for _ in report.fields]
+    for start in range(0, len(data) - length + 1, length):
+        if data[start] != report.report_id:
+            continue
+        value = int.from_bytes(data[start:start + length], 'little')
+        for out, field in zip(fields, report.fields):
+            mask = (1 << field.bit_size) - 1
+            elements = []
+            for element in range(field.count):
+                x = (value >> (field.bit_offset + element * field.bit_size)) & mask
+                if field.signed and x >> (field.bit_size - 1):
+                    x -= 1 << field.bit_size
+                elements.append(x)
+            out.append(elements)
+    return fields
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="HID report bulk decoding benchmark")
+    parser.add_argument('--reports', type=int, default=1_000_000, help="Number of captured reports (default 1000000)")
+    args = parser.parse_args()
+
+    import descriptors
+    import reports
+    report = reports.ParseReportLayout(descriptors.ParseReportDescriptor(MOUSE).items).report(reports.INPUT, 2)
+    rng = random.Random(0)
+    data = b"".join(bytes([2]) + rng.randbytes(report.byte_length - 1) for _ in range(args.reports))
+
+    start = time.perf_counter()
+    reports.DecodeReports(report, data)
+    vectorised = time.perf_counter() - start
+
+    sample = data[:report.byte_length * min(args.reports, 100_000)]
+    start = time.perf_counter()
+    decode_python(report, sample)
+    python = (time.perf_counter() - start) * len(data) / len(sample)
+
+    print(f"{args.reports} reports of {report.byte_length} bytes, {len(report.fields)} fields")
+    print(f"{'Decoder':<12} {'total (s)':>10} {'reports/s':>14}")
+    print(f"{'python':<12} {python:>10.3f} {args.reports / python:>14,.0f}")
+    print(f"{'numpy':<12} {vectorised:>10.3f} {args.reports / vectorised:>14,.0f}")
+    print(f"\nspeedup: {python / vectorised:.1f}x")
@@ -0,0 +1,83 @@
+# Copyright (c) 2025 Darshan P. All rights reserved.
+
+# This work is licensed under the terms of the MIT license.
+# For a copy, see <https://opensource.org/licenses/MIT>.
+
+'''
+Decode and describe throughput for large synthetic HID report descriptors, the kind vendor devices ship with
+dozens of report IDs: `ParseReportDescriptor` followed by `describe_hid_item` on every item.
+
+With `--baseline REV`, `descriptors.py` and `helpers.py` of that git revision run on the same input for comparison.
+
+Usage: python3 benchmarks/hidReportDecode.py [--kilobytes N] [--baseline REV]
+'''
+
+import argparse
+import os
+import sys
+import timeit
+from revisions import load_revision
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+def vendor_report(report_id: int) -> bytes:
+    '''One vendor-defined application collection with input, output and feature reports.'''
+    out = bytes([0x06, 0x00, 0xFF,  # Usage Page (Vendor Defined 0xFF00)
+                 0x09, report_id & 0xFF,  # Usage
+                 0xA1, 0x01,  # Collection (Application)
+                 0x85, report_id & 0xFF,  # Report ID
+                 0x15, 0x00,  # Logical Minimum (0)
+                 0x26, 0xFF, 0x00,  # Logical Maximum (255)
+                 0x75, 0x08])  # Report Size (8)
+    for flags in (0x02, 0x03, 0x06):
+        out += bytes([0x19, 0x01, 0x29, 0x40,  # Usage Minimum / Maximum
+                      0x95, 0x40,  # Report Count (64)
+                      0x81, flags])  # Input
+    out += bytes([0x09, 0x20, 0x95, 0x40, 0x91, 0x02,  # Output (Data, Variable, Absolute)
+                  0x09, 0x21, 0x96, 0x00, 0x01, 0xB2, 0x02, 0x01,  # Feature (Data, Variable, Absolute, Buffered Bytes)
+                  0x17, 0x00, 0x00, 0x00, 0x80,  # Logical Minimum (4-byte)
+                  0xA4, 0x55, 0x0E, 0x65, 0x11, 0xB4,  # Push, Unit Exponent, Unit, Pop
+                  0xC0])  # End Collection
+    return out
+
+def report_descriptor(kilobytes: int) -> bytes:
+    out = b""
+    report_id = 1
+    while len(out) < kilobytes * 1024:
+        out += vendor_report(report_id)
+        report_id += 1
+    return out
+
+def decoder(descriptors, helpers):
+    parse, describe = descriptors.ParseReportDescriptor, helpers.describe_hid_item
+    return lambda data: [describe(prefix, value) for prefix, value in parse(data).items]
+
+def measure(decode, data: bytes) -> tuple:
+    count = len(decode(data))
+    number = max(1, 200000 // count)
+    seconds = min(timeit.repeat(lambda: decode(data), number=number, repeat=7)) / number
+    return count, seconds
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="HID report descriptor decode benchmark")
+    parser.add_argument('--kilobytes', type=int, default=8, help="Approximate report descriptor size (default 8)")
+    parser.add_argument('--baseline', type=str, default=None, metavar='REV', help="Also decode with descriptors.py and helpers.py from this git revision")
+    args = parser.parse_args()
+
+    import descriptors
+    import helpers
+    data = report_descriptor(args.kilobytes)
+    cases = [("current", decoder(descriptors, helpers))]
+    if args.baseline:
+        cases.insert(0, (args.baseline, decoder(load_revision(args.baseline, "descriptors"), load_revision(args.baseline, "helpers"))))
+
+    print(f"{len(data)} bytes")
+    print(f"{'Revision':<12} {'items':>8} {'total (ms)':>11} {'per item (ns)':>14}")
+    results = []
+    for name, decode in cases:
+        count, seconds = measure(decode, data)
+        results.append(seconds)
+        print(f"{name:<12} {count:>8} {seconds * 1000:>11.3f} {seconds / count * 1e9:>14.1f}")
+    if len(results) == 2:
+        print(f"\nspeedup: {results[0] / results[1]:.2f}x")
@@ -0,0 +1,62 @@
+# Copyright (c) 2025 Darshan P. All rights reserved.
+
+# This work is licensed under the terms of the MIT license.
+# For a copy, see <https://opensource.org/licenses/MIT>.
+
+'''
+Import cost of the decode-only entry points in a fresh interpreter: the modules used for decoding, JSON output
+and capture reading, and `main` itself (which must not load the renderer until something is rendered).
+
+With `--check`, exits with status 1 if any of them imports graphviz, PIL or babel, or if its median import time
+is over the budget, so it can run as a regression gate in CI.
+
+Usage: python3 benchmarks/importBudget.py [--runs N] [--check] [--budget MS]
+'''
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY = ("graphviz", "PIL", "babel")
+
+PROBE = '''
+import sys, time
+t = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - t
+print(elapsed, ",".join(m for m in {heavy!r} if m in sys.modules))
+'''
+
+ENTRY_POINTS = ("descriptors", "export", "readers", "reports", "main")
+
+def measure(module: str, runs: int) -> tuple:
+    code = PROBE.format(module=module, heavy=HEAVY)
+    timings, loaded = [], ""
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+        elapsed, loaded = (out.stdout.split() + [""])[:2]
+        timings.append(float(elapsed) * 1000)
+    return statistics.median(timings), loaded
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Decode-only import budget")
+    parser.add_argument('--runs', type=int, default=10, help="Fresh interpreters per module (default 10)")
+    parser.add_argument('--check', action='store_true', help="Exit with status 1 if a module is over budget or loads a renderer dependency")
+    parser.add_argument('--budget', type=float, default=150.0, metavar='MS', help="Median import time allowed per module (default 150)")
+    args = parser.parse_args()
+
+    failures = 0
+    print(f"{'Module':<12} {'import (ms)':>12}  Renderer modules loaded")
+    for module in ENTRY_POINTS:
+        measure(module, 1)  # Warm up the bytecode cache
+        median_ms, loaded = measure(module, args.runs)
+        over = median_ms > args.budget
+        failures += bool(loaded) or over
+        flag = "  over budget" if over else ""
+        print(f"{module:<12} {median_ms:>12.2f}  {loaded or '-'}{flag}")
+    if args.check:
+        print(f"\n{'FAIL' if failures else 'OK'}: budget {args.budget:.0f} ms, no {', '.join(HEAVY)}")
+        sys.exit(1 if failures else 0)
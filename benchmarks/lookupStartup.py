@@ -0,0 +1,70 @@
+# Copyright (c) 2025 Darshan P. All rights reserved.
+
+# This work is licensed under the terms of the MIT license.
+# For a copy, see <https://opensource.org/licenses/MIT>.
+
+'''
+Compares the cost of the first vendor/product lookup in a fresh interpreter:
+the old `extras/db.py` dict import against the compiled `extras/usbIDs.idx` table.
+
+Each case is timed cold and warm. Cold runs point `-X pycache_prefix` at an empty directory, so every module is
+compiled from source as on a first run after install or an edit; warm runs read the bytecode cache. The control
+case imports `helpers` without looking anything up, which leaves the cost of the lookup itself as the difference
+to the `usbIDs.idx` case.
+
+Usage: python3 benchmarks/lookupStartup.py [runs]
+'''
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = '''
+import resource, time
+t = time.perf_counter()
+{setup}
+vendor, product = {lookup}
+elapsed = time.perf_counter() - t
+print(elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+'''
+
+CASES = {
+    "extras.db (old)": (
+        "from extras.db import db",
+        "db['0x046d']['name'], db['0x046d']['devices']['0xc077']['name']",
+    ),
+    "usbIDs.idx (new)": (
+        "from helpers import get_vendor_name, get_product_name",
+        "get_vendor_name(0x046d), get_product_name(0x046d, 0xc077)",
+    ),
+    "helpers, no lookup": (
+        "import helpers",
+        "None, None",
+    ),
+}
+
+def run_case(setup, lookup, runs, cold=False):
+    code = PROBE.format(setup=setup, lookup=lookup)
+    timings, rss = [], []
+    for _ in range(runs):
+        with tempfile.TemporaryDirectory() as pycache:
+            options = ["-X", f"pycache_prefix={pycache}"] if cold else []
+            out = subprocess.run([sys.executable] + options + ["-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+        elapsed, maxrss = out.stdout.split()
+        timings.append(float(elapsed) * 1000)
+        rss.append(int(maxrss) / 1024)
+    return statistics.median(timings), statistics.median(rss)
+
+if __name__ == "__main__":
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    print(f"{'Import path':<20} {'cache':<6} {'import+lookup (ms)':>20} {'max RSS (MiB)':>15}")
+    for name, (setup, lookup) in CASES.items():
+        cold = run_case(setup, lookup, runs, cold=True)
+        run_case(setup, lookup, 1)  # Warm up the bytecode cache
+        warm = run_case(setup, lookup, runs)
+        for cache, (median_ms, median_rss) in (("cold", cold), ("warm", warm)):
+            print(f"{name:<20} {cache:<6} {median_ms:>20.2f} {median_rss:>15.1f}")
@@ -0,0 +1,25 @@
+# Copyright (c) 2025 Darshan P. All rights reserved.
+
+# This work is licensed under the terms of the MIT license.
+# For a copy, see <https://opensource.org/licenses/MIT>.
+
+'''
+Loads top-level modules as they were at another git revision, for the `--baseline REV` option of the benchmarks.
+'''
+
+import os
+import subprocess
+import sys
+import types
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def load_revision(revision: str, name: str = "descriptors") -> types.ModuleType:
+    '''Imports `<name>.py` as it was at `revision`, as a module named `<name>_baseline`. Its own imports resolve to
+    the current tree.'''
+    source = subprocess.run(["git", "show", f"{revision}:{name}.py"], cwd=ROOT, capture_output=True, check=True).stdout
+    module = types.ModuleType(f"{name}_baseline")
+    module.__file__ = f"{revision}:{name}.py"
+    sys.modules[module.__name__] = module  # Lets NamedTuple and dataclass definitions find their module
+    exec(compile(source, module.__file__, "exec"), module.__dict__)
+    return module
@@ -0,0 +1,156 @@
+# Copyright (c) 2025 Darshan P. All rights reserved.
+
+# This work is licensed under the terms of the MIT license.
+# For a copy, see <https://opensource.org/licenses/MIT>.
+
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+
+class RenderCache:
+    '''
+        ## `RenderCache`
+
+        ### Description
+        Content-addressed store of finished (rendered and watermarked) outputs. Entries are keyed on a SHA-256 of
+        the descriptor bytes, the tool version and the output format, so a descriptor blob that was rendered before
+        is served by copying (or hard-linking) the stored file instead of running GraphViz and Pillow again.
+
+        The total size is kept under `max_bytes` by evicting the least recently used entries. Every hit refreshes
+        the entry's modification time, which is what the eviction order is based on. The directory is only scanned
+        when the cache is opened and when a store takes the running total over the limit; eviction then frees
+        space down to 90% of `max_bytes`, so a full cache is not rescanned on every store.
+
+        ### Parameters
+        - `directory` (str): Cache directory, created if missing.
+        - `max_bytes` (int): Size limit for all entries together.
+        - `version` (str): Tool version; bumping it invalidates every entry.
+        - `link` (bool): Serve hits as hard links instead of copies. Only use this when outputs are never modified
+          in place, since a hard-linked output shares its data with the cache entry.
+    '''
+    def __init__(self, directory: str, max_bytes: int, version: str, link: bool = False):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.version = version
+        self.link = link
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self._total = self._scan()[1]  # Bytes in the cache, kept up to date by stores and evictions
+
+    def key(self, descriptors, fmt: str) -> str:
+        digest = hashlib.sha256()
+        digest.update(f"{self.version}\0{fmt}\0".encode())
+        digest.update(bytes(descriptors))
+        return digest.hexdigest()
+
+    def _path(self, key: str, fmt: str) -> str:
+        return os.path.join(self.directory, f"{key}.{fmt}")
+
+    def fetch(self, descriptors, fmt: str, output: str) -> bool:
+        '''Places the cached output for `descriptors` at `output`. Returns False (and counts a miss) if there is none.'''
+        entry = self._path(self.key(descriptors, fmt), fmt)
+        try:
+            os.utime(entry)  # Refreshes the LRU position, raises on a miss before touching `output`
+            if os.path.lexists(output):
+                os.remove(output)
+            if self.link:
+                try:
+                    os.link(entry, output)
+                except OSError:  # Cross-device or unsupported, fall back to a copy
+                    shutil.copyfile(entry, output)
+            else:
+                shutil.copyfile(entry, output)
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return False
+        with self._lock:
+            self.hits += 1
+        return True
+
+    def store(self, descriptors, fmt: str, output: str):
+        '''Copies a freshly rendered `output` into the cache and evicts old entries if over the size limit.'''
+        entry = self._path(self.key(descriptors, fmt), fmt)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        os.close(fd)
+        shutil.copyfile(output, tmp)
+        os.chmod(tmp, 0o644)  # mkstemp creates owner-only files, keep the cache shareable
+        self._replace(tmp, entry)
+
+    def get(self, descriptors, fmt: str):
+        '''Returns the cached output for `descriptors` as bytes, or None (and counts a miss) if there is none.'''
+        entry = self._path(self.key(descriptors, fmt), fmt)
+        try:
+            os.utime(entry)
+            with open(entry, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return data
+
+    def put(self, descriptors, fmt: str, data: bytes):
+        '''Stores an output held in memory, like `store` does for a file.'''
+        entry = self._path(self.key(descriptors, fmt), fmt)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.chmod(tmp, 0o644)
+        self._replace(tmp, entry)
+
+    def _replace(self, tmp: str, entry: str):
+        '''Moves a finished temporary file into place and evicts if that takes the total over the limit.'''
+        size = os.stat(tmp).st_size
+        try:
+            size -= os.stat(entry).st_size  # Overwriting an entry only adds the difference
+        except FileNotFoundError:
+            pass
+        os.replace(tmp, entry)  # Atomic, so readers never see a partial file
+        with self._lock:
+            self._total += size
+            over = self._total > self.max_bytes
+        if over:
+            self.evict()
+
+    def _scan(self) -> tuple:
+        '''(entries as (mtime, size, path), total size) of the whole directory.'''
+        entries = []
+        total = 0
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.is_file() and not entry.name.endswith(".tmp"):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total += stat.st_size
+        return entries, total
+
+    def evict(self):
+        '''Removes least recently used entries down to 90% of `max_bytes`, rescanning to count other processes' entries.'''
+        with self._lock:
+            entries, total = self._scan()
+            if total <= self.max_bytes:
+                self._total = total
+                return
+            entries.sort()
+            target = self.max_bytes * 9 // 10
+            for _, size, path in entries:
+                if total <= target:
+                    break
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    continue
+                total -= size
+                self.evictions += 1
+            self._total = total
+
+    def stats(self) -> str:
+        return f"cache: {self.hits} hits, {self.misses} misses, {self.evictions} evictions"
@@ -0,0 +1,795 @@
+# Copyright (c) 2025 Darshan P. All rights reserved.
+
+# This work is licensed under the terms of the MIT license.
+# For a copy, see <https://opensource.org/licenses/MIT>.
+
+'''
+Decoding stage of the visualizer: turns raw GET_DESCRIPTOR bytes into a tree of typed, immutable records.
+Nothing in here formats output, so analytics code can use `ParseDescriptors` without building any graph.
+Rendering lives in `processing.py`.
+'''
+
+from struct import Struct
+from typing import NamedTuple, Optional
+from hiditems import HIDItemPrefix, HIDItemPrefixes, HIDItemSizes as _HID_ITEM_SIZES
+
+# Standard descriptors
+class DeviceDescriptor(NamedTuple):
+    '''**9.6.1 Device**: General information about a device that applies to all of its configurations.'''
+    bLength: int
+    bDescriptorType: int
+    bcdUSB: int
+    bDeviceClass: int
+    bDeviceSubClass: int
+    bDeviceProtocol: int
+    bMaxPacketSize0: int
+    idVendor: int
+    idProduct: int
+    bcdDevice: int
+    iManufacturer: int
+    iProduct: int
+    iSerialNumber: int
+    bNumConfigurations: int
+
+class ConfigurationDescriptor(NamedTuple):
+    '''**9.6.3 Configuration**: Describes a specific device configuration.'''
+    bLength: int
+    bDescriptorType: int
+    wTotalLength: int
+    bNumInterfaces: int
+    bConfigurationValue: int
+    iConfiguration: int
+    bmAttributes: int
+    bMaxPower: int
+
+class OtherSpeedConfigurationDescriptor(ConfigurationDescriptor):
+    '''**9.6.4 Other Speed Configuration**: Describes a configuration at a different speed.'''
+    __slots__ = ()
+
+class StringDescriptor(NamedTuple):
+    '''**9.6.7 String**: A Unicode string, or the first LANGID of the language array (string index 0).'''
+    bLength: int
+    bDescriptorType: int
+    string: Optional[str]
+    wLANGID: Optional[int]
+
+class InterfaceDescriptor(NamedTuple):
+    '''**9.6.5 Interface**: Describes a specific interface within a configuration.'''
+    bLength: int
+    bDescriptorType: int
+    bInterfaceNumber: int
+    bAlternateSetting: int
+    bNumEndpoints: int
+    bInterfaceClass: int
+    bInterfaceSubClass: int
+    bInterfaceProtocol: int
+    iInterface: int
+
+class EndpointDescriptor(NamedTuple):
+    '''**9.6.6 Endpoint**: Describes an endpoint within an interface.'''
+    bLength: int
+    bDescriptorType: int
+    bEndpointAddress: int
+    bmAttributes: int
+    wMaxPacketSize: int
+    bInterval: int
+
+    @property
+    def direction(self) -> str:
+        return "IN" if (self.bEndpointAddress & 0x80) else "OUT"
+
+    @property
+    def endpoint_number(self) -> int:
+        return self.bEndpointAddress & 0x0F
+
+    @property
+    def transfer_type(self) -> int:
+        return self.bmAttributes & 0x03
+
+class InterfaceAssociationDescriptor(NamedTuple):
+    '''**9.6.4 Interface Association**: Groups interfaces that form a single function.'''
+    bLength: int
+    bDescriptorType: int
+    bFirstInterface: int
+    bInterfaceCount: int
+    bFunctionClass: int
+    bFunctionSubClass: int
+    bFunctionProtocol: int
+    iFunction: int
+
+class DeviceQualifierDescriptor(NamedTuple):
+    '''**9.6.2 Device Qualifier**: Describes information about a device that would apply at a different speed.'''
+    bLength: int
+    bDescriptorType: int
+    bcdUSB: int
+    bDeviceClass: int
+    bDeviceSubClass: int
+    bDeviceProtocol: int
+    bMaxPacketSize0: int
+    bNumConfigurations: int
+    bReserved: int
+
+class BOSDescriptor(NamedTuple):
+    '''**9.6.2 BOS**: Binary Object Store descriptor, followed by capability descriptors.'''
+    bLength: int
+    bDescriptorType: int
+    wTotalLength: int
+    bNumDeviceCaps: int
+
+class DeviceCapabilityDescriptor(NamedTuple):
+    '''**9.6.2 Device Capability**: A capability without a dedicated decoder, `data` holds the bytes after bDevCapabilityType.'''
+    bLength: int
+    bDescriptorType: int
+    bDevCapabilityType: int
+    data: bytes
+
+class USB20ExtensionCapability(NamedTuple):
+    '''USB 2.0 Extension device capability (bDevCapabilityType 2).'''
+    bLength: int
+    bDescriptorType: int
+    bDevCapabilityType: int
+    bmAttributes: int
+
+    @property
+    def lpm_capable(self) -> bool:
+        return bool(self.bmAttributes & 0x02)
+
+class SuperSpeedUSBCapability(NamedTuple):
+    '''SuperSpeed USB device capability (bDevCapabilityType 3).'''
+    bLength: int
+    bDescriptorType: int
+    bDevCapabilityType: int
+    bmAttributes: int
+    wSpeedsSupported: int
+    bFunctionalitySupport: int
+    bU1DevExitLat: int
+    wU2DevExitLat: int
+
+    @property
+    def speeds(self) -> tuple:
+        names = ("Low-speed", "Full-speed", "High-speed", "SuperSpeed")
+        return tuple(name for bit, name in enumerate(names) if self.wSpeedsSupported & (1 << bit))
+
+class ContainerIDCapability(NamedTuple):
+    '''Container ID device capability (bDevCapabilityType 5). `ContainerID` is None if the descriptor is too short.'''
+    bLength: int
+    bDescriptorType: int
+    bDevCapabilityType: int
+    ContainerID: Optional[bytes]
+
+class SSEndpointCompanionDescriptor(NamedTuple):
+    '''**SuperSpeed Endpoint Companion**: Follows a SuperSpeed endpoint. `transfer_type` is copied from that endpoint.'''
+    bLength: int
+    bDescriptorType: int
+    bMaxBurst: int
+    bmAttributes: int
+    wBytesPerInterval: int
+    transfer_type: int
+
+class SSPIsochEndpointCompanionDescriptor(NamedTuple):
+    '''**SuperSpeedPlus Isochronous Endpoint Companion**: For USB 3.1+ isochronous endpoints.'''
+    bLength: int
+    bDescriptorType: int
+    wReserved: int
+    dwBytesPerInterval: int
+
+class UnknownDescriptor(NamedTuple):
+    '''A descriptor (or class-specific subtype) without a decoder. `message` says what was not recognised.'''
+    bLength: int
+    bDescriptorType: int
+    data: bytes
+    message: str
+
+# HID class descriptors
+class HIDDescriptor(NamedTuple):
+    '''**HID Descriptor**: HID version, country code and the class descriptors that follow.'''
+    bLength: int
+    bDescriptorType: int
+    bcdHID: int
+    bCountryCode: int
+    bNumDescriptors: int
+    descriptors: tuple  # (bDescriptorType, wDescriptorLength) pairs
+
+class HIDItem(NamedTuple):
+    '''One item of a report descriptor: the prefix byte and its little-endian data.'''
+    prefix: int
+    data: int
+
+    @property
+    def size(self) -> int:
+        return HIDItemPrefixes[self.prefix].size
+
+    @property
+    def type(self) -> int:
+        return HIDItemPrefixes[self.prefix].type
+
+    @property
+    def tag(self) -> int:
+        return HIDItemPrefixes[self.prefix].tag
+
+class ReportDescriptor(NamedTuple):
+    '''**Report Descriptor (0x22)**: Describes the format of data exchanged with a HID device.'''
+    length: int
+    items: tuple  # HIDItem
+
+class PhysicalDescriptor(NamedTuple):
+    '''**Physical Descriptor (0x23)**: Describes physical characteristics of a HID device (e.g., for force feedback).'''
+    bLength: int
+    bDescriptorType: int
+    data: bytes
+
+# Audio class descriptors
+class AudioControlHeaderDescriptor(NamedTuple):
+    bLength: int
+    bDescriptorType: int
+    bDescriptorSubtype: int
+    bcdADC: int
+    wTotalLength: int
+    bInCollection: int
+    baInterfaceNr: tuple
+
+class InputTerminalDescriptor(NamedTuple):
+    bLength: int
+    bDescriptorType: int
+    bDescriptorSubtype: int
+    bTerminalID: int
+    wTerminalType: int
+    bAssocTerminal: int
+    bNrChannels: int
+    wChannelConfig: int
+    iChannelNames: int
+    iTerminal: int
+
+class OutputTerminalDescriptor(NamedTuple):
+    bLength: int
+    bDescriptorType: int
+    bDescriptorSubtype: int
+    bTerminalID: int
+    wTerminalType: int
+    bAssocTerminal: int
+    bSourceID: int
+    iTerminal: int
+
+class FeatureUnitDescriptor(NamedTuple):
+    bLength: int
+    bDescriptorType: int
+    bDescriptorSubtype: int
+    bUnitID: int
+    bSourceID: int
+    bControlSize: int
+    bmaControls: tuple
+    iFeature: int
+
+class ASGeneralDescriptor(NamedTuple):
+    bLength: int
+    bDescriptorType: int
+    bDescriptorSubtype: int
+    bTerminalLink: int
+    bDelay: int
+    wFormatTag: int
+
+class FormatTypeIDescriptor(NamedTuple):
+    '''`tSamFreq` holds (lower, upper) when bSamFreqType is 0 (continuous), otherwise the discrete frequencies.'''
+    bLength: int
+    bDescriptorType: int
+    bDescriptorSubtype: int
+    bFormatType: int
+    bNrChannels: int
+    bSubframeSize: int
+    bBitResolution: int
+    bSamFreqType: int
+    tSamFreq: tuple
+
+class AudioEndpointDescriptor(NamedTuple):
+    bLength: int
+    bDescriptorType: int
+    bDescriptorSubtype: int
+    bmAttributes: int
+    bLockDelayUnits: int
+    wLockDelay: int
+
+# Parsers
+# Every parser takes one descriptor as any bytes-like object (ParseDescriptors passes zero-copy memoryview slices).
+# Fixed layouts are unpacked in a single call with precompiled little-endian structs.
+_DEVICE = Struct("<BBHBBBBHHHBBBB")
+_CONFIGURATION = Struct("<BBHBBBBB")
+_INTERFACE = Struct("<9B")
+_ENDPOINT = Struct("<BBBBHB")
+_INTERFACE_ASSOCIATION = Struct("<8B")
+_DEVICE_QUALIFIER = Struct("<BBHBBBBBB")
+_BOS = Struct("<BBHB")
+_USB20_EXTENSION = Struct("<BBBI")
+_SUPERSPEED_USB = Struct("<BBBBHBBH")
+_SS_ENDPOINT_COMPANION = Struct("<BBBBH")
+_SSP_ISOCH_ENDPOINT_COMPANION = Struct("<BBHI")
+_HID = Struct("<BBHBB")
+_HID_CLASS_DESCRIPTOR = Struct("<BH")
+_AC_HEADER = Struct("<BBBHHB")
+_INPUT_TERMINAL = Struct("<BBBBHBBHBB")
+_OUTPUT_TERMINAL = Struct("<BBBBHBBB")
+_AS_GENERAL = Struct("<BBBBBH")
+_FORMAT_TYPE_I = Struct("<8B")
+_AUDIO_ENDPOINT = Struct("<BBBBBH")
+
+_new = tuple.__new__  # Record._make without the Python-level call; the structs always yield the exact field count
+
+def _le(data) -> int:
+    return int.from_bytes(data, 'little')
+
+def ParseDeviceDescriptor(descriptor) -> DeviceDescriptor:
+    return _new(DeviceDescriptor, _DEVICE.unpack_from(descriptor))
+
+def ParseConfigurationDescriptor(descriptor) -> ConfigurationDescriptor:
+    record = OtherSpeedConfigurationDescriptor if descriptor[1] == 7 else ConfigurationDescriptor
+    return _new(record, _CONFIGURATION.unpack_from(descriptor))
+
+def ParseStringDescriptor(descriptor) -> StringDescriptor:
+    bLength = descriptor[0]
+    if bLength > 0x04:
+        return StringDescriptor(bLength, descriptor[1], str(descriptor[2:bLength], 'utf-16-le'), None)
+    return StringDescriptor(bLength, descriptor[1], None, _le(descriptor[2:4]))
+
+def ParseInterfaceDescriptor(descriptor) -> InterfaceDescriptor:
+    return _new(InterfaceDescriptor, _INTERFACE.unpack_from(descriptor))
+
+def ParseEndpointDescriptor(descriptor) -> EndpointDescriptor:
+    return _new(EndpointDescriptor, _ENDPOINT.unpack_from(descriptor))
+
+def ParseInterfaceAssociationDescriptor(descriptor) -> InterfaceAssociationDescriptor:
+    return _new(InterfaceAssociationDescriptor, _INTERFACE_ASSOCIATION.unpack_from(descriptor))
+
+def ParseDeviceQualifierDescriptor(descriptor) -> DeviceQualifierDescriptor:
+    return _new(DeviceQualifierDescriptor, _DEVICE_QUALIFIER.unpack_from(descriptor))
+
+def ParseBOSDescriptor(descriptor) -> BOSDescriptor:
+    return _new(BOSDescriptor, _BOS.unpack_from(descriptor))
+
+def ParseDeviceCapabilityDescriptor(descriptor):
+    bLength = descriptor[0]
+    bDevCapabilityType = descriptor[2]
+    if bDevCapabilityType == 2:  # USB 2.0 Extension
+        return _new(USB20ExtensionCapability, _USB20_EXTENSION.unpack_from(descriptor))
+    if bDevCapabilityType == 3:  # SuperSpeed USB
+        return _new(SuperSpeedUSBCapability, _SUPERSPEED_USB.unpack_from(descriptor))
+    if bDevCapabilityType == 5:  # Container ID
+        return ContainerIDCapability(bLength, descriptor[1], bDevCapabilityType,
+                                     bytes(descriptor[4:20]) if bLength >= 20 else None)
+    return DeviceCapabilityDescriptor(bLength, descriptor[1], bDevCapabilityType, bytes(descriptor[3:bLength]))
+
+def ParseSSEndpointCompanionDescriptor(descriptor, transfer_type: int) -> SSEndpointCompanionDescriptor:
+    return SSEndpointCompanionDescriptor(*_SS_ENDPOINT_COMPANION.unpack_from(descriptor), transfer_type)
+
+def ParseSSPIsochEndpointCompanionDescriptor(descriptor) -> SSPIsochEndpointCompanionDescriptor:
+    return _new(SSPIsochEndpointCompanionDescriptor, _SSP_ISOCH_ENDPOINT_COMPANION.unpack_from(descriptor))
+
+def ParseHIDDescriptor(descriptor) -> HIDDescriptor:
+    bLength, bDescriptorType, bcdHID, bCountryCode, bNumDescriptors = _HID.unpack_from(descriptor)
+    class_descriptors = []
+    offset = 6
+    for i in range(bNumDescriptors):
+        if offset + 3 > bLength:
+            break
+        class_descriptors.append(_HID_CLASS_DESCRIPTOR.unpack_from(descriptor, offset))
+        offset += 3
+    return HIDDescriptor(bLength, bDescriptorType, bcdHID, bCountryCode, bNumDescriptors, tuple(class_descriptors))
+
+def ParseReportDescriptor(descriptor) -> ReportDescriptor:
+    sizes = _HID_ITEM_SIZES
+    from_bytes = int.from_bytes
+    items = []
+    append = items.append
+    index = 0
+    length = len(descriptor)
+    while index < length:
+        prefix = descriptor[index]
+        start = index + 1
+        if prefix == 0xFE and start < length:  # Long item: bDataSize, bLongItemTag, data
+            start += 2
+            index = start + descriptor[index + 1]
+        else:
+            index = start + sizes[prefix]
+        if index - start == 1 and index <= length:
+            append(_new(HIDItem, (prefix, descriptor[start])))
+        else:
+            # A truncated last item keeps the bytes that are there
+            append(_new(HIDItem, (prefix, from_bytes(descriptor[start:index], 'little'))))
+    return ReportDescriptor(length, tuple(items))
+
+def ParsePhysicalDescriptor(descriptor) -> PhysicalDescriptor:
+    return PhysicalDescriptor(descriptor[0], descriptor[1], bytes(descriptor[2:descriptor[0]]))
+
+def _unknown_record(descriptor, message: str) -> UnknownDescriptor:
+    return UnknownDescriptor(descriptor[0], descriptor[1], bytes(descriptor[2:descriptor[0]]), message)
+
+# Audio class-specific interface descriptors (bDescriptorType=0x24), registered per interface subclass and subtype below
+def ParseAudioControlHeaderDescriptor(descriptor) -> AudioControlHeaderDescriptor:
+    header = _AC_HEADER.unpack_from(descriptor)
+    bInCollection = header[5]
+    return AudioControlHeaderDescriptor(*header, tuple(descriptor[8:8 + bInCollection]))
+
+def ParseInputTerminalDescriptor(descriptor) -> InputTerminalDescriptor:
+    return _new(InputTerminalDescriptor, _INPUT_TERMINAL.unpack_from(descriptor))
+
+def ParseOutputTerminalDescriptor(descriptor) -> OutputTerminalDescriptor:
+    return _new(OutputTerminalDescriptor, _OUTPUT_TERMINAL.unpack_from(descriptor))
+
+def ParseFeatureUnitDescriptor(descriptor) -> FeatureUnitDescriptor:
+    bLength = descriptor[0]
+    bControlSize = descriptor[5]
+    if bControlSize == 0:
+        return _unknown_record(descriptor, "Invalid Feature Unit: bControlSize is 0")
+    n = (bLength - 7) // bControlSize  # Number of bmaControls entries
+    end = 6 + n * bControlSize
+    bmaControls = tuple(_le(descriptor[offset:offset + bControlSize]) for offset in range(6, end, bControlSize))
+    return FeatureUnitDescriptor(bLength, descriptor[1], descriptor[2], descriptor[3], descriptor[4],
+                                 bControlSize, bmaControls, descriptor[end])
+
+def ParseASGeneralDescriptor(descriptor) -> ASGeneralDescriptor:
+    return _new(ASGeneralDescriptor, _AS_GENERAL.unpack_from(descriptor))
+
+def ParseFormatTypeDescriptor(descriptor):
+    bFormatType = descriptor[3]
+    if bFormatType == 1:  # TYPE_I
+        bSamFreqType = descriptor[7]
+        if bSamFreqType == 0:  # Continuous
+            tSamFreq = (_le(descriptor[7:10]), _le(descriptor[10:13]))
+        else:  # Discrete
+            tSamFreq = tuple(_le(descriptor[6 + i*3:9 + i*3]) for i in range(bSamFreqType))
+        return FormatTypeIDescriptor(*_FORMAT_TYPE_I.unpack_from(descriptor), tSamFreq)
+    return _unknown_record(descriptor, f"Unknown Format Type: {bFormatType}")
+
+def ParseAudioEndpointDescriptor(descriptor) -> AudioEndpointDescriptor:
+    return _new(AudioEndpointDescriptor, _AUDIO_ENDPOINT.unpack_from(descriptor))
+
+# Descriptor tree
+class DescriptorNode:
+    '''
+        One decoded descriptor in the tree.
+
+        - `index`: Position in decode order, unique within the tree.
+        - `record`: The typed record returned by one of the `Parse*` functions.
+        - `parent`: The node this descriptor belongs to (device → configuration → interface → endpoint → companion), or None.
+        - `group`: `"standard"`, `"string"`, `"class"` (class-specific) or `"unknown"`.
+    '''
+    __slots__ = ("index", "record", "parent", "group")
+
+    def __init__(self, index: int, record, parent, group: str):
+        self.index = index
+        self.record = record
+        self.parent = parent
+        self.group = group
+
+class DescriptorTree:
+    '''
+        Result of `ParseDescriptors`.
+
+        - `nodes`: Every `DescriptorNode` in decode order.
+        - `anchor`: The last device, configuration, BOS or capability node, which the string and class-specific
+          chains are laid out next to. None if there is no device descriptor before them.
+    '''
+    __slots__ = ("nodes", "anchor")
+
+    def __init__(self):
+        self.nodes = []
+        self.anchor = None
+
+    def add(self, record, parent=None, group="standard") -> DescriptorNode:
+        node = DescriptorNode(len(self.nodes), record, parent, group)
+        self.nodes.append(node)
+        return node
+
+# Dispatch
+class DecoderRegistry:
+    '''
+        ## `DecoderRegistry`
+
+        ### Description
+        Maps descriptors to the handlers that decode them. A handler is called as `handler(decoder, descriptor)`
+        with the `DescriptorDecoder` and one complete descriptor, and returns the node it added.
+
+        Handlers are registered on `(bDescriptorType, bInterfaceClass, bInterfaceSubClass, bDescriptorSubtype)`,
+        where None matches anything. Class and subclass come from the last interface descriptor and the subtype is
+        the descriptor's third byte. The most specific registration wins, trying the full key, then without the
+        subtype, then class and subtype, then class alone, then the type alone.
+
+        Every lookup takes a single step: types registered only on their own are kept in a 256-entry table, and
+        for types with class-specific registrations the resolved handler is memoized per key.
+
+        ### Parameters
+        - `fallback` (callable): Handler for descriptors that match no registration.
+    '''
+    __slots__ = ("fallback", "_handlers", "_by_type", "_resolved")
+
+    def __init__(self, fallback):
+        self.fallback = fallback
+        self._handlers = {}
+        self._by_type = [fallback] * 256  # None for types that need the interface context
+        self._resolved = {}
+
+    def register(self, handler, bDescriptorType: int, bInterfaceClass: int = None, bInterfaceSubClass: int = None,
+                 bDescriptorSubtype: int = None):
+        '''Registers `handler`, replacing an earlier registration for the same key.'''
+        self._handlers[(bDescriptorType, bInterfaceClass, bInterfaceSubClass, bDescriptorSubtype)] = handler
+        self._resolved.clear()
+        if any(key[0] == bDescriptorType and key[1:] != (None, None, None) for key in self._handlers):
+            self._by_type[bDescriptorType] = None
+        else:
+            self._by_type[bDescriptorType] = handler
+
+    def resolve(self, bDescriptorType: int, bInterfaceClass: int, bInterfaceSubClass: int, bDescriptorSubtype: int):
+        key = (bDescriptorType, bInterfaceClass, bInterfaceSubClass, bDescriptorSubtype)
+        handler = self._resolved.get(key)
+        if handler is None:
+            handlers = self._handlers
+            handler = (handlers.get(key)
+                       or handlers.get((bDescriptorType, bInterfaceClass, bInterfaceSubClass, None))
+                       or handlers.get((bDescriptorType, bInterfaceClass, None, bDescriptorSubtype))
+                       or handlers.get((bDescriptorType, bInterfaceClass, None, None))
+                       or handlers.get((bDescriptorType, None, None, None))
+                       or self.fallback)
+            self._resolved[key] = handler
+        return handler
+
+class DescriptorDecoder:
+    '''
+        ## `DescriptorDecoder`
+
+        ### Description
+        Incremental decoder behind `ParseDescriptors`. It keeps the device, configuration, interface and endpoint
+        context between calls, so descriptors can be fed one at a time (`decode`) or as arbitrary chunks of a byte
+        stream (`feed`), e.g. from a pipe, a socket or a capture that is still being written.
+
+        Only the current context nodes are referenced by the decoder. Yielded nodes are not kept unless a `tree`
+        is given, so a stream of any length is decoded in constant memory.
+
+        Handlers (see `DecoderRegistry`) read and update the context through `device`, `config`, `interface`,
+        `interface_class`, `interface_subclass`, `endpoint`, `previous` (the node decoded last) and `anchor`,
+        and add nodes with `add()`.
+
+        ### Parameters
+        - `tree` (DescriptorTree, optional): Tree every decoded node is appended to.
+        - `registry` (DecoderRegistry, optional): Handlers to dispatch on. Defaults to the module's `Decoders`.
+    '''
+    __slots__ = ("tree", "registry", "anchor", "count", "stopped", "device", "config", "interface",
+                 "interface_class", "interface_subclass", "endpoint", "previous", "_buffer", "_nodes", "_by_type", "_resolved")
+
+    def __init__(self, tree: Optional[DescriptorTree] = None, registry: Optional[DecoderRegistry] = None):
+        self.tree = tree
+        self.registry = registry if registry is not None else Decoders
+        self.anchor = None
+        self.count = 0
+        self.stopped = False  # Set by a zero bLength, nothing after it can be framed
+        self.device = None
+        self.config = None
+        self.interface = None
+        self.interface_class = 0
+        self.interface_subclass = 0
+        self.endpoint = None
+        self.previous = None
+        self._buffer = bytearray()
+        self._nodes = tree.nodes if tree is not None else None
+        # The registry updates both in place, so these stay current
+        self._by_type = self.registry._by_type
+        self._resolved = self.registry._resolved
+
+    @property
+    def pending(self) -> int:
+        '''Bytes fed but not decoded yet (the start of an incomplete descriptor).'''
+        return len(self._buffer)
+
+    def add(self, record, parent=None, group="standard") -> DescriptorNode:
+        node = DescriptorNode(self.count, record, parent, group)
+        self.count += 1
+        if self._nodes is not None:
+            self._nodes.append(node)
+        return node
+
+    def dispatch(self, descriptor):
+        '''Handler for a descriptor whose type has class-specific registrations, resolved in the current interface context.'''
+        key = (descriptor[1], self.interface_class, self.interface_subclass, descriptor[2] if descriptor[0] > 2 else None)
+        return self._resolved.get(key) or self.registry.resolve(*key)
+
+    def decode(self, descriptor) -> DescriptorNode:
+        '''Decodes one complete descriptor (bytes-like, exactly `bLength` long) and returns its node.'''
+        handler = self._by_type[descriptor[1]] or self.dispatch(descriptor)
+        node = self.previous = handler(self, descriptor)
+        return node
+
+    def decode_short(self, descriptor) -> DescriptorNode:
+        '''Adds a descriptor with bLength 1 as unknown, `descriptor` being its length byte and the byte after it.'''
+        node = self.previous = _unknown(self, descriptor)
+        return node
+
+    def feed(self, chunk):
+        '''
+            Appends `chunk` (bytes-like, any size) to the stream and yields a node for every descriptor it completes.
+            An incomplete descriptor at the end is kept until the next chunk brings the rest of its `bLength` bytes.
+            The descriptors of a chunk are all decoded when the generator is first advanced, so a caller may stop
+            iterating at any point and feed again.
+        '''
+        if self.stopped:
+            return
+        buffer = self._buffer
+        buffer += chunk
+        index = 0
+        nodes = []
+        with memoryview(buffer) as view:  # Released before the buffer is resized below
+            while index + 1 < len(buffer):
+                bLength = buffer[index]
+                if bLength == 0:
+                    self.stopped = True
+                    break
+                if index + bLength > len(buffer):
+                    break
+                if bLength == 1:  # No room for its own type byte, see ParseDescriptors
+                    nodes.append(self.decode_short(view[index:index + 2]))
+                else:
+                    nodes.append(self.decode(view[index:index + bLength]))
+                index += bLength
+        # Trimmed before yielding, so a caller that stops iterating early neither pins the buffer nor sees these again
+        if self.stopped:
+            buffer.clear()
+        else:
+            del buffer[:index]
+        yield from nodes
+
+# Built-in handlers
+def _unknown(decoder, descriptor):
+    return decoder.add(UnknownDescriptor(descriptor[0], descriptor[1], bytes(descriptor[2:]),
+                                         f"Unknown Descriptor Type: {hex(descriptor[1])}"), group="unknown")
+
+def _device(decoder, descriptor):
+    node = decoder.device = decoder.anchor = decoder.add(ParseDeviceDescriptor(descriptor))
+    return node
+
+def _configuration(decoder, descriptor):  # Configuration or Other Speed Configuration
+    node = decoder.config = decoder.anchor = decoder.add(ParseConfigurationDescriptor(descriptor), decoder.device)
+    return node
+
+def _bos(decoder, descriptor):  # BOS or Device Capability
+    record = ParseBOSDescriptor(descriptor) if descriptor[1] == 15 else ParseDeviceCapabilityDescriptor(descriptor)
+    node = decoder.anchor = decoder.add(record, decoder.anchor if decoder.device else None)
+    return node
+
+def _interface(decoder, descriptor):
+    decoder.interface_class = descriptor[5]
+    decoder.interface_subclass = descriptor[6]
+    node = decoder.interface = decoder.add(ParseInterfaceDescriptor(descriptor), decoder.config)
+    return node
+
+def _endpoint(decoder, descriptor):
+    node = decoder.endpoint = decoder.add(ParseEndpointDescriptor(descriptor), decoder.interface)
+    return node
+
+def _companion(decoder, descriptor):  # Only right after an endpoint or another of its companions
+    endpoint, previous = decoder.endpoint, decoder.previous
+    if endpoint is None or (previous is not endpoint and previous.parent is not endpoint):
+        return _unknown(decoder, descriptor)
+    if descriptor[1] == 48:
+        record = ParseSSEndpointCompanionDescriptor(descriptor, endpoint.record.transfer_type)
+    else:
+        record = ParseSSPIsochEndpointCompanionDescriptor(descriptor)
+    return decoder.add(record, endpoint)
+
+def _string(decoder, descriptor):
+    return decoder.add(ParseStringDescriptor(descriptor), group="string")
+
+def _device_level(decoder, descriptor):  # Device Qualifier or Interface Association
+    if descriptor[1] == 6:
+        record = ParseDeviceQualifierDescriptor(descriptor)
+    else:
+        record = ParseInterfaceAssociationDescriptor(descriptor)
+    return decoder.add(record, decoder.device)
+
+def _unknown_class_specific(decoder, descriptor):
+    subtype = hex(descriptor[2]) if descriptor[0] > 2 else "none"
+    return decoder.add(_unknown_record(descriptor, f"Unknown Class-Specific Descriptor: {hex(descriptor[1])} (interface class "
+                                                   f"{hex(decoder.interface_class)}, subclass {hex(decoder.interface_subclass)}, subtype {subtype})"),
+                       group="class")
+
+def _unknown_audio_subclass(decoder, descriptor):
+    return decoder.add(_unknown_record(descriptor, f"Unknown Interface Subclass: {hex(decoder.interface_subclass)}"), group="class")
+
+Decoders = DecoderRegistry(_unknown)
+
+def RegisterDecoder(bDescriptorType: int, bInterfaceClass: int = None, bInterfaceSubClass: int = None,
+                    bDescriptorSubtype: int = None, group: str = "class", registry: DecoderRegistry = Decoders):
+    '''
+        ## `RegisterDecoder`
+
+        ### Description
+        Decorator registering a record parser, `parse(descriptor) -> record`, for a class-specific descriptor.
+        The record is added next to the other class-specific descriptors. Use `DecoderRegistry.register` directly
+        for handlers that need the decoder context or place their node in the tree themselves.
+
+        ### Example
+        ```python
+        @RegisterDecoder(0x24, bInterfaceClass=0x02, bDescriptorSubtype=0x00)  # CDC Header Functional Descriptor
+        def ParseCDCHeader(descriptor):
+            return CDCHeaderDescriptor(descriptor[0], descriptor[1], descriptor[2], descriptor[3] | descriptor[4] << 8)
+        ```
+        Records rendered without an entry in `processing.NodeRenderers` are shown as a generic table of their fields.
+    '''
+    def decorator(parse):
+        registry.register(lambda decoder, descriptor: decoder.add(parse(descriptor), group=group),
+                          bDescriptorType, bInterfaceClass, bInterfaceSubClass, bDescriptorSubtype)
+        return parse
+    return decorator
+
+def _unknown_subtype(name: str):
+    return lambda descriptor: _unknown_record(descriptor, f"Unknown {name} Subtype: {hex(descriptor[2])}")
+
+for _type, _handler in ((1, _device), (2, _configuration), (7, _configuration), (15, _bos), (16, _bos), (4, _interface),
+                        (5, _endpoint), (48, _companion), (49, _companion), (3, _string), (6, _device_level), (11, _device_level),
+                        (0x24, _unknown_class_specific), (0x25, _unknown_class_specific)):
+    Decoders.register(_handler, _type)
+Decoders.register(_unknown_audio_subclass, 0x24, 0x01)
+
+# HID descriptors are decoded whatever the interface class
+RegisterDecoder(0x21)(ParseHIDDescriptor)
+RegisterDecoder(0x22)(ParseReportDescriptor)
+RegisterDecoder(0x23)(ParsePhysicalDescriptor)
+# Audio
+RegisterDecoder(0x24, 0x01, 0x01)(_unknown_subtype("AudioControl"))
+RegisterDecoder(0x24, 0x01, 0x01, 0x01)(ParseAudioControlHeaderDescriptor)
+RegisterDecoder(0x24, 0x01, 0x01, 0x02)(ParseInputTerminalDescriptor)
+RegisterDecoder(0x24, 0x01, 0x01, 0x03)(ParseOutputTerminalDescriptor)
+RegisterDecoder(0x24, 0x01, 0x01, 0x06)(ParseFeatureUnitDescriptor)
+RegisterDecoder(0x24, 0x01, 0x02)(_unknown_subtype("AudioStreaming"))
+RegisterDecoder(0x24, 0x01, 0x02, 0x01)(ParseASGeneralDescriptor)
+RegisterDecoder(0x24, 0x01, 0x02, 0x02)(ParseFormatTypeDescriptor)
+RegisterDecoder(0x25, 0x01)(ParseAudioEndpointDescriptor)
+
+def StreamDescriptors(chunks, decoder: Optional[DescriptorDecoder] = None):
+    '''
+        ## `StreamDescriptors`
+
+        ### Description
+        Decodes a descriptor stream that arrives in chunks and yields each `DescriptorNode` as soon as its bytes
+        are complete. Nodes are linked to their parents as in `ParseDescriptors`, but are not collected.
+
+        ### Parameters
+        - `chunks` (iterable of bytes-like): e.g. `iter(partial(f.read, 65536), b"")` for a file or pipe.
+        - `decoder` (DescriptorDecoder, optional): Decoder to continue with. A new one is used by default.
+    '''
+    decoder = decoder if decoder is not None else DescriptorDecoder()
+    for chunk in chunks:
+        yield from decoder.feed(chunk)
+
+def ParseDescriptors(descriptors) -> DescriptorTree:
+    '''
+        ## `ParseDescriptors`
+
+        ### Description
+        Walks a GET_DESCRIPTOR byte sequence and decodes every descriptor into a typed record, keeping track of which
+        device, configuration, interface and endpoint each one belongs to.
+
+        ### Parameters
+        - `descriptors` (bytes-like or list): `bytes`, `bytearray` or `memoryview` are decoded in place without copying,
+          a list of integers (0-255) is converted to `bytes` once.
+
+        ### Returns
+        - `DescriptorTree`: Decoded records in input order. Decoding stops at the first truncated descriptor.
+    '''
+    if isinstance(descriptors, (bytes, bytearray, memoryview)):
+        descriptors = memoryview(descriptors).cast('B')
+    else:
+        descriptors = memoryview(bytes(descriptors))
+    tree = DescriptorTree()
+    decoder = DescriptorDecoder(tree)
+    by_type, dispatch = decoder._by_type, decoder.dispatch  # DescriptorDecoder.decode, inlined for the hot loop
+    index = 0
+    while index + 1 < len(descriptors):
+        bLength = descriptors[index]
+        if bLength == 0 or index + bLength > len(descriptors):
+            break
+        if bLength == 1:  # Too short to hold its type: shown as unknown with the next byte as the type, framing goes on
+            decoder.previous = _unknown(decoder, descriptors[index:index + 2])
+            index += 1
+            continue
+        descriptor = descriptors[index:index + bLength]
+        handler = by_type[descriptors[index + 1]] or dispatch(descriptor)
+        decoder.previous = handler(decoder, descriptor)
+        index += bLength
+    tree.anchor = decoder.anchor
+    return tree
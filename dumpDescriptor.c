@@ -12,6 +12,8 @@
 #define MAX_DESCRIPTOR_SIZE 4096
 #define MAX_INTERFACES 8
 #define DUMP_FILE "usb_descriptors_dump.txt"
+#define MULTI_DUMP_FILE "usb_descriptors_all.txt"
+#define MAX_PORT_DEPTH 7
 
 // Descriptor types
 #define USB_DT_DEVICE 0x01
@@ -50,109 +52,24 @@ int get_descriptor(libusb_device_handle *handle, uint8_t desc_type,
         length, 1000);
 }
 
-int main() {
-    libusb_device **devs;
-    libusb_context *ctx = NULL;
-    int r;
-    ssize_t cnt;
-
-    libusb_device_handle *handle = NULL;
+// Writes the descriptor chain of one opened device to `out`. Interfaces are only
+// claimed (detaching kernel drivers) when `claim` is set; GET_DESCRIPTOR goes to
+// the default control endpoint and works without it.
+void dump_device(libusb_device *dev, libusb_device_handle *handle, FILE *out,
+                 int claim) {
     struct libusb_device_descriptor desc;
     unsigned char buffer[MAX_DESCRIPTOR_SIZE];
-    unsigned char string_data[256];
-
-    r = libusb_init(&ctx);
-    if (r < 0) {
-        fprintf(stderr, "libusb init error\n");
-        return 1;
-    }
-
-    cnt = libusb_get_device_list(ctx, &devs);
-    if (cnt < 0) {
-        fprintf(stderr, "Error getting USB device list\n");
-        libusb_exit(ctx);
-        return 1;
-    }
-
-    printf("Connected USB devices:\n");
-    int index = 0;
-    int device_indices[MAX_DEVICES];
-
-    for (int i = 0; devs[i]; ++i) {
-        r = libusb_get_device_descriptor(devs[i], &desc);
-        if (r < 0) {
-            fprintf(stderr, "Failed to get device descriptor\n");
-            continue;
-        }
-
-        // Get product name if possible
-        libusb_device_handle *temp_handle;
-        r = libusb_open(devs[i], &temp_handle);
-
-        printf("[%d] VID: %04x PID: %04x", index, desc.idVendor, desc.idProduct);
-
-        if (r == 0 && temp_handle) {
-            if (desc.iProduct > 0) {
-                memset(string_data, 0, sizeof(string_data));
-                if (libusb_get_string_descriptor_ascii(
-                        temp_handle, desc.iProduct, string_data,
-                        sizeof(string_data)) > 0) {
-                    printf(" - %s", string_data);
-                }
-            }
-            libusb_close(temp_handle);
-        }
-        printf("\n");
-
-        device_indices[index++] = i;
-    }
-
-    if (index == 0) {
-        printf("No USB devices found.\n");
-        libusb_free_device_list(devs, 1);
-        libusb_exit(ctx);
-        return 1;
-    }
-
-    int choice;
-    printf("\nSelect a device by number: ");
-    scanf("%d", &choice);
-
-    if (choice < 0 || choice >= index) {
-        printf("Invalid choice.\n");
-        libusb_free_device_list(devs, 1);
-        libusb_exit(ctx);
-        return 1;
-    }
-
-    libusb_device *selected_dev = devs[device_indices[choice]];
-
-    r = libusb_open(selected_dev, &handle);
-    if (r != 0 || !handle) {
-        fprintf(stderr, "Failed to open device: %s\n", libusb_error_name(r));
-        libusb_free_device_list(devs, 1);
-        libusb_exit(ctx);
-        return 1;
-    }
-
-    FILE *out = fopen(DUMP_FILE, "w");
-    if (!out) {
-        perror("fopen");
-        libusb_close(handle);
-        libusb_free_device_list(devs, 1);
-        libusb_exit(ctx);
-        return 1;
-    }
+    int r;
 
     // Array to track which interfaces had kernel drivers attached
     int kernel_driver_active[MAX_INTERFACES] = {0};
     int num_interfaces = 0;
 
     // Get number of interfaces from configuration
-    r = libusb_get_device_descriptor(selected_dev, &desc);
+    r = libusb_get_device_descriptor(dev, &desc);
     if (r == 0 && desc.bNumConfigurations > 0) {
         struct libusb_config_descriptor *config;
-        r = libusb_get_config_descriptor(selected_dev, 0, &config);
+        r = libusb_get_config_descriptor(dev, 0, &config);
         if (r == 0) {
             num_interfaces = config->bNumInterfaces;
             libusb_free_config_descriptor(config);
@@ -165,7 +82,7 @@ int main() {
         num_interfaces = 1;  // Assume at least one interface
 
     // Claim interfaces and remember which had kernel drivers
-    for (int i = 0; i < num_interfaces; i++) {
+    for (int i = 0; claim && i < num_interfaces; i++) {
         kernel_driver_active[i] = libusb_kernel_driver_active(handle, i);
         if (kernel_driver_active[i]) {
             libusb_detach_kernel_driver(handle, i);
@@ -206,11 +123,11 @@ int main() {
     }
 
     // Get all configuration descriptors
-    r = libusb_get_device_descriptor(selected_dev, &desc);
+    r = libusb_get_device_descriptor(dev, &desc);
     if (r == 0) {
         for (int cfg_idx = 0; cfg_idx < desc.bNumConfigurations; ++cfg_idx) {
             struct libusb_config_descriptor *config;
-            r = libusb_get_config_descriptor(selected_dev, cfg_idx, &config);
+            r = libusb_get_config_descriptor(dev, cfg_idx, &config);
             if (r != 0) {
                 fprintf(stderr, "Failed to get config descriptor %d\n", cfg_idx);
                 continue;
@@ -240,13 +157,170 @@ int main() {
     }
 
     // Release all claimed interfaces
-    for (int i = 0; i < num_interfaces; i++) {
+    for (int i = 0; claim && i < num_interfaces; i++) {
         libusb_release_interface(handle, i);
         // Reattach kernel driver if it was active before
         if (kernel_driver_active[i]) {
             libusb_attach_kernel_driver(handle, i);
         }
     }
+}
+
+// Writes every device that can be opened to MULTI_DUMP_FILE, each section
+// starting with a header line:
+//   @device bus=1 port=1.4 address=5 vid=046d pid=c077
+// followed by its descriptor bytes in the same format as DUMP_FILE.
+int dump_all_devices(libusb_device **devs) {
+    FILE *out = fopen(MULTI_DUMP_FILE, "w");
+    if (!out) {
+        perror("fopen");
+        return 1;
+    }
+    fprintf(out, "# USB descriptor dump, one @device section per device\n");
+
+    int dumped = 0;
+    for (int i = 0; devs[i]; ++i) {
+        struct libusb_device_descriptor desc;
+        if (libusb_get_device_descriptor(devs[i], &desc) < 0) {
+            fprintf(stderr, "Failed to get device descriptor\n");
+            continue;
+        }
+
+        libusb_device_handle *handle;
+        int r = libusb_open(devs[i], &handle);
+        if (r != 0 || !handle) {
+            fprintf(stderr, "Skipping %04x:%04x: %s\n", desc.idVendor,
+                    desc.idProduct, libusb_error_name(r));
+            continue;
+        }
+
+        // Port path such as 1.4.2, or "-" for root hubs
+        uint8_t ports[MAX_PORT_DEPTH];
+        char port_path[4 * MAX_PORT_DEPTH + 1] = "-";
+        int depth = libusb_get_port_numbers(devs[i], ports, MAX_PORT_DEPTH);
+        for (int p = 0, len = 0; p < depth; ++p) {
+            len += snprintf(port_path + len, sizeof(port_path) - len,
+                            p ? ".%d" : "%d", ports[p]);
+        }
+
+        fprintf(out, "@device bus=%d port=%s address=%d vid=%04x pid=%04x\n",
+                libusb_get_bus_number(devs[i]), port_path,
+                libusb_get_device_address(devs[i]), desc.idVendor,
+                desc.idProduct);
+        dump_device(devs[i], handle, out, 0);
+        fprintf(out, "\n");
+        libusb_close(handle);
+        dumped++;
+    }
+
+    fclose(out);
+    printf("\n✅ Dumped %d devices. File saved to: %s\n", dumped,
+           MULTI_DUMP_FILE);
+    return 0;
+}
+
+int main(int argc, char **argv) {
+    libusb_device **devs;
+    libusb_context *ctx = NULL;
+    int r;
+    ssize_t cnt;
+
+    libusb_device_handle *handle = NULL;
+    struct libusb_device_descriptor desc;
+    unsigned char string_data[256];
+
+    r = libusb_init(&ctx);
+    if (r < 0) {
+        fprintf(stderr, "libusb init error\n");
+        return 1;
+    }
+
+    cnt = libusb_get_device_list(ctx, &devs);
+    if (cnt < 0) {
+        fprintf(stderr, "Error getting USB device list\n");
+        libusb_exit(ctx);
+        return 1;
+    }
+
+    // --all: dump every device into one file without prompting
+    if (argc > 1 && strcmp(argv[1], "--all") == 0) {
+        r = dump_all_devices(devs);
+        libusb_free_device_list(devs, 1);
+        libusb_exit(ctx);
+        return r;
+    }
+
+    printf("Connected USB devices:\n");
+    int index = 0;
+    int device_indices[MAX_DEVICES];
+
+    for (int i = 0; devs[i]; ++i) {
+        r = libusb_get_device_descriptor(devs[i], &desc);
+        if (r < 0) {
+            fprintf(stderr, "Failed to get device descriptor\n");
+            continue;
+        }
+
+        // Get product name if possible
+        libusb_device_handle *temp_handle;
+        r = libusb_open(devs[i], &temp_handle);
+
+        printf("[%d] VID: %04x PID: %04x", index, desc.idVendor, desc.idProduct);
+
+        if (r == 0 && temp_handle) {
+            if (desc.iProduct > 0) {
+                memset(string_data, 0, sizeof(string_data));
+                if (libusb_get_string_descriptor_ascii(
+                        temp_handle, desc.iProduct, string_data,
+                        sizeof(string_data)) > 0) {
+                    printf(" - %s", string_data);
+                }
+            }
+            libusb_close(temp_handle);
+        }
+        printf("\n");
+
+        device_indices[index++] = i;
+    }
+
+    if (index == 0) {
+        printf("No USB devices found.\n");
+        libusb_free_device_list(devs, 1);
+        libusb_exit(ctx);
+        return 1;
+    }
+
+    int choice;
+    printf("\nSelect a device by number: ");
+    scanf("%d", &choice);
+
+    if (choice < 0 || choice >= index) {
+        printf("Invalid choice.\n");
+        libusb_free_device_list(devs, 1);
+        libusb_exit(ctx);
+        return 1;
+    }
+
+    libusb_device *selected_dev = devs[device_indices[choice]];
+
+    r = libusb_open(selected_dev, &handle);
+    if (r != 0 || !handle) {
+        fprintf(stderr, "Failed to open device: %s\n", libusb_error_name(r));
+        libusb_free_device_list(devs, 1);
+        libusb_exit(ctx);
+        return 1;
+    }
+
+    FILE *out = fopen(DUMP_FILE, "w");
+    if (!out) {
+        perror("fopen");
+        libusb_close(handle);
+        libusb_free_device_list(devs, 1);
+        libusb_exit(ctx);
+        return 1;
+    }
+
+    dump_device(selected_dev, handle, out, 1);
 
     fclose(out);
     printf("\n✅ Descriptor dump complete. File saved to: %s\n", DUMP_FILE);
@@ -0,0 +1,131 @@
+# Copyright (c) 2025 Darshan P. All rights reserved.
+
+# This work is licensed under the terms of the MIT license.
+# For a copy, see <https://opensource.org/licenses/MIT>.
+
+'''
+Machine-readable output: turns a `DescriptorTree` into JSON with the same fields (and decoded names)
+shown in the rendered tables. No graph is built and GraphViz is never called.
+'''
+
+import json
+import descriptors
+from reports import ParseReportLayout, ReportKinds
+from extras.classes import More
+from helpers import bcd_to_string, decode_country_code, get_langid_name, get_vendor_name, get_product_name, get_bos_device_capability
+from helpers import get_class_names, describe_endpoint_attributes, describe_ss_companion_attributes, describe_hid_items
+
+def _device(record):
+    return {"bcdUSB": bcd_to_string(record.bcdUSB), "bcdDevice": bcd_to_string(record.bcdDevice),
+            "vendorName": get_vendor_name(record.idVendor), "productName": get_product_name(record.idVendor, record.idProduct)}
+
+def _string(record):
+    if record.string is not None:
+        return {}
+    return {"language": get_langid_name(record.wLANGID)}
+
+def _interface(record):
+    class_name, subclass_name, protocol_name = get_class_names(record.bInterfaceClass, record.bInterfaceSubClass, record.bInterfaceProtocol)
+    return {"className": class_name, "subclassName": subclass_name, "protocolName": protocol_name}
+
+def _endpoint(record):
+    return {"direction": record.direction, "endpointNumber": record.endpoint_number,
+            "attributes": describe_endpoint_attributes(record.bmAttributes)}
+
+def _capability(record):
+    extra = {"capabilityName": get_bos_device_capability(record.bDevCapabilityType)}
+    if isinstance(record, descriptors.USB20ExtensionCapability):
+        extra["lpmCapable"] = record.lpm_capable
+    elif isinstance(record, descriptors.SuperSpeedUSBCapability):
+        extra["speeds"] = list(record.speeds)
+    return extra
+
+def _hid(record):
+    return {"bcdHID": bcd_to_string(record.bcdHID), "country": decode_country_code(record.bCountryCode),
+            "descriptors": [{"bDescriptorType": desc_type, "name": More["hid"].get(desc_type, "Unknown"), "wDescriptorLength": desc_length}
+                            for desc_type, desc_length in record.descriptors]}
+
+def _report_field(field):
+    return {"bitOffset": field.bit_offset, "bitSize": field.bit_size, "count": field.count, "flags": field.flags,
+            "logicalMinimum": field.logical_minimum, "logicalMaximum": field.logical_maximum,
+            "usagePage": field.usage_page, "usages": list(field.usages)}
+
+def _report(record):
+    reports = [{"kind": ReportKinds[report.kind], "reportId": report.report_id, "byteLength": report.byte_length,
+                "fields": [_report_field(field) for field in report.fields]}
+               for report in ParseReportLayout(record.items).reports]
+    return {"items": [{"prefix": prefix, "data": data, "text": text} for (prefix, data), text in zip(record.items, describe_hid_items(record.items))],
+            "reports": reports}
+
+def _terminal(record):
+    return {"terminalTypeName": More["Audio"].get(record.wTerminalType, "Unknown")}
+
+def _audio_endpoint(record):
+    return {"lockDelayUnits": {0: "Undefined", 1: "Milliseconds", 2: "Decoded PCM samples"}.get(record.bLockDelayUnits, "Unknown")}
+
+# Record type -> decoded fields added next to the raw ones
+Annotations = {
+    descriptors.DeviceDescriptor: _device,
+    descriptors.DeviceQualifierDescriptor: lambda record: {"bcdUSB": bcd_to_string(record.bcdUSB)},
+    descriptors.StringDescriptor: _string,
+    descriptors.InterfaceDescriptor: _interface,
+    descriptors.EndpointDescriptor: _endpoint,
+    descriptors.DeviceCapabilityDescriptor: _capability,
+    descriptors.USB20ExtensionCapability: _capability,
+    descriptors.SuperSpeedUSBCapability: _capability,
+    descriptors.ContainerIDCapability: _capability,
+    descriptors.SSEndpointCompanionDescriptor: lambda record: {"attributes": describe_ss_companion_attributes(record.bmAttributes, record.transfer_type)},
+    descriptors.HIDDescriptor: _hid,
+    descriptors.ReportDescriptor: _report,
+    descriptors.AudioControlHeaderDescriptor: lambda record: {"bcdADC": bcd_to_string(record.bcdADC)},
+    descriptors.InputTerminalDescriptor: _terminal,
+    descriptors.OutputTerminalDescriptor: _terminal,
+    descriptors.AudioEndpointDescriptor: _audio_endpoint,
+}
+
+def _value(value):
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return bytes(value).hex()
+    if isinstance(value, tuple):
+        return [_value(v) for v in value]
+    return value
+
+def RecordToDict(record) -> dict:
+    '''Raw fields of a descriptor record plus its decoded names. Byte strings become hex, BCD values become "x.yz" strings.'''
+    out = {"descriptor": type(record).__name__}
+    for field, value in zip(record._fields, record):
+        out[field] = _value(value)
+    annotate = Annotations.get(type(record))
+    if annotate is not None:
+        out.update(annotate(record))
+    return out
+
+def NodeToDict(node: descriptors.DescriptorNode) -> dict:
+    '''A single node for streamed output: its record plus decode index, parent index and group.'''
+    out = {"index": node.index, "parent": node.parent.index if node.parent is not None else None, "group": node.group}
+    out.update(RecordToDict(node.record))
+    return out
+
+def DescriptorTreeToDict(tree: descriptors.DescriptorTree) -> dict:
+    '''
+        Nests every record under its parent (device → configuration → interface → endpoint → companion).
+        Descriptors without a parent, such as strings and class-specific descriptors, are listed at the top level
+        in decode order.
+    '''
+    converted = {}
+    roots = []
+    for node in tree.nodes:
+        entry = RecordToDict(node.record)
+        converted[node.index] = entry
+        if node.parent is None:
+            roots.append(entry)
+        else:
+            converted[node.parent.index].setdefault("children", []).append(entry)
+    return {"descriptors": roots}
+
+def DumpJSON(tree: descriptors.DescriptorTree, ndjson: bool = False, **extra) -> str:
+    '''JSON text for `tree`: indented for `json`, a single line for `ndjson`. Keyword arguments are added as top-level fields.'''
+    document = dict(extra, **DescriptorTreeToDict(tree))
+    if ndjson:
+        return json.dumps(document, ensure_ascii=False, separators=(",", ":"))
+    return json.dumps(document, ensure_ascii=False, indent=2)
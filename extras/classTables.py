@@ -0,0 +1,1042 @@
+# Copyright (c) 2025 Darshan P. All rights reserved.
+
+# This work is licensed under the terms of the MIT license.  
+# For a copy, see <https://opensource.org/licenses/MIT>.
+
+'''
+Hand-maintained lookup tables that have no `usb*` source file: BOS capability types, HID country codes and
+USB language IDs. `compileUSBIDs.py` compiles them, together with the tables parsed from the usb.ids files,
+into `classes.marshal`; the visualizer reads them through `classes.py`. Regenerate after editing this file.
+'''
+
+DeviceCapabilityTypeCode = {
+  0x01 : "Wireless_USB",
+  0x02  : "USB 2.0 EXTENSION",
+  0x03 : "SUPERSPEED_USB",
+  0x04 : "CONTAINER_ID",
+  0x05 : "PLATFORM",
+  0x06  : "POWER_DELIVERY_CAPABILITY ",
+  0x07 : "BATTERY_INFO_CAPABILITY",
+  0x08  : "PD_CONSUMER_PORT_CAPABILITY ",
+  0x09  : "PD_PROVIDER_PORT_CAPABILITY ",
+  0x0A : "SUPERSPEED_PLUS",
+  0x0B  : "PRECISION_TIME_MEASUREMENT ",
+  0x0C : "Wireless_USB_Ext",
+  0x0D  : "BILLBOARD ",
+  0x0E  : "AUTHENTICATION ",
+  0x0F  : "BILLBOARD_EX ",
+  0x10 : "CONFIGURATION_SUMMARY",
+  0x11 : "FWStatus Capability",
+}
+
+CountryCodes = {
+    0x00: "Not Supported",
+    0x01: "Arabic",
+    0x02: "Belgian",
+    0x03: "Canadian‑Bilingual",
+    0x04: "Canadian‑French",
+    0x05: "Czechia",
+    0x06: "Danish",
+    0x07: "Finnish",
+    0x08: "French",
+    0x09: "German",
+    0x0A: "Greek",
+    0x0B: "Hebrew",
+    0x0C: "Hungary",
+    0x0D: "International (ISO)",
+    0x0E: "Italian",
+    0x0F: "Japan (Katakana)",
+    0x10: "Korean",
+    0x11: "Latin American",
+    0x12: "Netherlands",
+    0x13: "Norwegian",
+    0x14: "Persian",
+    0x15: "Poland",
+    0x16: "Portuguese",
+    0x17: "Russia",
+    0x18: "Slovakia",
+    0x19: "Spanish",
+    0x1A: "Swedish",
+    0x1B: "Swiss/French",
+    0x1C: "Swiss/German",
+    0x1D: "Switzerland",
+    0x1E: "Taiwan",
+    0x1F: "Turkish‑Q",
+    0x20: "UK",
+    0x21: "US",
+    0x22: "Yugoslavia",
+    0x23: "Turkish‑F",
+}
+
+# Language IDs obtained from <https://learn.microsoft.com/en-us/openspecs/windows_protocols/ms-lcid/70feba9f-294e-491e-b6eb-56532684c37f>
+LANGIDs = {
+    0x0001 : "ar",
+    0x0002 : "bg",
+    0x0003 : "ca",
+    0x0004 : "zh-Hans",
+    0x0005 : "cs",
+    0x0006 : "da",
+    0x0007 : "de",
+    0x0008 : "el",
+    0x0009 : "en",
+    0x000A : "es",
+    0x000B : "fi",
+    0x000C : "fr",
+    0x000D : "he",
+    0x000E : "hu",
+    0x000F : "is",
+    0x0010 : "it",
+    0x0011 : "ja",
+    0x0012 : "ko",
+    0x0013 : "nl",
+    0x0014 : "no",
+    0x0015 : "pl",
+    0x0016 : "pt",
+    0x0017 : "rm",
+    0x0018 : "ro",
+    0x0019 : "ru",
+    0x001A : "hr",
+    0x001B : "sk",
+    0x001C : "sq",
+    0x001D : "sv",
+    0x001E : "th",
+    0x001F : "tr",
+    0x0020 : "ur",
+    0x0021 : "id",
+    0x0022 : "uk",
+    0x0023 : "be",
+    0x0024 : "sl",
+    0x0025 : "et",
+    0x0026 : "lv",
+    0x0027 : "lt",
+    0x0028 : "tg",
+    0x0029 : "fa",
+    0x002A : "vi",
+    0x002B : "hy",
+    0x002C : "az",
+    0x002D : "eu",
+    0x002E : "hsb",
+    0x002F : "mk",
+    0x0030 : "st",
+    0x0031 : "ts",
+    0x0032 : "tn",
+    0x0033 : "ve",
+    0x0034 : "xh",
+    0x0035 : "zu",
+    0x0036 : "af",
+    0x0037 : "ka",
+    0x0038 : "fo",
+    0x0039 : "hi",
+    0x003A : "mt",
+    0x003B : "se",
+    0x003C : "ga",
+    0x003D : "yi",
+    0x003E : "ms",
+    0x003F : "kk",
+    0x0040 : "ky",
+    0x0041 : "sw",
+    0x0042 : "tk",
+    0x0043 : "uz",
+    0x0044 : "tt",
+    0x0045 : "bn",
+    0x0046 : "pa",
+    0x0047 : "gu",
+    0x0048 : "or",
+    0x0049 : "ta",
+    0x004A : "te",
+    0x004B : "kn",
+    0x004C : "ml",
+    0x004D : "as",
+    0x004E : "mr",
+    0x004F : "sa",
+    0x0050 : "mn",
+    0x0051 : "bo",
+    0x0052 : "cy",
+    0x0053 : "km",
+    0x0054 : "lo",
+    0x0055 : "my",
+    0x0056 : "gl",
+    0x0057 : "kok",
+    0x0058 : "mni",
+    0x0059 : "sd",
+    0x005A : "syr",
+    0x005B : "si",
+    0x005C : "chr",
+    0x005D : "iu",
+    0x005E : "am",
+    0x005F : "tzm",
+    0x0060 : "ks",
+    0x0061 : "ne",
+    0x0062 : "fy",
+    0x0063 : "ps",
+    0x0064 : "fil",
+    0x0065 : "dv",
+    0x0066 : "bin",
+    0x0067 : "ff",
+    0x0068 : "ha",
+    0x0069 : "ibb",
+    0x006A : "yo,",
+    0x006B : "quz",
+    0x006C : "nso",
+    0x006D : "ba",
+    0x006E : "lb",
+    0x006F : "kl",
+    0x0070 : "ig",
+    0x0071 : "kr",
+    0x0072 : "om",
+    0x0073 : "ti",
+    0x0074 : "gn",
+    0x0075 : "haw",
+    0x0076 : "la",
+    0x0077 : "so",
+    0x0078 : "ii",
+    0x0079 : "pap",
+    0x007A : "arn",
+    0x007B : "Neither defined nor reserved",
+    0x007C : "moh",
+    0x007D : "Neither defined nor reserved",
+    0x007E : "br",
+    0x007F : "Reserved for invariant locale behavior",
+    0x0080 : "ug",
+    0x0081 : "mi",
+    0x0082 : "oc",
+    0x0083 : "co",
+    0x0084 : "gsw",
+    0x0085 : "sah",
+    0x0086 : "qut",
+    0x0087 : "rw",
+    0x0088 : "wo",
+    0x0089 : "Neither defined nor reserved",
+    0x008A : "Neither defined nor reserved",
+    0x008B : "Neither defined nor reserved",
+    0x008C : "prs",
+    0x008D : "Neither defined nor reserved",
+    0x008E : "Neither defined nor reserved",
+    0x008F : "Neither defined nor reserved",
+    0x0090 : "Neither defined nor reserved",
+    0x0091 : "gd",
+    0x0092 : "ku",
+    0x0093 : "quc",
+    0x0401 : "ar-SA",
+    0x0402 : "bg-BG",
+    0x0403 : "ca-ES",
+    0x0404 : "zh-TW",
+    0x0405 : "cs-CZ",
+    0x0406 : "da-DK",
+    0x0407 : "de-DE",
+    0x0408 : "el-GR",
+    0x0409 : "en-US",
+    0x040A : "es-ES_tradnl",
+    0x040B : "fi-FI",
+    0x040C : "fr-FR",
+    0x040D : "he-IL",
+    0x040E : "hu-HU",
+    0x040F : "is-IS",
+    0x0410 : "it-IT",
+    0x0411 : "ja-JP",
+    0x0412 : "ko-KR",
+    0x0413 : "nl-NL",
+    0x0414 : "nb-NO",
+    0x0415 : "pl-PL",
+    0x0416 : "pt-BR",
+    0x0417 : "rm-CH",
+    0x0418 : "ro-RO",
+    0x0419 : "ru-RU",
+    0x041A : "hr-HR",
+    0x041B : "sk-SK",
+    0x041C : "sq-AL",
+    0x041D : "sv-SE",
+    0x041E : "th-TH",
+    0x041F : "tr-TR",
+    0x0420 : "ur-PK",
+    0x0421 : "id-ID",
+    0x0422 : "uk-UA",
+    0x0423 : "be-BY",
+    0x0424 : "sl-SI",
+    0x0425 : "et-EE",
+    0x0426 : "lv-LV",
+    0x0427 : "lt-LT",
+    0x0428 : "tg-Cyrl-TJ",
+    0x0429 : "fa-IR",
+    0x042A : "vi-VN",
+    0x042B : "hy-AM",
+    0x042C : "az-Latn-AZ",
+    0x042D : "eu-ES",
+    0x042E : "hsb-DE",
+    0x042F : "mk-MK",
+    0x0430 : "st-ZA",
+    0x0431 : "ts-ZA",
+    0x0432 : "tn-ZA",
+    0x0433 : "ve-ZA",
+    0x0434 : "xh-ZA",
+    0x0435 : "zu-ZA",
+    0x0436 : "af-ZA",
+    0x0437 : "ka-GE",
+    0x0438 : "fo-FO",
+    0x0439 : "hi-IN",
+    0x043A : "mt-MT",
+    0x043B : "se-NO",
+    0x043D : "yi-001",
+    0x043E : "ms-MY",
+    0x043F : "kk-KZ",
+    0x0440 : "ky-KG",
+    0x0441 : "sw-KE",
+    0x0442 : "tk-TM",
+    0x0443 : "uz-Latn-UZ",
+    0x0444 : "tt-RU",
+    0x0445 : "bn-IN",
+    0x0446 : "pa-IN",
+    0x0447 : "gu-IN",
+    0x0448 : "or-IN",
+    0x0449 : "ta-IN",
+    0x044A : "te-IN",
+    0x044B : "kn-IN",
+    0x044C : "ml-IN",
+    0x044D : "as-IN",
+    0x044E : "mr-IN",
+    0x044F : "sa-IN",
+    0x0450 : "mn-MN",
+    0x0451 : "bo-CN",
+    0x0452 : "cy-GB",
+    0x0453 : "km-KH",
+    0x0454 : "lo-LA",
+    0x0455 : "my-MM",
+    0x0456 : "gl-ES",
+    0x0457 : "kok-IN",
+    0x0458 : "mni-IN",
+    0x0459 : "sd-Deva-IN",
+    0x045A : "syr-SY",
+    0x045B : "si-LK",
+    0x045C : "chr-Cher-US",
+    0x045D : "iu-Cans-CA",
+    0x045E : "am-ET",
+    0x045F : "tzm-Arab-MA",
+    0x0460 : "ks-Arab",
+    0x0461 : "ne-NP",
+    0x0462 : "fy-NL",
+    0x0463 : "ps-AF",
+    0x0464 : "fil-PH",
+    0x0465 : "dv-MV",
+    0x0466 : "bin-NG",
+    0x0467 : "ff-NG, ff-Latn-NG",
+    0x0468 : "ha-Latn-NG",
+    0x0469 : "ibb-NG",
+    0x046A : "yo-NG",
+    0x046B : "quz-BO",
+    0x046C : "nso-ZA",
+    0x046D : "ba-RU",
+    0x046E : "lb-LU",
+    0x046F : "kl-GL",
+    0x0470 : "ig-NG",
+    0x0471 : "kr-Latn-NG",
+    0x0472 : "om-ET",
+    0x0473 : "ti-ET",
+    0x0474 : "gn-PY",
+    0x0475 : "haw-US",
+    0x0476 : "la-VA",
+    0x0477 : "so-SO",
+    0x0478 : "ii-CN",
+    0x0479 : "pap-029",
+    0x047A : "arn-CL",
+    0x047C : "moh-CA",
+    0x047E : "br-FR",
+    0x0480 : "ug-CN",
+    0x0481 : "mi-NZ",
+    0x0482 : "oc-FR",
+    0x0483 : "co-FR",
+    0x0484 : "gsw-FR",
+    0x0485 : "sah-RU",
+    0x0486 : "qut-GT",
+    0x0487 : "rw-RW",
+    0x0488 : "wo-SN",
+    0x048C : "prs-AF",
+    0x048D : "plt-MG",
+    0x048E : "zh-yue-HK",
+    0x048F : "tdd-Tale-CN",
+    0x0490 : "khb-Talu-CN",
+    0x0491 : "gd-GB",
+    0x0492 : "ku-Arab-IQ",
+    0x0493 : "quc-CO",
+    0x0501 : "qps-ploc",
+    0x05FE : "qps-ploca",
+    0x0801 : "ar-IQ",
+    0x0803 : "ca-ES-valencia",
+    0x0804 : "zh-CN",
+    0x0807 : "de-CH",
+    0x0809 : "en-GB",
+    0x080A : "es-MX",
+    0x080C : "fr-BE",
+    0x0810 : "it-CH",
+    0x0811 : "ja-Ploc-JP",
+    0x0813 : "nl-BE",
+    0x0814 : "nn-NO",
+    0x0816 : "pt-PT",
+    0x0818 : "ro-MD",
+    0x0819 : "ru-MD",
+    0x081A : "sr-Latn-CS",
+    0x081D : "sv-FI",
+    0x0820 : "ur-IN",
+    0x0827 : "Neither defined nor reserved",
+    0x082C : "az-Cyrl-AZ",
+    0x082E : "dsb-DE",
+    0x0832 : "tn-BW",
+    0x083B : "se-SE",
+    0x083C : "ga-IE",
+    0x083E : "ms-BN",
+    0x083F : "kk-Latn-KZ",
+    0x0843 : "uz-Cyrl-UZ",
+    0x0845 : "bn-BD",
+    0x0846 : "pa-Arab-PK",
+    0x0849 : "ta-LK",
+    0x0850 : "mn-Mong-CN",
+    0x0851 : "bo-BT",
+    0x0859 : "sd-Arab-PK",
+    0x085D : "iu-Latn-CA",
+    0x085F : "tzm-Latn-DZ",
+    0x0860 : "ks-Deva-IN",
+    0x0861 : "ne-IN",
+    0x0867 : "ff-Latn-SN",
+    0x086B : "quz-EC",
+    0x0873 : "ti-ER",
+    0x09FF : "qps-plocm",
+    0x0C00 : "Locale without assigned LCID if the current user default locale.",
+    0x0C01 : "ar-EG",
+    0x0C04 : "zh-HK",
+    0x0C07 : "de-AT",
+    0x0C09 : "en-AU",
+    0x0C0A : "es-ES",
+    0x0C0C : "fr-CA",
+    0x0C1A : "sr-Cyrl-CS",
+    0x0C3B : "se-FI",
+    0x0C50 : "mn-Mong-MN",
+    0x0C51 : "dz-BT",
+    0x0C5F : "tmz-MA",
+    0x0C6b : "quz-PE",
+    0x1000 : "Locale without assigned LCID if the current user default locale.",
+    0x1001 : "ar-LY",
+    0x1004 : "zh-SG",
+    0x1007 : "de-LU",
+    0x1009 : "en-CA",
+    0x100A : "es-GT",
+    0x100C : "fr-CH",
+    0x101A : "hr-BA",
+    0x103B : "smj-NO",
+    0x105F : "tzm-Tfng-MA",
+    0x1401 : "ar-DZ",
+    0x1404 : "zh-MO",
+    0x1407 : "de-LI",
+    0x1409 : "en-NZ",
+    0x140A : "es-CR",
+    0x140C : "fr-LU",
+    0x141A : "bs-Latn-BA",
+    0x143B : "smj-SE",
+    0x1801 : "ar-MA",
+    0x1809 : "en-IE",
+    0x180A : "es-PA",
+    0x180C : "fr-MC",
+    0x181A : "sr-Latn-BA",
+    0x183B : "sma-NO",
+    0x1C01 : "ar-TN",
+    0x1C09 : "en-ZA",
+    0x1C0A : "es-DO",
+    0x1C0C : "fr-029",
+    0x1C1A : "sr-Cyrl-BA",
+    0x1C3B : "sma-SE",
+    0x2000 : "Unassigned LCID locale temporarily assigned to LCID 0x3000.",
+    0x2001 : "ar-OM",
+    0x2008 : "Neither defined nor reserved",
+    0x2009 : "en-JM",
+    0x200A : "es-VE",
+    0x200C : "fr-RE",
+    0x201A : "bs-Cyrl-BA",
+    0x203B : "sms-FI",
+    0x2400 : "Unassigned LCID locale temporarily assigned to LCID 0x3000.",
+    0x2401 : "ar-YE",
+    0x2409 : "en-029",
+    0x240A : "es-CO",
+    0x240C : "fr-CD",
+    0x241A : "sr-Latn-RS",
+    0x243B : "smn-FI",
+    0x2800 : "Unassigned LCID locale temporarily assigned to LCID 0x3000.",
+    0x2801 : "ar-SY",
+    0x2809 : "en-BZ",
+    0x280A : "es-PE",
+    0x280C : "fr-SN",
+    0x281A : "sr-Cyrl-RS",
+    0x2C00 : "Unassigned LCID locale temporarily assigned to LCID 0x3000.",
+    0x2C01 : "ar-JO",
+    0x2C09 : "en-TT",
+    0x2C0A : "es-AR",
+    0x2C0C : "fr-CM",
+    0x2C1A : "sr-Latn-ME",
+    0x3000 : "Unassigned LCID locale temporarily assigned to LCID 0x3000.",
+    0x3001 : "ar-LB",
+    0x3009 : "en-ZW",
+    0x300A : "es-EC",
+    0x300C : "fr-CI",
+    0x301A : "sr-Cyrl-ME",
+    0x3400 : "Unassigned LCID locale temporarily assigned to LCID 0x3400.",
+    0x3401 : "ar-KW",
+    0x3409 : "en-PH",
+    0x340A : "es-CL",
+    0x340C : "fr-ML",
+    0x3800 : "Unassigned LCID locale temporarily assigned to LCID 0x3800.",
+    0x3801 : "ar-AE",
+    0x3809 : "en-ID",
+    0x380A : "es-UY",
+    0x380C : "fr-MA",
+    0x3C00 : "Unassigned LCID locale temporarily assigned to LCID 0x3C00.",
+    0x3C01 : "ar-BH",
+    0x3C09 : "en-HK",
+    0x3C0A : "es-PY",
+    0x3C0C : "fr-HT",
+    0x4000 : "Unassigned LCID locale temporarily assigned to LCID 0x4000.",
+    0x4001 : "ar-QA",
+    0x4009 : "en-IN",
+    0x400A : "es-BO",
+    0x4400 : "Unassigned LCID locale temporarily assigned to LCID 0x4400.",
+    0x4401 : "ar-Ploc-SA",
+    0x4409 : "en-MY",
+    0x440A : "es-SV",
+    0x4800 : "Unassigned LCID locale temporarily assigned to LCID 0x4800.",
+    0x4801 : "ar-145",
+    0x4809 : "en-SG",
+    0x480A : "es-HN",
+    0x4C00 : "Unassigned LCID locale temporarily assigned to LCID 0x4C00.",
+    0x4C09 : "en-AE",
+    0x4C0A : "es-NI",
+    0x5009 : "en-BH",
+    0x500A : "es-PR",
+    0x5409 : "en-EG",
+    0x540A : "es-US",
+    0x5809 : "en-JO",
+    0x580A : "es-419",
+    0x5C09 : "en-KW",
+    0x5C0A : "es-CU",
+    0x6009 : "en-TR",
+    0x6409 : "en-YE",
+    0x641A : "bs-Cyrl",
+    0x681A : "bs-Latn",
+    0x6C1A : "sr-Cyrl",
+    0x701A : "sr-Latn",
+    0x703B : "smn",
+    0x742C : "az-Cyrl",
+    0x743B : "sms",
+    0x7804 : "zh",
+    0x7814 : "nn",
+    0x781A : "bs",
+    0x782C : "az-Latn",
+    0x783B : "sma",
+    0x783F : "kk-Cyrl",
+    0x7843 : "uz-Cyrl",
+    0x7850 : "mn-Cyrl",
+    0x785D : "iu-Cans",
+    0x785F : "tzm-Tfng",
+    0x7C04 : "zh-Hant",
+    0x7C14 : "nb",
+    0x7C1A : "sr",
+    0x7C28 : "tg-Cyrl",
+    0x7C2E : "dsb",
+    0x7C3B : "smj",
+    0x7C3F : "kk-Latn",
+    0x7C43 : "uz-Latn",
+    0x7C46 : "pa-Arab",
+    0x7C50 : "mn-Mong",
+    0x7C59 : "sd-Arab",
+    0x7C5C : "chr-Cher",
+    0x7C5D : "iu-Latn",
+    0x7C5F : "tzm-Latn",
+    0x7C67 : "ff-Latn",
+    0x7C68 : "ha-Latn",
+    0x7C92 : "ku-Arab",
+    0xF2EE : "reserved",
+    0xE40C : "fr-015",
+    0xEEEE : "reserved",
+}
+
+LANGIDNames = {  # Generated by generateLanguageNames.py from LANGIDs, do not edit
+    0x0001 : "Arabic",
+    0x0002 : "Bulgarian",
+    0x0003 : "Catalan",
+    0x0004 : "Chinese (Simplified)",
+    0x0005 : "Czech",
+    0x0006 : "Danish",
+    0x0007 : "German",
+    0x0008 : "Greek",
+    0x0009 : "English",
+    0x000A : "Spanish",
+    0x000B : "Finnish",
+    0x000C : "French",
+    0x000D : "Hebrew",
+    0x000E : "Hungarian",
+    0x000F : "Icelandic",
+    0x0010 : "Italian",
+    0x0011 : "Japanese",
+    0x0012 : "Korean",
+    0x0013 : "Dutch",
+    0x0014 : "Norwegian",
+    0x0015 : "Polish",
+    0x0016 : "Portuguese",
+    0x0017 : "Romansh",
+    0x0018 : "Romanian",
+    0x0019 : "Russian",
+    0x001A : "Croatian",
+    0x001B : "Slovak",
+    0x001C : "Albanian",
+    0x001D : "Swedish",
+    0x001E : "Thai",
+    0x001F : "Turkish",
+    0x0020 : "Urdu",
+    0x0021 : "Indonesian",
+    0x0022 : "Ukrainian",
+    0x0023 : "Belarusian",
+    0x0024 : "Slovenian",
+    0x0025 : "Estonian",
+    0x0026 : "Latvian",
+    0x0027 : "Lithuanian",
+    0x0028 : "Tajik",
+    0x0029 : "Persian",
+    0x002A : "Vietnamese",
+    0x002B : "Armenian",
+    0x002C : "Azerbaijani",
+    0x002D : "Basque",
+    0x002E : "Upper Sorbian",
+    0x002F : "Macedonian",
+    0x0030 : "Southern Sotho",
+    0x0031 : "Tsonga",
+    0x0032 : "Tswana",
+    0x0033 : "Venda",
+    0x0034 : "Xhosa",
+    0x0035 : "Zulu",
+    0x0036 : "Afrikaans",
+    0x0037 : "Georgian",
+    0x0038 : "Faroese",
+    0x0039 : "Hindi",
+    0x003A : "Maltese",
+    0x003B : "Northern Sami",
+    0x003C : "Irish",
+    0x003D : "Yiddish",
+    0x003E : "Malay",
+    0x003F : "Kazakh",
+    0x0040 : "Kyrgyz",
+    0x0041 : "Swahili",
+    0x0042 : "Turkmen",
+    0x0043 : "Uzbek",
+    0x0044 : "Tatar",
+    0x0045 : "Bangla",
+    0x0046 : "Punjabi",
+    0x0047 : "Gujarati",
+    0x0048 : "Odia",
+    0x0049 : "Tamil",
+    0x004A : "Telugu",
+    0x004B : "Kannada",
+    0x004C : "Malayalam",
+    0x004D : "Assamese",
+    0x004E : "Marathi",
+    0x004F : "Sanskrit",
+    0x0050 : "Mongolian",
+    0x0051 : "Tibetan",
+    0x0052 : "Welsh",
+    0x0053 : "Khmer",
+    0x0054 : "Lao",
+    0x0055 : "Burmese",
+    0x0056 : "Galician",
+    0x0057 : "Konkani",
+    0x0058 : "Manipuri",
+    0x0059 : "Sindhi",
+    0x005A : "Syriac",
+    0x005B : "Sinhala",
+    0x005C : "Cherokee",
+    0x005D : "Inuktitut",
+    0x005E : "Amharic",
+    0x005F : "Central Atlas Tamazight",
+    0x0060 : "Kashmiri",
+    0x0061 : "Nepali",
+    0x0062 : "Western Frisian",
+    0x0063 : "Pashto",
+    0x0064 : "Filipino",
+    0x0065 : "Divehi",
+    0x0066 : "bin",
+    0x0067 : "Fula",
+    0x0068 : "Hausa",
+    0x0069 : "ibb",
+    0x006A : "Yoruba",
+    0x006B : "Quechua (Peru)",
+    0x006C : "Northern Sotho",
+    0x006D : "Bashkir",
+    0x006E : "Luxembourgish",
+    0x006F : "Kalaallisut",
+    0x0070 : "Igbo",
+    0x0071 : "kr",
+    0x0072 : "Oromo",
+    0x0073 : "Tigrinya",
+    0x0074 : "Guarani",
+    0x0075 : "Hawaiian",
+    0x0076 : "Latin",
+    0x0077 : "Somali",
+    0x0078 : "Sichuan Yi",
+    0x0079 : "Papiamento",
+    0x007A : "Mapuche",
+    0x007B : "Neither defined nor reserved",
+    0x007C : "Mohawk",
+    0x007D : "Neither defined nor reserved",
+    0x007E : "Breton",
+    0x007F : "Reserved for invariant locale behavior",
+    0x0080 : "Uyghur",
+    0x0081 : "Māori",
+    0x0082 : "Occitan",
+    0x0083 : "Corsican",
+    0x0084 : "Swiss German",
+    0x0085 : "Yakut",
+    0x0086 : "qut",
+    0x0087 : "Kinyarwanda",
+    0x0088 : "Wolof",
+    0x0089 : "Neither defined nor reserved",
+    0x008A : "Neither defined nor reserved",
+    0x008B : "Neither defined nor reserved",
+    0x008C : "prs",
+    0x008D : "Neither defined nor reserved",
+    0x008E : "Neither defined nor reserved",
+    0x008F : "Neither defined nor reserved",
+    0x0090 : "Neither defined nor reserved",
+    0x0091 : "Scottish Gaelic",
+    0x0092 : "Kurdish",
+    0x0093 : "Kʼicheʼ",
+    0x0401 : "Arabic (Saudi Arabia)",
+    0x0402 : "Bulgarian (Bulgaria)",
+    0x0403 : "Catalan (Spain)",
+    0x0404 : "Chinese (Traditional, Taiwan)",
+    0x0405 : "Czech (Czechia)",
+    0x0406 : "Danish (Denmark)",
+    0x0407 : "German (Germany)",
+    0x0408 : "Greek (Greece)",
+    0x0409 : "English (United States)",
+    0x040A : "Spanish (Spain)",
+    0x040B : "Finnish (Finland)",
+    0x040C : "French (France)",
+    0x040D : "Hebrew (Israel)",
+    0x040E : "Hungarian (Hungary)",
+    0x040F : "Icelandic (Iceland)",
+    0x0410 : "Italian (Italy)",
+    0x0411 : "Japanese (Japan)",
+    0x0412 : "Korean (South Korea)",
+    0x0413 : "Dutch (Netherlands)",
+    0x0414 : "Norwegian Bokmål (Norway)",
+    0x0415 : "Polish (Poland)",
+    0x0416 : "Portuguese (Brazil)",
+    0x0417 : "Romansh (Switzerland)",
+    0x0418 : "Romanian (Romania)",
+    0x0419 : "Russian (Russia)",
+    0x041A : "Croatian (Croatia)",
+    0x041B : "Slovak (Slovakia)",
+    0x041C : "Albanian (Albania)",
+    0x041D : "Swedish (Sweden)",
+    0x041E : "Thai (Thailand)",
+    0x041F : "Turkish (Türkiye)",
+    0x0420 : "Urdu (Pakistan)",
+    0x0421 : "Indonesian (Indonesia)",
+    0x0422 : "Ukrainian (Ukraine)",
+    0x0423 : "Belarusian (Belarus)",
+    0x0424 : "Slovenian (Slovenia)",
+    0x0425 : "Estonian (Estonia)",
+    0x0426 : "Latvian (Latvia)",
+    0x0427 : "Lithuanian (Lithuania)",
+    0x0428 : "Tajik (Tajikistan)",
+    0x0429 : "Persian (Iran)",
+    0x042A : "Vietnamese (Vietnam)",
+    0x042B : "Armenian (Armenia)",
+    0x042C : "Azerbaijani (Latin, Azerbaijan)",
+    0x042D : "Basque (Spain)",
+    0x042E : "Upper Sorbian (Germany)",
+    0x042F : "Macedonian (North Macedonia)",
+    0x0430 : "Southern Sotho (South Africa)",
+    0x0431 : "Tsonga (South Africa)",
+    0x0432 : "Tswana (South Africa)",
+    0x0433 : "Venda (South Africa)",
+    0x0434 : "Xhosa (South Africa)",
+    0x0435 : "Zulu (South Africa)",
+    0x0436 : "Afrikaans (South Africa)",
+    0x0437 : "Georgian (Georgia)",
+    0x0438 : "Faroese (Faroe Islands)",
+    0x0439 : "Hindi (India)",
+    0x043A : "Maltese (Malta)",
+    0x043B : "Northern Sami (Norway)",
+    0x043D : "yi-001",
+    0x043E : "Malay (Malaysia)",
+    0x043F : "Kazakh (Kazakhstan)",
+    0x0440 : "Kyrgyz (Kyrgyzstan)",
+    0x0441 : "Swahili (Kenya)",
+    0x0442 : "Turkmen (Turkmenistan)",
+    0x0443 : "Uzbek (Latin, Uzbekistan)",
+    0x0444 : "Tatar (Russia)",
+    0x0445 : "Bangla (India)",
+    0x0446 : "Punjabi (Gurmukhi, India)",
+    0x0447 : "Gujarati (India)",
+    0x0448 : "Odia (India)",
+    0x0449 : "Tamil (India)",
+    0x044A : "Telugu (India)",
+    0x044B : "Kannada (India)",
+    0x044C : "Malayalam (India)",
+    0x044D : "Assamese (India)",
+    0x044E : "Marathi (India)",
+    0x044F : "Sanskrit (India)",
+    0x0450 : "Mongolian (Mongolia)",
+    0x0451 : "Tibetan (China)",
+    0x0452 : "Welsh (United Kingdom)",
+    0x0453 : "Khmer (Cambodia)",
+    0x0454 : "Lao (Laos)",
+    0x0455 : "Burmese (Myanmar (Burma))",
+    0x0456 : "Galician (Spain)",
+    0x0457 : "Konkani (Devanagari, India)",
+    0x0458 : "Manipuri (Bangla, India)",
+    0x0459 : "Sindhi (Devanagari, India)",
+    0x045A : "Syriac (Syria)",
+    0x045B : "Sinhala (Sri Lanka)",
+    0x045C : "Cherokee (United States)",
+    0x045D : "Inuktitut (Canada)",
+    0x045E : "Amharic (Ethiopia)",
+    0x045F : "Central Atlas Tamazight (Morocco)",
+    0x0460 : "Kashmiri (Arabic)",
+    0x0461 : "Nepali (Nepal)",
+    0x0462 : "Western Frisian (Netherlands)",
+    0x0463 : "Pashto (Afghanistan)",
+    0x0464 : "Filipino (Philippines)",
+    0x0465 : "Divehi (Maldives)",
+    0x0466 : "bin-NG",
+    0x0467 : "Fula (Latin, Nigeria)",
+    0x0468 : "Hausa (Nigeria)",
+    0x0469 : "ibb-NG",
+    0x046A : "Yoruba (Nigeria)",
+    0x046B : "Quechua (Bolivia)",
+    0x046C : "Northern Sotho (South Africa)",
+    0x046D : "Bashkir (Russia)",
+    0x046E : "Luxembourgish (Luxembourg)",
+    0x046F : "Kalaallisut (Greenland)",
+    0x0470 : "Igbo (Nigeria)",
+    0x0471 : "kr-Latn-NG",
+    0x0472 : "Oromo (Ethiopia)",
+    0x0473 : "Tigrinya (Ethiopia)",
+    0x0474 : "Guarani (Paraguay)",
+    0x0475 : "Hawaiian (United States)",
+    0x0476 : "Latin (Vatican City)",
+    0x0477 : "Somali (Somalia)",
+    0x0478 : "Sichuan Yi (China)",
+    0x0479 : "pap-029",
+    0x047A : "Mapuche (Chile)",
+    0x047C : "Mohawk (Canada)",
+    0x047E : "Breton (France)",
+    0x0480 : "Uyghur (China)",
+    0x0481 : "Māori (New Zealand)",
+    0x0482 : "Occitan (France)",
+    0x0483 : "Corsican (France)",
+    0x0484 : "Swiss German (France)",
+    0x0485 : "Yakut (Russia)",
+    0x0486 : "qut-GT",
+    0x0487 : "Kinyarwanda (Rwanda)",
+    0x0488 : "Wolof (Senegal)",
+    0x048C : "prs-AF",
+    0x048D : "Malagasy (Madagascar)",
+    0x048E : "zh-yue-HK",
+    0x048F : "tdd-Tale-CN",
+    0x0490 : "khb-Talu-CN",
+    0x0491 : "Scottish Gaelic (United Kingdom)",
+    0x0492 : "ku-Arab-IQ",
+    0x0493 : "quc-CO",
+    0x0501 : "qps-ploc",
+    0x05FE : "qps-ploca",
+    0x0801 : "Arabic (Iraq)",
+    0x0803 : "Catalan (Spain, Valencian)",
+    0x0804 : "Chinese (Simplified, China)",
+    0x0807 : "German (Switzerland)",
+    0x0809 : "English (United Kingdom)",
+    0x080A : "Spanish (Mexico)",
+    0x080C : "French (Belgium)",
+    0x0810 : "Italian (Switzerland)",
+    0x0811 : "Japanese (Japan)",
+    0x0813 : "Dutch (Belgium)",
+    0x0814 : "Norwegian Nynorsk (Norway)",
+    0x0816 : "Portuguese (Portugal)",
+    0x0818 : "Romanian (Moldova)",
+    0x0819 : "Russian (Moldova)",
+    0x081A : "Serbian (Cyrillic, Serbia)",
+    0x081D : "Swedish (Finland)",
+    0x0820 : "Urdu (India)",
+    0x0827 : "Neither defined nor reserved",
+    0x082C : "Azerbaijani (Cyrillic, Azerbaijan)",
+    0x082E : "Lower Sorbian (Germany)",
+    0x0832 : "Tswana (Botswana)",
+    0x083B : "Northern Sami (Sweden)",
+    0x083C : "Irish (Ireland)",
+    0x083E : "Malay (Brunei)",
+    0x083F : "Kazakh (Cyrillic, Kazakhstan)",
+    0x0843 : "Uzbek (Cyrillic, Uzbekistan)",
+    0x0845 : "Bangla (Bangladesh)",
+    0x0846 : "Punjabi (Arabic, Pakistan)",
+    0x0849 : "Tamil (Sri Lanka)",
+    0x0850 : "Mongolian (Mongolian, China)",
+    0x0851 : "bo-BT",
+    0x0859 : "Sindhi (Arabic, Pakistan)",
+    0x085D : "Inuktitut (Latin, Canada)",
+    0x085F : "tzm-Latn-DZ",
+    0x0860 : "Kashmiri (Devanagari, India)",
+    0x0861 : "Nepali (India)",
+    0x0867 : "Fula (Latin, Senegal)",
+    0x086B : "Quechua (Ecuador)",
+    0x0873 : "Tigrinya (Eritrea)",
+    0x09FF : "qps-plocm",
+    0x0C00 : "Locale without assigned LCID if the current user default locale.",
+    0x0C01 : "Arabic (Egypt)",
+    0x0C04 : "Chinese (Traditional, Hong Kong SAR China)",
+    0x0C07 : "German (Austria)",
+    0x0C09 : "English (Australia)",
+    0x0C0A : "Spanish (Spain)",
+    0x0C0C : "French (Canada)",
+    0x0C1A : "Serbian (Cyrillic, Serbia)",
+    0x0C3B : "Northern Sami (Finland)",
+    0x0C50 : "Mongolian (Mongolian, Mongolia)",
+    0x0C51 : "Dzongkha (Bhutan)",
+    0x0C5F : "tmz-MA",
+    0x0C6B : "Quechua (Peru)",
+    0x1000 : "Locale without assigned LCID if the current user default locale.",
+    0x1001 : "Arabic (Libya)",
+    0x1004 : "Chinese (Simplified, Singapore)",
+    0x1007 : "German (Luxembourg)",
+    0x1009 : "English (Canada)",
+    0x100A : "Spanish (Guatemala)",
+    0x100C : "French (Switzerland)",
+    0x101A : "Croatian (Bosnia & Herzegovina)",
+    0x103B : "Lule Sami (Norway)",
+    0x105F : "Central Atlas Tamazight (Morocco)",
+    0x1401 : "Arabic (Algeria)",
+    0x1404 : "Chinese (Traditional, Macao SAR China)",
+    0x1407 : "German (Liechtenstein)",
+    0x1409 : "English (New Zealand)",
+    0x140A : "Spanish (Costa Rica)",
+    0x140C : "French (Luxembourg)",
+    0x141A : "Bosnian (Latin, Bosnia & Herzegovina)",
+    0x143B : "Lule Sami (Sweden)",
+    0x1801 : "Arabic (Morocco)",
+    0x1809 : "English (Ireland)",
+    0x180A : "Spanish (Panama)",
+    0x180C : "French (Monaco)",
+    0x181A : "Serbian (Latin, Bosnia & Herzegovina)",
+    0x183B : "Southern Sami (Norway)",
+    0x1C01 : "Arabic (Tunisia)",
+    0x1C09 : "English (South Africa)",
+    0x1C0A : "Spanish (Dominican Republic)",
+    0x1C0C : "fr-029",
+    0x1C1A : "Serbian (Cyrillic, Bosnia & Herzegovina)",
+    0x1C3B : "Southern Sami (Sweden)",
+    0x2000 : "Unassigned LCID locale temporarily assigned to LCID 0x3000.",
+    0x2001 : "Arabic (Oman)",
+    0x2008 : "Neither defined nor reserved",
+    0x2009 : "English (Jamaica)",
+    0x200A : "Spanish (Venezuela)",
+    0x200C : "French (Réunion)",
+    0x201A : "Bosnian (Cyrillic, Bosnia & Herzegovina)",
+    0x203B : "Skolt Sami (Finland)",
+    0x2400 : "Unassigned LCID locale temporarily assigned to LCID 0x3000.",
+    0x2401 : "Arabic (Yemen)",
+    0x2409 : "en-029",
+    0x240A : "Spanish (Colombia)",
+    0x240C : "French (Congo - Kinshasa)",
+    0x241A : "Serbian (Latin, Serbia)",
+    0x243B : "Inari Sami (Finland)",
+    0x2800 : "Unassigned LCID locale temporarily assigned to LCID 0x3000.",
+    0x2801 : "Arabic (Syria)",
+    0x2809 : "English (Belize)",
+    0x280A : "Spanish (Peru)",
+    0x280C : "French (Senegal)",
+    0x281A : "Serbian (Cyrillic, Serbia)",
+    0x2C00 : "Unassigned LCID locale temporarily assigned to LCID 0x3000.",
+    0x2C01 : "Arabic (Jordan)",
+    0x2C09 : "English (Trinidad & Tobago)",
+    0x2C0A : "Spanish (Argentina)",
+    0x2C0C : "French (Cameroon)",
+    0x2C1A : "Serbian (Latin, Montenegro)",
+    0x3000 : "Unassigned LCID locale temporarily assigned to LCID 0x3000.",
+    0x3001 : "Arabic (Lebanon)",
+    0x3009 : "English (Zimbabwe)",
+    0x300A : "Spanish (Ecuador)",
+    0x300C : "French (Côte d’Ivoire)",
+    0x301A : "Serbian (Cyrillic, Montenegro)",
+    0x3400 : "Unassigned LCID locale temporarily assigned to LCID 0x3400.",
+    0x3401 : "Arabic (Kuwait)",
+    0x3409 : "English (Philippines)",
+    0x340A : "Spanish (Chile)",
+    0x340C : "French (Mali)",
+    0x3800 : "Unassigned LCID locale temporarily assigned to LCID 0x3800.",
+    0x3801 : "Arabic (United Arab Emirates)",
+    0x3809 : "English (Indonesia)",
+    0x380A : "Spanish (Uruguay)",
+    0x380C : "French (Morocco)",
+    0x3C00 : "Unassigned LCID locale temporarily assigned to LCID 0x3C00.",
+    0x3C01 : "Arabic (Bahrain)",
+    0x3C09 : "English (Hong Kong SAR China)",
+    0x3C0A : "Spanish (Paraguay)",
+    0x3C0C : "French (Haiti)",
+    0x4000 : "Unassigned LCID locale temporarily assigned to LCID 0x4000.",
+    0x4001 : "Arabic (Qatar)",
+    0x4009 : "English (India)",
+    0x400A : "Spanish (Bolivia)",
+    0x4400 : "Unassigned LCID locale temporarily assigned to LCID 0x4400.",
+    0x4401 : "Arabic (Saudi Arabia)",
+    0x4409 : "English (Malaysia)",
+    0x440A : "Spanish (El Salvador)",
+    0x4800 : "Unassigned LCID locale temporarily assigned to LCID 0x4800.",
+    0x4801 : "ar-145",
+    0x4809 : "English (Singapore)",
+    0x480A : "Spanish (Honduras)",
+    0x4C00 : "Unassigned LCID locale temporarily assigned to LCID 0x4C00.",
+    0x4C09 : "English (United Arab Emirates)",
+    0x4C0A : "Spanish (Nicaragua)",
+    0x5009 : "en-BH",
+    0x500A : "Spanish (Puerto Rico)",
+    0x5409 : "en-EG",
+    0x540A : "Spanish (United States)",
+    0x5809 : "en-JO",
+    0x580A : "Spanish (Latin America)",
+    0x5C09 : "en-KW",
+    0x5C0A : "Spanish (Cuba)",
+    0x6009 : "en-TR",
+    0x6409 : "en-YE",
+    0x641A : "Bosnian (Cyrillic)",
+    0x681A : "Bosnian (Latin)",
+    0x6C1A : "Serbian (Cyrillic)",
+    0x701A : "Serbian (Latin)",
+    0x703B : "Inari Sami",
+    0x742C : "Azerbaijani (Cyrillic)",
+    0x743B : "Skolt Sami",
+    0x7804 : "Chinese",
+    0x7814 : "Norwegian Nynorsk",
+    0x781A : "Bosnian",
+    0x782C : "Azerbaijani (Latin)",
+    0x783B : "Southern Sami",
+    0x783F : "Kazakh (Cyrillic)",
+    0x7843 : "Uzbek (Cyrillic)",
+    0x7850 : "Mongolian",
+    0x785D : "Inuktitut",
+    0x785F : "Central Atlas Tamazight",
+    0x7C04 : "Chinese (Traditional)",
+    0x7C14 : "Norwegian Bokmål",
+    0x7C1A : "Serbian",
+    0x7C28 : "Tajik",
+    0x7C2E : "Lower Sorbian",
+    0x7C3B : "Lule Sami",
+    0x7C3F : "Kazakh (Cyrillic)",
+    0x7C43 : "Uzbek (Latin)",
+    0x7C46 : "Punjabi (Arabic)",
+    0x7C50 : "Mongolian (Mongolian)",
+    0x7C59 : "Sindhi (Arabic)",
+    0x7C5C : "Cherokee",
+    0x7C5D : "Inuktitut (Latin)",
+    0x7C5F : "Central Atlas Tamazight",
+    0x7C67 : "Fula (Latin)",
+    0x7C68 : "Hausa",
+    0x7C92 : "Kurdish",
+    0xF2EE : "reserved",
+    0xE40C : "fr-015",
+    0xEEEE : "reserved",
+}
+
+
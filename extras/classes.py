@@ -1,897 +1,113 @@
 # Copyright (c) 2025 Darshan P. All rights reserved.
 
-# This work is licensed under the terms of the MIT license.  
+# This work is licensed under the terms of the MIT license.
 # For a copy, see <https://opensource.org/licenses/MIT>.
 
-Classes = {
-    0: {"name": "(Defined at Interface level)", "subclass": {}},
-    1: {
-        "name": "Audio",
-        "subclass": {
-            1: {"name": "Control Device", "protocols": {}},
-            2: {"name": "Streaming", "protocols": {}},
-            3: {"name": "MIDI Streaming", "protocols": {}},
-        },
-    },
-    2: {
-        "name": "Communications",
-        "subclass": {
-            1: {"name": "Direct Line", "protocols": {}},
-            2: {
-                "name": "Abstract (modem)",
-                "protocols": {
-                    0: "None",
-                    1: "AT-commands (v.25ter)",
-                    2: "AT-commands (PCCA101)",
-                    3: "AT-commands (PCCA101 + wakeup)",
-                    4: "AT-commands (GSM)",
-                    5: "AT-commands (3G)",
-                    6: "AT-commands (CDMA)",
-                    254: "Defined by command set " "descriptor",
-                    255: "Vendor Specific (MSFT RNDIS?)",
-                },
-            },
-            3: {"name": "Telephone", "protocols": {}},
-            4: {"name": "Multi-Channel", "protocols": {}},
-            5: {"name": "CAPI Control", "protocols": {}},
-            6: {"name": "Ethernet Networking", "protocols": {}},
-            7: {"name": "ATM Networking", "protocols": {}},
-            8: {"name": "Wireless Handset Control", "protocols": {}},
-            9: {"name": "Device Management", "protocols": {}},
-            10: {"name": "Mobile Direct Line", "protocols": {}},
-            11: {"name": "OBEX", "protocols": {}},
-            12: {
-                "name": "Ethernet Emulation",
-                "protocols": {7: "Ethernet Emulation (EEM)"},
-            },
-        },
-    },
-    3: {
-        "name": "Human Interface Device",
-        "subclass": {
-            0: {
-                "name": "No Subclass",
-                "protocols": {0: "None", 1: "Keyboard", 2: "Mouse"},
-            },
-            1: {
-                "name": "Boot Interface Subclass",
-                "protocols": {0: "None", 1: "Keyboard", 2: "Mouse"},
-            },
-        },
-    },
-    5: {"name": "Physical Interface Device", "subclass": {}},
-    6: {
-        "name": "Imaging",
-        "subclass": {
-            1: {
-                "name": "Still Image Capture",
-                "protocols": {1: "Picture Transfer Protocol (PIMA " "15470)"},
-            }
-        },
-    },
-    7: {
-        "name": "Printer",
-        "subclass": {
-            1: {
-                "name": "Printer",
-                "protocols": {
-                    0: "Reserved/Undefined",
-                    1: "Unidirectional",
-                    2: "Bidirectional",
-                    3: "IEEE 1284.4 compatible " "bidirectional",
-                    255: "Vendor Specific",
-                },
-            }
-        },
-    },
-    8: {
-        "name": "Mass Storage",
-        "subclass": {
-            1: {
-                "name": "RBC (typically Flash)",
-                "protocols": {
-                    0: "Control/Bulk/Interrupt",
-                    1: "Control/Bulk",
-                    80: "Bulk-Only",
-                },
-            },
-            2: {"name": "SFF-8020i, MMC-2 (ATAPI)", "protocols": {}},
-            3: {"name": "QIC-157", "protocols": {}},
-            4: {
-                "name": "Floppy (UFI)",
-                "protocols": {
-                    0: "Control/Bulk/Interrupt",
-                    1: "Control/Bulk",
-                    80: "Bulk-Only",
-                },
-            },
-            5: {"name": "SFF-8070i", "protocols": {}},
-            6: {
-                "name": "SCSI",
-                "protocols": {
-                    0: "Control/Bulk/Interrupt",
-                    1: "Control/Bulk",
-                    80: "Bulk-Only",
-                },
-            },
-        },
-    },
-    9: {
-        "name": "Hub",
-        "subclass": {
-            0: {
-                "name": "Unused",
-                "protocols": {
-                    0: "Full speed (or root) hub",
-                    1: "Single TT",
-                    2: "TT per port",
-                },
-            }
-        },
-    },
-    10: {
-        "name": "CDC Data",
-        "subclass": {
-            0: {
-                "name": "Unused",
-                "protocols": {
-                    48: "I.430 ISDN BRI",
-                    49: "HDLC",
-                    50: "Transparent",
-                    80: "Q.921M",
-                    81: "Q.921",
-                    82: "Q.921TM",
-                    144: "V.42bis",
-                    145: "Q.932 EuroISDN",
-                    146: "V.120 V.24 rate ISDN",
-                    147: "CAPI 2.0",
-                    253: "Host Based Driver",
-                    254: "CDC PUF",
-                    255: "Vendor specific",
-                },
-            }
-        },
-    },
-    11: {"name": "Chip/SmartCard", "subclass": {}},
-    13: {"name": "Content Security", "subclass": {}},
-    14: {
-        "name": "Video",
-        "subclass": {
-            0: {"name": "Undefined", "protocols": {}},
-            1: {"name": "Video Control", "protocols": {}},
-            2: {"name": "Video Streaming", "protocols": {}},
-            3: {"name": "Video Interface Collection", "protocols": {}},
-        },
-    },
-    15: {"name": "Personal Healthcare", "subclass": {}},
-    16: {
-        "name": "Audio/Video",
-        "subclass": {
-            1: {"name": "AVData Control", "protocols": {}},
-            2: {"name": "AVData Video Stream", "protocols": {}},
-            3: {"name": "AVData Audio Stream", "protocols": {}},
-        },
-    },
-    17: {"name": "Billboard", "subclass": {}},
-    18: {"name": "Type-C Bridge", "subclass": {}},
-    19: {"name": "Bulk Display", "subclass": {}},
-    20: {
-        "name": "MCTCP over USB",
-        "subclass": {
-            0: {
-                "name": "MCTCP Management",
-                "protocols": {1: "MCTCP 1.x", 2: "MCTCP 2.x"},
-            },
-            1: {"name": "MCTCP Host", "protocols": {1: "MCTCP 1.x", 2: "MCTCP 2.x"}},
-        },
-    },
-    60: {"name": "I3C", "subclass": {}},
-    88: {"name": "Xbox", "subclass": {66: {"name": "Controller", "protocols": {}}}},
-    220: {
-        "name": "Diagnostic",
-        "subclass": {
-            1: {
-                "name": "Reprogrammable Diagnostics",
-                "protocols": {1: "USB2 Compliance"},
-            }
-        },
-    },
-    224: {
-        "name": "Wireless",
-        "subclass": {
-            1: {
-                "name": "Radio Frequency",
-                "protocols": {
-                    1: "Bluetooth",
-                    2: "Ultra WideBand Radio Control",
-                    3: "RNDIS",
-                },
-            },
-            2: {
-                "name": "Wireless USB Wire Adapter",
-                "protocols": {
-                    1: "Host Wire Adapter Control/Data " "Streaming",
-                    2: "Device Wire Adapter " "Control/Data Streaming",
-                    3: "Device Wire Adapter Isochronous " "Streaming",
-                },
-            },
-        },
-    },
-    239: {
-        "name": "Miscellaneous Device",
-        "subclass": {
-            1: {"name": "?", "protocols": {1: "Microsoft ActiveSync", 2: "Palm Sync"}},
-            2: {
-                "name": "?",
-                "protocols": {
-                    1: "Interface Association",
-                    2: "Wire Adapter Multifunction " "Peripheral",
-                },
-            },
-            3: {"name": "?", "protocols": {1: "Cable Based Association"}},
-            5: {"name": "USB3 Vision", "protocols": {}},
-        },
-        254: {
-            "name": "Application Specific Interface",
-            "subclass": {
-                1: {"name": "Device Firmware Update", "protocols": {}},
-                2: {"name": "IRDA Bridge", "protocols": {}},
-                3: {
-                    "name": "Test and Measurement",
-                    "protocols": {1: "TMC", 2: "USB488"},
-                },
-            },
-        },
-        255: {
-            "name": "Vendor Specific Class",
-            "subclass": {
-                255: {
-                    "name": "Vendor Specific Subclass",
-                    "protocols": {255: "Vendor Specific Protocol"},
-                }
-            },
-        },
-    },
-}
+'''
+Class, audio terminal, HID, HID usage, BOS capability, country code and language ID lookup tables.
 
-More = {
-  "Audio" : {
-    0x0100 :  "USB Undefined",
-    0x0101 :  "USB Streaming",
-    0x01ff :  "USB Vendor Specific",
-    0x0200 :  "Input Undefined",
-    0x0201 :  "Microphone",
-    0x0202 :  "Desktop Microphone",
-    0x0203 :  "Personal Microphone",
-    0x0204 :  "Omni-directional Microphone",
-    0x0205 :  "Microphone Array",
-    0x0206 :  "Processing Microphone Array",
-    0x0300 :  "Output Undefined",
-    0x0301 :  "Speaker",
-    0x0302 :  "Headphones",
-    0x0303 :  "Head Mounted Display Audio",
-    0x0304 :  "Desktop Speaker",
-    0x0305 :  "Room Speaker",
-    0x0306 :  "Communication Speaker",
-    0x0307 :  "Low Frequency Effects Speaker",
-    0x0400 :  "Bidirectional Undefined",
-    0x0401 :  "Handset",
-    0x0402 :  "Headset",
-    0x0403 :  "Speakerphone, no echo reduction",
-    0x0404 :  "Echo-suppressing speakerphone",
-    0x0405 :  "Echo-canceling speakerphone",
-    0x0500 :  "Telephony Undefined",
-    0x0501 :  "Phone line",
-    0x0502 :  "Telephone",
-    0x0503 :  "Down Line Phone",
-    0x0600 :  "External Undefined",
-    0x0601 :  "Analog Connector",
-    0x0602 :  "Digital Audio Interface",
-    0x0603 :  "Line Connector",
-    0x0604 :  "Legacy Audio Connector",
-    0x0605 :  "SPDIF interface",
-    0x0606 :  "1394 DA stream",
-    0x0607 :  "1394 DV stream soundtrack",
-    0x0700 :  "Embedded Undefined",
-    0x0701 :  "Level Calibration Noise Source",
-    0x0702 :  "Equalization Noise",
-    0x0703 :  "CD Player",
-    0x0704 :  "DAT",
-    0x0705 :  "DCC",
-    0x0706 :  "MiniDisc",
-    0x0707 :  "Analog Tape",
-    0x0708 :  "Phonograph",
-    0x0709 :  "VCR Audio",
-    0x070a :  "Video Disc Audio",
-    0x070b :  "DVD Audio",
-    0x070c :  "TV Tuner Audio",
-    0x070d :  "Satellite Receiver Audio",
-    0x070e :  "Cable Tuner Audio",
-    0x070f :  "DSS Audio",
-    0x0710 :  "Radio Receiver",
-    0x0711 :  "Radio Transmitter",
-    0x0712 :  "Multitrack Recorder",
-    0x0713 :  "Synthesizer"
-  },
-  "hid" : {
-    0x21 :  "HID",
-    0x22 :  "Report",
-    0x23 :  "Physical"
-  },
-  "hid-item" : {
-    0x04 : "Usage Page",
-    0x08 : "Usage",
-    0x14 : "Logical Minimum",
-    0x18 : "Usage Minimum",
-    0x24 : "Logical Maximum",
-    0x28 : "Usage Maximum",
-    0x34 : "Physical Minimum",
-    0x38 : "Designator Index",
-    0x44 : "Physical Maximum",
-    0x48 : "Designator Minimum",
-    0x54 : "Unit Exponent",
-    0x58 : "Designator Maximum",
-    0x64 : "Unit",
-    0x74 : "Report Size",
-    0x78 : "String Index",
-    0x80 : "Input",
-    0x84 : "Report ID",
-    0x88 : "String Minimum",
-    0x90 : "Output",
-    0x94 : "Report Count",
-    0x98 : "String Maximum",
-    0xa0 : "Collection",
-    0xa4 : "Push",
-    0xa8 : "Delimiter",
-    0xb0 : "Feature",
-    0xb4 : "Pop",
-    0xc0 : "End Collection"
-  }
-}
+The tables are compiled into `classes.marshal` by `compileUSBIDs.py`, one marshalled blob per table, and
+each name below is a read-only mapping that unmarshals its own table the first time it is used. A dump without
+a HID descriptor never builds the HID tables, one without audio terminals never builds the `Audio` table, and so
+on. Before the first table is loaded, the CRC-32 of every source recorded in `classes.marshal` is compared with
+that of the file on disk (the sources add up to a few tens of kilobytes). If the file is missing, corrupt or stale,
+a warning is issued and the tables are parsed from the sources instead. `compileUSBIDs.py --check` does the full
+comparison of the compiled tables.
+'''
 
-DeviceCapabilityTypeCode = {
-  0x01 : "Wireless_USB",
-  0x02  : "USB 2.0 EXTENSION",
-  0x03 : "SUPERSPEED_USB",
-  0x04 : "CONTAINER_ID",
-  0x05 : "PLATFORM",
-  0x06  : "POWER_DELIVERY_CAPABILITY ",
-  0x07 : "BATTERY_INFO_CAPABILITY",
-  0x08  : "PD_CONSUMER_PORT_CAPABILITY ",
-  0x09  : "PD_PROVIDER_PORT_CAPABILITY ",
-  0x0A : "SUPERSPEED_PLUS",
-  0x0B  : "PRECISION_TIME_MEASUREMENT ",
-  0x0C : "Wireless_USB_Ext",
-  0x0D  : "BILLBOARD ",
-  0x0E  : "AUTHENTICATION ",
-  0x0F  : "BILLBOARD_EX ",
-  0x10 : "CONFIGURATION_SUMMARY",
-  0x11 : "FWStatus Capability",
-}
+import marshal
+import os
+import zlib
 
-CountryCodes = {
-    0x00: "Not Supported",
-    0x01: "Arabic",
-    0x02: "Belgian",
-    0x03: "Canadian‑Bilingual",
-    0x04: "Canadian‑French",
-    0x05: "Czechia",
-    0x06: "Danish",
-    0x07: "Finnish",
-    0x08: "French",
-    0x09: "German",
-    0x0A: "Greek",
-    0x0B: "Hebrew",
-    0x0C: "Hungary",
-    0x0D: "International (ISO)",
-    0x0E: "Italian",
-    0x0F: "Japan (Katakana)",
-    0x10: "Korean",
-    0x11: "Latin American",
-    0x12: "Netherlands",
-    0x13: "Norwegian",
-    0x14: "Persian",
-    0x15: "Poland",
-    0x16: "Portuguese",
-    0x17: "Russia",
-    0x18: "Slovakia",
-    0x19: "Spanish",
-    0x1A: "Swedish",
-    0x1B: "Swiss/French",
-    0x1C: "Swiss/German",
-    0x1D: "Switzerland",
-    0x1E: "Taiwan",
-    0x1F: "Turkish‑Q",
-    0x20: "UK",
-    0x21: "US",
-    0x22: "Yugoslavia",
-    0x23: "Turkish‑F",
-}
+EXTRAS = os.path.dirname(os.path.abspath(__file__))
+COMPILED_TABLES = os.path.join(EXTRAS, "classes.marshal")
+GENERATOR = os.path.join(EXTRAS, "compileUSBIDs.py")
+FORMAT_VERSION = 4  # Of classes.marshal, must match compileUSBIDs.FORMAT_VERSION
 
-# Language IDs obtained from <https://learn.microsoft.com/en-us/openspecs/windows_protocols/ms-lcid/70feba9f-294e-491e-b6eb-56532684c37f>
-LANGIDs = {
-    0x0001 : "ar",
-    0x0002 : "bg",
-    0x0003 : "ca",
-    0x0004 : "zh-Hans",
-    0x0005 : "cs",
-    0x0006 : "da",
-    0x0007 : "de",
-    0x0008 : "el",
-    0x0009 : "en",
-    0x000A : "es",
-    0x000B : "fi",
-    0x000C : "fr",
-    0x000D : "he",
-    0x000E : "hu",
-    0x000F : "is",
-    0x0010 : "it",
-    0x0011 : "ja",
-    0x0012 : "ko",
-    0x0013 : "nl",
-    0x0014 : "no",
-    0x0015 : "pl",
-    0x0016 : "pt",
-    0x0017 : "rm",
-    0x0018 : "ro",
-    0x0019 : "ru",
-    0x001A : "hr",
-    0x001B : "sk",
-    0x001C : "sq",
-    0x001D : "sv",
-    0x001E : "th",
-    0x001F : "tr",
-    0x0020 : "ur",
-    0x0021 : "id",
-    0x0022 : "uk",
-    0x0023 : "be",
-    0x0024 : "sl",
-    0x0025 : "et",
-    0x0026 : "lv",
-    0x0027 : "lt",
-    0x0028 : "tg",
-    0x0029 : "fa",
-    0x002A : "vi",
-    0x002B : "hy",
-    0x002C : "az",
-    0x002D : "eu",
-    0x002E : "hsb",
-    0x002F : "mk",
-    0x0030 : "st",
-    0x0031 : "ts",
-    0x0032 : "tn",
-    0x0033 : "ve",
-    0x0034 : "xh",
-    0x0035 : "zu",
-    0x0036 : "af",
-    0x0037 : "ka",
-    0x0038 : "fo",
-    0x0039 : "hi",
-    0x003A : "mt",
-    0x003B : "se",
-    0x003C : "ga",
-    0x003D : "yi",
-    0x003E : "ms",
-    0x003F : "kk",
-    0x0040 : "ky",
-    0x0041 : "sw",
-    0x0042 : "tk",
-    0x0043 : "uz",
-    0x0044 : "tt",
-    0x0045 : "bn",
-    0x0046 : "pa",
-    0x0047 : "gu",
-    0x0048 : "or",
-    0x0049 : "ta",
-    0x004A : "te",
-    0x004B : "kn",
-    0x004C : "ml",
-    0x004D : "as",
-    0x004E : "mr",
-    0x004F : "sa",
-    0x0050 : "mn",
-    0x0051 : "bo",
-    0x0052 : "cy",
-    0x0053 : "km",
-    0x0054 : "lo",
-    0x0055 : "my",
-    0x0056 : "gl",
-    0x0057 : "kok",
-    0x0058 : "mni",
-    0x0059 : "sd",
-    0x005A : "syr",
-    0x005B : "si",
-    0x005C : "chr",
-    0x005D : "iu",
-    0x005E : "am",
-    0x005F : "tzm",
-    0x0060 : "ks",
-    0x0061 : "ne",
-    0x0062 : "fy",
-    0x0063 : "ps",
-    0x0064 : "fil",
-    0x0065 : "dv",
-    0x0066 : "bin",
-    0x0067 : "ff",
-    0x0068 : "ha",
-    0x0069 : "ibb",
-    0x006A : "yo,",
-    0x006B : "quz",
-    0x006C : "nso",
-    0x006D : "ba",
-    0x006E : "lb",
-    0x006F : "kl",
-    0x0070 : "ig",
-    0x0071 : "kr",
-    0x0072 : "om",
-    0x0073 : "ti",
-    0x0074 : "gn",
-    0x0075 : "haw",
-    0x0076 : "la",
-    0x0077 : "so",
-    0x0078 : "ii",
-    0x0079 : "pap",
-    0x007A : "arn",
-    0x007B : "Neither defined nor reserved",
-    0x007C : "moh",
-    0x007D : "Neither defined nor reserved",
-    0x007E : "br",
-    0x007F : "Reserved for invariant locale behavior",
-    0x0080 : "ug",
-    0x0081 : "mi",
-    0x0082 : "oc",
-    0x0083 : "co",
-    0x0084 : "gsw",
-    0x0085 : "sah",
-    0x0086 : "qut",
-    0x0087 : "rw",
-    0x0088 : "wo",
-    0x0089 : "Neither defined nor reserved",
-    0x008A : "Neither defined nor reserved",
-    0x008B : "Neither defined nor reserved",
-    0x008C : "prs",
-    0x008D : "Neither defined nor reserved",
-    0x008E : "Neither defined nor reserved",
-    0x008F : "Neither defined nor reserved",
-    0x0090 : "Neither defined nor reserved",
-    0x0091 : "gd",
-    0x0092 : "ku",
-    0x0093 : "quc",
-    0x0401 : "ar-SA",
-    0x0402 : "bg-BG",
-    0x0403 : "ca-ES",
-    0x0404 : "zh-TW",
-    0x0405 : "cs-CZ",
-    0x0406 : "da-DK",
-    0x0407 : "de-DE",
-    0x0408 : "el-GR",
-    0x0409 : "en-US",
-    0x040A : "es-ES_tradnl",
-    0x040B : "fi-FI",
-    0x040C : "fr-FR",
-    0x040D : "he-IL",
-    0x040E : "hu-HU",
-    0x040F : "is-IS",
-    0x0410 : "it-IT",
-    0x0411 : "ja-JP",
-    0x0412 : "ko-KR",
-    0x0413 : "nl-NL",
-    0x0414 : "nb-NO",
-    0x0415 : "pl-PL",
-    0x0416 : "pt-BR",
-    0x0417 : "rm-CH",
-    0x0418 : "ro-RO",
-    0x0419 : "ru-RU",
-    0x041A : "hr-HR",
-    0x041B : "sk-SK",
-    0x041C : "sq-AL",
-    0x041D : "sv-SE",
-    0x041E : "th-TH",
-    0x041F : "tr-TR",
-    0x0420 : "ur-PK",
-    0x0421 : "id-ID",
-    0x0422 : "uk-UA",
-    0x0423 : "be-BY",
-    0x0424 : "sl-SI",
-    0x0425 : "et-EE",
-    0x0426 : "lv-LV",
-    0x0427 : "lt-LT",
-    0x0428 : "tg-Cyrl-TJ",
-    0x0429 : "fa-IR",
-    0x042A : "vi-VN",
-    0x042B : "hy-AM",
-    0x042C : "az-Latn-AZ",
-    0x042D : "eu-ES",
-    0x042E : "hsb-DE",
-    0x042F : "mk-MK",
-    0x0430 : "st-ZA",
-    0x0431 : "ts-ZA",
-    0x0432 : "tn-ZA",
-    0x0433 : "ve-ZA",
-    0x0434 : "xh-ZA",
-    0x0435 : "zu-ZA",
-    0x0436 : "af-ZA",
-    0x0437 : "ka-GE",
-    0x0438 : "fo-FO",
-    0x0439 : "hi-IN",
-    0x043A : "mt-MT",
-    0x043B : "se-NO",
-    0x043D : "yi-001",
-    0x043E : "ms-MY",
-    0x043F : "kk-KZ",
-    0x0440 : "ky-KG",
-    0x0441 : "sw-KE",
-    0x0442 : "tk-TM",
-    0x0443 : "uz-Latn-UZ",
-    0x0444 : "tt-RU",
-    0x0445 : "bn-IN",
-    0x0446 : "pa-IN",
-    0x0447 : "gu-IN",
-    0x0448 : "or-IN",
-    0x0449 : "ta-IN",
-    0x044A : "te-IN",
-    0x044B : "kn-IN",
-    0x044C : "ml-IN",
-    0x044D : "as-IN",
-    0x044E : "mr-IN",
-    0x044F : "sa-IN",
-    0x0450 : "mn-MN",
-    0x0451 : "bo-CN",
-    0x0452 : "cy-GB",
-    0x0453 : "km-KH",
-    0x0454 : "lo-LA",
-    0x0455 : "my-MM",
-    0x0456 : "gl-ES",
-    0x0457 : "kok-IN",
-    0x0458 : "mni-IN",
-    0x0459 : "sd-Deva-IN",
-    0x045A : "syr-SY",
-    0x045B : "si-LK",
-    0x045C : "chr-Cher-US",
-    0x045D : "iu-Cans-CA",
-    0x045E : "am-ET",
-    0x045F : "tzm-Arab-MA",
-    0x0460 : "ks-Arab",
-    0x0461 : "ne-NP",
-    0x0462 : "fy-NL",
-    0x0463 : "ps-AF",
-    0x0464 : "fil-PH",
-    0x0465 : "dv-MV",
-    0x0466 : "bin-NG",
-    0x0467 : "ff-NG, ff-Latn-NG",
-    0x0468 : "ha-Latn-NG",
-    0x0469 : "ibb-NG",
-    0x046A : "yo-NG",
-    0x046B : "quz-BO",
-    0x046C : "nso-ZA",
-    0x046D : "ba-RU",
-    0x046E : "lb-LU",
-    0x046F : "kl-GL",
-    0x0470 : "ig-NG",
-    0x0471 : "kr-Latn-NG",
-    0x0472 : "om-ET",
-    0x0473 : "ti-ET",
-    0x0474 : "gn-PY",
-    0x0475 : "haw-US",
-    0x0476 : "la-VA",
-    0x0477 : "so-SO",
-    0x0478 : "ii-CN",
-    0x0479 : "pap-029",
-    0x047A : "arn-CL",
-    0x047C : "moh-CA",
-    0x047E : "br-FR",
-    0x0480 : "ug-CN",
-    0x0481 : "mi-NZ",
-    0x0482 : "oc-FR",
-    0x0483 : "co-FR",
-    0x0484 : "gsw-FR",
-    0x0485 : "sah-RU",
-    0x0486 : "qut-GT",
-    0x0487 : "rw-RW",
-    0x0488 : "wo-SN",
-    0x048C : "prs-AF",
-    0x048D : "plt-MG",
-    0x048E : "zh-yue-HK",
-    0x048F : "tdd-Tale-CN",
-    0x0490 : "khb-Talu-CN",
-    0x0491 : "gd-GB",
-    0x0492 : "ku-Arab-IQ",
-    0x0493 : "quc-CO",
-    0x0501 : "qps-ploc",
-    0x05FE : "qps-ploca",
-    0x0801 : "ar-IQ",
-    0x0803 : "ca-ES-valencia",
-    0x0804 : "zh-CN",
-    0x0807 : "de-CH",
-    0x0809 : "en-GB",
-    0x080A : "es-MX",
-    0x080C : "fr-BE",
-    0x0810 : "it-CH",
-    0x0811 : "ja-Ploc-JP",
-    0x0813 : "nl-BE",
-    0x0814 : "nn-NO",
-    0x0816 : "pt-PT",
-    0x0818 : "ro-MD",
-    0x0819 : "ru-MD",
-    0x081A : "sr-Latn-CS",
-    0x081D : "sv-FI",
-    0x0820 : "ur-IN",
-    0x0827 : "Neither defined nor reserved",
-    0x082C : "az-Cyrl-AZ",
-    0x082E : "dsb-DE",
-    0x0832 : "tn-BW",
-    0x083B : "se-SE",
-    0x083C : "ga-IE",
-    0x083E : "ms-BN",
-    0x083F : "kk-Latn-KZ",
-    0x0843 : "uz-Cyrl-UZ",
-    0x0845 : "bn-BD",
-    0x0846 : "pa-Arab-PK",
-    0x0849 : "ta-LK",
-    0x0850 : "mn-Mong-CN",
-    0x0851 : "bo-BT",
-    0x0859 : "sd-Arab-PK",
-    0x085D : "iu-Latn-CA",
-    0x085F : "tzm-Latn-DZ",
-    0x0860 : "ks-Deva-IN",
-    0x0861 : "ne-IN",
-    0x0867 : "ff-Latn-SN",
-    0x086B : "quz-EC",
-    0x0873 : "ti-ER",
-    0x09FF : "qps-plocm",
-    0x0C00 : "Locale without assigned LCID if the current user default locale.",
-    0x0C01 : "ar-EG",
-    0x0C04 : "zh-HK",
-    0x0C07 : "de-AT",
-    0x0C09 : "en-AU",
-    0x0C0A : "es-ES",
-    0x0C0C : "fr-CA",
-    0x0C1A : "sr-Cyrl-CS",
-    0x0C3B : "se-FI",
-    0x0C50 : "mn-Mong-MN",
-    0x0C51 : "dz-BT",
-    0x0C5F : "tmz-MA",
-    0x0C6b : "quz-PE",
-    0x1000 : "Locale without assigned LCID if the current user default locale.",
-    0x1001 : "ar-LY",
-    0x1004 : "zh-SG",
-    0x1007 : "de-LU",
-    0x1009 : "en-CA",
-    0x100A : "es-GT",
-    0x100C : "fr-CH",
-    0x101A : "hr-BA",
-    0x103B : "smj-NO",
-    0x105F : "tzm-Tfng-MA",
-    0x1401 : "ar-DZ",
-    0x1404 : "zh-MO",
-    0x1407 : "de-LI",
-    0x1409 : "en-NZ",
-    0x140A : "es-CR",
-    0x140C : "fr-LU",
-    0x141A : "bs-Latn-BA",
-    0x143B : "smj-SE",
-    0x1801 : "ar-MA",
-    0x1809 : "en-IE",
-    0x180A : "es-PA",
-    0x180C : "fr-MC",
-    0x181A : "sr-Latn-BA",
-    0x183B : "sma-NO",
-    0x1C01 : "ar-TN",
-    0x1C09 : "en-ZA",
-    0x1C0A : "es-DO",
-    0x1C0C : "fr-029",
-    0x1C1A : "sr-Cyrl-BA",
-    0x1C3B : "sma-SE",
-    0x2000 : "Unassigned LCID locale temporarily assigned to LCID 0x3000.",
-    0x2001 : "ar-OM",
-    0x2008 : "Neither defined nor reserved",
-    0x2009 : "en-JM",
-    0x200A : "es-VE",
-    0x200C : "fr-RE",
-    0x201A : "bs-Cyrl-BA",
-    0x203B : "sms-FI",
-    0x2400 : "Unassigned LCID locale temporarily assigned to LCID 0x3000.",
-    0x2401 : "ar-YE",
-    0x2409 : "en-029",
-    0x240A : "es-CO",
-    0x240C : "fr-CD",
-    0x241A : "sr-Latn-RS",
-    0x243B : "smn-FI",
-    0x2800 : "Unassigned LCID locale temporarily assigned to LCID 0x3000.",
-    0x2801 : "ar-SY",
-    0x2809 : "en-BZ",
-    0x280A : "es-PE",
-    0x280C : "fr-SN",
-    0x281A : "sr-Cyrl-RS",
-    0x2C00 : "Unassigned LCID locale temporarily assigned to LCID 0x3000.",
-    0x2C01 : "ar-JO",
-    0x2C09 : "en-TT",
-    0x2C0A : "es-AR",
-    0x2C0C : "fr-CM",
-    0x2C1A : "sr-Latn-ME",
-    0x3000 : "Unassigned LCID locale temporarily assigned to LCID 0x3000.",
-    0x3001 : "ar-LB",
-    0x3009 : "en-ZW",
-    0x300A : "es-EC",
-    0x300C : "fr-CI",
-    0x301A : "sr-Cyrl-ME",
-    0x3400 : "Unassigned LCID locale temporarily assigned to LCID 0x3400.",
-    0x3401 : "ar-KW",
-    0x3409 : "en-PH",
-    0x340A : "es-CL",
-    0x340C : "fr-ML",
-    0x3800 : "Unassigned LCID locale temporarily assigned to LCID 0x3800.",
-    0x3801 : "ar-AE",
-    0x3809 : "en-ID",
-    0x380A : "es-UY",
-    0x380C : "fr-MA",
-    0x3C00 : "Unassigned LCID locale temporarily assigned to LCID 0x3C00.",
-    0x3C01 : "ar-BH",
-    0x3C09 : "en-HK",
-    0x3C0A : "es-PY",
-    0x3C0C : "fr-HT",
-    0x4000 : "Unassigned LCID locale temporarily assigned to LCID 0x4000.",
-    0x4001 : "ar-QA",
-    0x4009 : "en-IN",
-    0x400A : "es-BO",
-    0x4400 : "Unassigned LCID locale temporarily assigned to LCID 0x4400.",
-    0x4401 : "ar-Ploc-SA",
-    0x4409 : "en-MY",
-    0x440A : "es-SV",
-    0x4800 : "Unassigned LCID locale temporarily assigned to LCID 0x4800.",
-    0x4801 : "ar-145",
-    0x4809 : "en-SG",
-    0x480A : "es-HN",
-    0x4C00 : "Unassigned LCID locale temporarily assigned to LCID 0x4C00.",
-    0x4C09 : "en-AE",
-    0x4C0A : "es-NI",
-    0x5009 : "en-BH",
-    0x500A : "es-PR",
-    0x5409 : "en-EG",
-    0x540A : "es-US",
-    0x5809 : "en-JO",
-    0x580A : "es-419",
-    0x5C09 : "en-KW",
-    0x5C0A : "es-CU",
-    0x6009 : "en-TR",
-    0x6409 : "en-YE",
-    0x641A : "bs-Cyrl",
-    0x681A : "bs-Latn",
-    0x6C1A : "sr-Cyrl",
-    0x701A : "sr-Latn",
-    0x703B : "smn",
-    0x742C : "az-Cyrl",
-    0x743B : "sms",
-    0x7804 : "zh",
-    0x7814 : "nn",
-    0x781A : "bs",
-    0x782C : "az-Latn",
-    0x783B : "sma",
-    0x783F : "kk-Cyrl",
-    0x7843 : "uz-Cyrl",
-    0x7850 : "mn-Cyrl",
-    0x785D : "iu-Cans",
-    0x785F : "tzm-Tfng",
-    0x7C04 : "zh-Hant",
-    0x7C14 : "nb",
-    0x7C1A : "sr",
-    0x7C28 : "tg-Cyrl",
-    0x7C2E : "dsb",
-    0x7C3B : "smj",
-    0x7C3F : "kk-Latn",
-    0x7C43 : "uz-Latn",
-    0x7C46 : "pa-Arab",
-    0x7C50 : "mn-Mong",
-    0x7C59 : "sd-Arab",
-    0x7C5C : "chr-Cher",
-    0x7C5D : "iu-Latn",
-    0x7C5F : "tzm-Latn",
-    0x7C67 : "ff-Latn",
-    0x7C68 : "ha-Latn",
-    0x7C92 : "ku-Arab",
-    0xF2EE : "reserved",
-    0xE40C : "fr-015",
-    0xEEEE : "reserved",
-}
+_blobs = None
+_sources = None
 
+def _load_blobs() -> dict:
+    '''Table name -> marshalled table from `classes.marshal`, or {} (with a warning) if it cannot be used.'''
+    global _blobs
+    if _blobs is None:
+        try:
+            with open(COMPILED_TABLES, 'rb') as f:
+                compiled = marshal.loads(f.read())
+            if not isinstance(compiled, dict) or compiled.get("version") != FORMAT_VERSION:
+                raise ValueError(f"format is not version {FORMAT_VERSION}")
+            for source, crc in compiled["sources"].items():
+                with open(os.path.join(EXTRAS, source), 'rb') as f:
+                    if zlib.crc32(f.read()) != crc:
+                        raise ValueError(f"{source} changed since it was generated")
+            _blobs = compiled["tables"]
+        except (OSError, EOFError, ValueError, TypeError, KeyError, AttributeError) as e:
+            import warnings
+            warnings.warn(f"Not using {COMPILED_TABLES} ({e}), parsing the sources instead. "
+                          f"Run python3 extras/compileUSBIDs.py to regenerate it.", RuntimeWarning)
+            _blobs = {}
+    return _blobs
 
+def _load(name: str) -> dict:
+    global _sources
+    blob = _load_blobs().get(name)
+    if blob is not None:
+        return marshal.loads(blob)
+    if _sources is None:
+        import runpy
+        _sources = runpy.run_path(GENERATOR)["build_tables"](EXTRAS)
+    return _sources[name]
+
+class LazyTable:
+    '''Read-only mapping over one compiled table, unmarshalled on first access.'''
+    __slots__ = ("name", "_table")
+
+    def __init__(self, name: str):
+        self.name = name
+        self._table = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._table is not None
+
+    @property
+    def table(self) -> dict:
+        if self._table is None:
+            self._table = _load(self.name)
+        return self._table
+
+    def __getitem__(self, key):
+        return self.table[key]
+
+    def get(self, key, default=None):
+        return self.table.get(key, default)
+
+    def __contains__(self, key):
+        return key in self.table
+
+    def __iter__(self):
+        return iter(self.table)
+
+    def __len__(self):
+        return len(self.table)
+
+    def keys(self):
+        return self.table.keys()
+
+    def values(self):
+        return self.table.values()
+
+    def items(self):
+        return self.table.items()
+
+    def __repr__(self):
+        return f"LazyTable({self.name!r}, {'loaded' if self.loaded else 'not loaded'})"
+
+Classes = LazyTable("Classes")
+More = {name: LazyTable(name) for name in ("Audio", "hid", "hid-item")}
+HIDUsagePages = LazyTable("HIDUsagePages")
+HIDUsages = LazyTable("HIDUsages")  # page << 16 | usage -> name
+DeviceCapabilityTypeCode = LazyTable("DeviceCapabilityTypeCode")
+CountryCodes = LazyTable("CountryCodes")
+LANGIDs = LazyTable("LANGIDs")
+LANGIDNames = LazyTable("LANGIDNames")
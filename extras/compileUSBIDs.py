@@ -0,0 +1,177 @@
+# Copyright (c) 2025 Darshan P. All rights reserved.
+
+# This work is licensed under the terms of the MIT license.
+# For a copy, see <https://opensource.org/licenses/MIT>.
+
+'''
+Compiles the usb.ids data into every lookup artifact the visualizer reads, in one streaming pass:
+- `usbIDs.idx`: vendor and product names, built by `generateIndexFromUSBIDs.build_index`.
+- `classes.marshal`: the tables read through `classes.py`.
+
+The input is either this folder's split copy of usb.ids (`usbIDs`, which holds the vendor list, followed by
+`usbClasses`, `usbAudioClasses`, `usbHIDClasses`, `usbHIDItemType` and `usbHIDUsages`) or a single upstream
+`usb.ids` given on the command line. Lines are parsed one at a time and dispatched on their section tag:
+
+    vvvv  vendor             C xx  class            AT xxxx  audio terminal    HUT xx  usage page
+    <tab>pppp  product       <tab>xx  subclass      HID xx  class descriptor   <tab>uuu  usage
+                             <tab><tab>xx  protocol R xx  report item          HCC xx  country code
+                                                                               L xxxx  language, <tab>xx dialect
+
+Other sections (physical descriptors, video terminals, ...) are skipped. `DeviceCapabilityTypeCode`,
+`CountryCodes`, `LANGIDs` and `LANGIDNames` come from the hand-maintained `classTables.py`; `HCC` and `L` entries
+only add codes that file does not list.
+
+`classes.marshal` is one marshalled dict: `version`, `sources` (the CRC-32 of every file in this folder the tables
+were built from, which `classes.py` checks to catch a forgotten regeneration) and `tables`, which maps each table
+name to its own marshalled blob. Loading the file only copies the blobs; a table's dicts and strings are created the first time
+that table is used. Marshal format 2 is used throughout: it has no back-references, so unchanged inputs always
+produce byte-identical artifacts.
+
+With `--check`, nothing is written: the artifacts are compiled in memory and compared byte for byte with those in
+the output directory, and the exit status is 1 if any is out of date. Run it in CI so a stale artifact cannot be
+committed.
+
+Usage: python3 extras/compileUSBIDs.py [usb.ids] [--output DIR] [--check]
+'''
+
+import argparse
+import marshal
+import os
+import runpy
+import sys
+import zlib
+
+FORMAT_VERSION = 4  # Checked by classes.py
+MARSHAL_VERSION = 2
+
+EXTRAS = os.path.dirname(os.path.abspath(__file__))
+SECTION_FILES = ("usbClasses", "usbAudioClasses", "usbHIDClasses", "usbHIDItemType", "usbHIDUsages")
+HAND_MAINTAINED = ("DeviceCapabilityTypeCode", "CountryCodes", "LANGIDs", "LANGIDNames")
+# Top-level tag -> table of one-level sections
+SECTIONS = {"AT": "Audio", "HID": "hid", "R": "hid-item", "HCC": "CountryCodes"}
+
+def _is_vendor(tag: str) -> bool:
+    return len(tag) == 4 and all(c in "0123456789abcdefABCDEF" for c in tag)
+
+def parse(paths) -> tuple:
+    '''
+    Streams the files in `paths` as one usb.ids. Returns (vendors, products, tables), tables holding the
+    sections found, keyed like `classes.py`, plus `Languages` (wLANGID -> name) from the `L` section.
+    '''
+    vendors, products = {}, {}
+    tables = {"Classes": {}, "Audio": {}, "hid": {}, "hid-item": {}, "HIDUsagePages": {}, "HIDUsages": {},
+              "CountryCodes": {}, "Languages": {}}
+    section = parent = child = None
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as file:
+            for line in file:
+                line = line.rstrip('\n')
+                if not line.strip() or line.startswith('#'):
+                    continue
+                if not line.startswith('\t'):
+                    child = None
+                    tag, _, rest = line.partition(' ')
+                    if _is_vendor(tag):
+                        section, parent = "vendor", int(tag, 16)
+                        vendors[parent] = rest.strip()
+                        continue
+                    code, _, name = rest.strip().partition(' ')
+                    name = name.strip()
+                    section = tag if tag in SECTIONS or tag in ("C", "HUT", "L") else None
+                    if section is None or not code:
+                        continue
+                    parent = int(code, 16)
+                    if section == "C":
+                        tables["Classes"][parent] = {"name": name, "subclass": {}}
+                    elif section == "HUT":
+                        tables["HIDUsagePages"][parent] = name
+                    elif section == "L":
+                        tables["Languages"][parent] = name
+                    else:
+                        tables[SECTIONS[section]][parent] = name
+                    continue
+
+                code, _, name = line.strip().partition(' ')
+                name = name.strip()
+                if section is None or not code:
+                    continue
+                if not line.startswith('\t\t'):
+                    if section == "vendor":
+                        products[(parent << 16) | int(code, 16)] = name
+                    elif section == "C":
+                        child = int(code, 16)
+                        tables["Classes"][parent]["subclass"][child] = {"name": name, "protocols": {}}
+                    elif section == "HUT":
+                        tables["HIDUsages"][(parent << 16) | int(code, 16)] = name
+                    elif section == "L":
+                        primary = tables["Languages"][parent]
+                        tables["Languages"][(int(code, 16) << 10) | parent] = f"{primary} ({name})"
+                elif section == "C" and child is not None:
+                    tables["Classes"][parent]["subclass"][child]["protocols"][int(code, 16)] = name
+                # Interfaces of products are not used by the visualizer
+    return vendors, products, tables
+
+def merge_hand_maintained(tables: dict, directory: str) -> dict:
+    '''Adds the tables of `classTables.py`, which take precedence over the `HCC` and `L` sections.'''
+    hand_maintained = runpy.run_path(os.path.join(directory, "classTables.py"))
+    merged = {name: table for name, table in tables.items() if name not in ("CountryCodes", "Languages")}
+    for name in HAND_MAINTAINED:
+        merged[name] = dict(hand_maintained[name])
+    for code, name in tables["CountryCodes"].items():
+        merged["CountryCodes"].setdefault(code, name)
+    for wLANGID, name in tables["Languages"].items():
+        if wLANGID not in merged["LANGIDs"]:
+            merged["LANGIDNames"].setdefault(wLANGID, name)
+    return merged
+
+def build_tables(directory: str = EXTRAS) -> dict:
+    '''All tables of `classes.py` by name, parsed from the split files in `directory`.'''
+    _, _, tables = parse(os.path.join(directory, source) for source in SECTION_FILES)
+    return merge_hand_maintained(tables, directory)
+
+def _crc32(path: str) -> int:
+    with open(path, 'rb') as f:
+        return zlib.crc32(f.read())
+
+def serialize_tables(tables: dict, directory: str, sources) -> bytes:
+    return marshal.dumps({
+        "version": FORMAT_VERSION,
+        "sources": {source: _crc32(os.path.join(directory, source)) for source in sources},
+        "tables": {name: marshal.dumps(table, MARSHAL_VERSION) for name, table in tables.items()},
+    }, MARSHAL_VERSION)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compile usb.ids into usbIDs.idx and classes.marshal")
+    parser.add_argument('usbids', nargs='?', default=None, help="Upstream usb.ids with every section (default: the split files in extras/)")
+    parser.add_argument('--output', default=EXTRAS, metavar='DIR', help="Directory to write the artifacts to (default: extras/)")
+    parser.add_argument('--check', action='store_true', help="Write nothing, exit with status 1 if an artifact in the output directory is out of date")
+    args = parser.parse_args()
+
+    if args.usbids:  # One upstream usb.ids with every section
+        inputs, sources = [args.usbids], ("classTables.py",)
+    else:
+        inputs, sources = [os.path.join(EXTRAS, "usbIDs")] + [os.path.join(EXTRAS, s) for s in SECTION_FILES], \
+            SECTION_FILES + ("classTables.py",)
+    vendors, products, tables = parse(inputs)
+    tables = merge_hand_maintained(tables, EXTRAS)
+
+    build_index = runpy.run_path(os.path.join(EXTRAS, "generateIndexFromUSBIDs.py"))["build_index"]
+    artifacts = {"usbIDs.idx": build_index(vendors, products), "classes.marshal": serialize_tables(tables, EXTRAS, sources)}
+    if args.check:
+        stale = []
+        for name, data in artifacts.items():
+            try:
+                with open(os.path.join(args.output, name), 'rb') as f:
+                    current = f.read()
+            except FileNotFoundError:
+                current = None
+            if current != data:
+                stale.append(name)
+        print(f"Out of date: {', '.join(stale)}" if stale else "All artifacts are up to date")
+        sys.exit(1 if stale else 0)
+
+    for name, data in artifacts.items():
+        with open(os.path.join(args.output, name), 'wb') as f:
+            f.write(data)
+    print(f"Wrote {len(vendors)} vendors and {len(products)} products to {os.path.join(args.output, 'usbIDs.idx')}")
+    print(f"Wrote {len(tables)} tables to {os.path.join(args.output, 'classes.marshal')}")
@@ -0,0 +1,56 @@
+# Copyright (c) 2025 Darshan P. All rights reserved.
+
+# This work is licensed under the terms of the MIT license.
+# For a copy, see <https://opensource.org/licenses/MIT>.
+
+'''
+Format of `usbIDs.idx`, the vendor/product lookup table used by `helpers.py`. `build_index` is called by
+`compileUSBIDs.py`, which parses usb.ids and writes the index together with the other lookup tables.
+
+The file is designed to be memory-mapped and searched in place. All integers are little-endian
+and every section starts on a 4-byte boundary:
+- Header `<4sHII` (padded to 16 bytes): magic `UIDX`, format version, number of vendors, number of products.
+- Vendor keys: sorted uint16 idVendor values.
+- Vendor offsets: uint32 offsets into the string heap, plus one trailing end offset.
+- Product keys: sorted uint32 `idVendor << 16 | idProduct` values.
+- Product offsets: uint32 offsets into the string heap, plus one trailing end offset.
+- String heap: UTF-8 names, stored in key order so name `i` spans `offsets[i]:offsets[i + 1]`.
+'''
+
+import struct
+import sys
+from array import array
+
+MAGIC = b"UIDX"
+VERSION = 2
+HEADER = struct.Struct("<4sHII")
+HEADER_SIZE = 16
+
+def _pad(buffer: bytearray):
+    buffer.extend(b"\0" * (-len(buffer) % 4))
+
+def _little_endian(values: array) -> bytes:
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+def build_index(vendors: dict, products: dict) -> bytes:
+    '''`vendors` maps idVendor and `products` maps `idVendor << 16 | idProduct` to names.'''
+    heap = bytearray()
+    sections = []
+    for table, key_type in ((vendors, 'H'), (products, 'I')):
+        keys = array(key_type, sorted(table))
+        offsets = array('I')
+        for key in keys:
+            offsets.append(len(heap))
+            heap.extend(table[key].encode('utf-8'))
+        offsets.append(len(heap))
+        sections += [keys, offsets]
+
+    out = bytearray(HEADER.pack(MAGIC, VERSION, len(vendors), len(products)))
+    _pad(out)
+    for section in sections:
+        out += _little_endian(section)
+        _pad(out)
+    return bytes(out + heap)
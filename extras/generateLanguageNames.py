@@ -0,0 +1,49 @@
+# Copyright (c) 2025 Darshan P. All rights reserved.
+
+# This work is licensed under the terms of the MIT license.
+# For a copy, see <https://opensource.org/licenses/MIT>.
+
+'''
+Regenerates the `LANGIDNames` table in `classTables.py`: the English name of every language tag in `LANGIDs`,
+resolved with Babel once here so the visualizer itself can look names up without loading Babel's locale data.
+Tags Babel does not know keep their tag as the name. Run it after editing `LANGIDs` (requires `babel`),
+then `compileUSBIDs.py`.
+'''
+
+import os
+import re
+import runpy
+import sys
+from babel import Locale
+
+def english_name(tag: str) -> str:
+    try:
+        return Locale.parse(tag.replace('-', '_').split(",")[0].strip()).english_name
+    except Exception:
+        return tag
+
+def build_table(langids: dict) -> str:
+    lines = ["LANGIDNames = {  # Generated by generateLanguageNames.py from LANGIDs, do not edit"]
+    for langid, tag in langids.items():
+        name = english_name(tag).replace('\\', '\\\\').replace('"', '\\"')
+        lines.append(f'    0x{langid:04X} : "{name}",')
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+if __name__ == "__main__":
+    here = os.path.dirname(os.path.abspath(__file__))
+    classes_file = sys.argv[1] if len(sys.argv) > 1 else os.path.join(here, 'classTables.py')
+    LANGIDs = runpy.run_path(classes_file)["LANGIDs"]
+
+    with open(classes_file, 'r', encoding='utf-8') as f:
+        source = f.read()
+    table = build_table(LANGIDs)
+    existing = re.compile(r'^LANGIDNames = \{.*?^\}\n', re.MULTILINE | re.DOTALL)
+    if existing.search(source):
+        source = existing.sub(lambda _: table, source, count=1)
+    else:  # First run: place the table right after LANGIDs
+        end = re.compile(r'^LANGIDs = \{.*?^\}\n', re.MULTILINE | re.DOTALL).search(source).end()
+        source = source[:end] + "\n" + table + source[end:]
+    with open(classes_file, 'w', encoding='utf-8') as f:
+        f.write(source)
+    print(f"Wrote {len(LANGIDs)} language names to {classes_file}")
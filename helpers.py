@@ -3,9 +3,20 @@
 # This work is licensed under the terms of the MIT license.  
 # For a copy, see <https://opensource.org/licenses/MIT>.
 
-from babel import Locale
-from extras.db import db
-from extras.classes import CountryCodes, DeviceCapabilityTypeCode
+import mmap
+import os
+import sys
+from array import array
+from bisect import bisect_left
+from struct import Struct
+from extras.classes import Classes, CountryCodes, DeviceCapabilityTypeCode, HIDUsagePages, HIDUsages, LANGIDs, LANGIDNames
+from hiditems import HIDItemPrefixes
+
+# Compiled vendor/product table, see extras/compileUSBIDs.py and extras/generateIndexFromUSBIDs.py
+USB_IDS_INDEX = os.path.join(os.path.dirname(os.path.abspath(__file__)), "extras", "usbIDs.idx")
+_HEADER = Struct("<4sHII")
+_HEADER_SIZE = 16
+_usb_ids = None  # Opened on first lookup
 
 def bcd_to_string(bcd_value: int) -> str:
     """
@@ -19,21 +30,112 @@ def bcd_to_string(bcd_value: int) -> str:
     return f"{(major >> 4)}{(major & 0xF)}.{(minor >> 4)}{(minor & 0xF)}"
 
 
+class USBIDIndex:
+    """
+    Read-only view of `usbIDs.idx`. The file is memory-mapped, so the OS page cache is shared
+    between every process doing lookups and nothing is copied into Python objects up front.
+    """
+    __slots__ = ("_map", "_heap", "vendor_keys", "vendor_offsets", "product_keys", "product_offsets")
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, n_vendors, n_products = _HEADER.unpack_from(self._map, 0)
+        if magic != b"UIDX" or version != 2:
+            raise ValueError(f"{path} is not a version 2 USB ID index")
+        view = memoryview(self._map)
+        offset = _HEADER_SIZE
+        sections = []
+        for typecode, count in (("H", n_vendors), ("I", n_vendors + 1), ("I", n_products), ("I", n_products + 1)):
+            size = count * (2 if typecode == "H" else 4)
+            section = view[offset:offset + size].cast(typecode)
+            if sys.byteorder != "little":
+                section = array(typecode, section)
+                section.byteswap()
+            sections.append(section)
+            offset += size + (-size % 4)
+        self.vendor_keys, self.vendor_offsets, self.product_keys, self.product_offsets = sections
+        self._heap = view[offset:]
+
+    def _find(self, keys, offsets, key: int):
+        i = bisect_left(keys, key)
+        if i < len(keys) and keys[i] == key:
+            return str(self._heap[offsets[i]:offsets[i + 1]], "utf-8")
+        return None
+
+    def vendor(self, idVendor: int):
+        return self._find(self.vendor_keys, self.vendor_offsets, idVendor)
+
+    def product(self, idVendor: int, idProduct: int):
+        return self._find(self.product_keys, self.product_offsets, (idVendor << 16) | idProduct)
+
+
+def _get_usb_ids() -> USBIDIndex:
+    global _usb_ids
+    if _usb_ids is None:
+        _usb_ids = USBIDIndex(USB_IDS_INDEX)
+    return _usb_ids
+
+
 def get_vendor_name(idVendor: int) -> str:
     """
     Returns vendor name from the database for given vendor ID.
     """
-    key = f"0x{idVendor:04x}"
-    return db.get(key, {}).get("name", f"Unknown Vendor (0x{idVendor:04x})")
+    name = _get_usb_ids().vendor(idVendor)
+    return name if name is not None else f"Unknown Vendor (0x{idVendor:04x})"
 
 
 def get_product_name(idVendor: int, idProduct: int) -> str:
     """
     Returns product name from the database for given vendor and product ID.
     """
-    vendor_key = f"0x{idVendor:04x}"
-    product_key = f"0x{idProduct:04x}"
-    return db.get(vendor_key, {}).get("devices", {}).get(product_key, {}).get("name", f"Unknown Product (0x{idProduct:04x})")
+    name = _get_usb_ids().product(idVendor, idProduct)
+    return name if name is not None else f"Unknown Product (0x{idProduct:04x})"
+
+
+def get_hid_usage_page_name(page: int):
+    """
+    Returns the name of a HID usage page, or None if it is not listed.
+    """
+    if page >= 0xFF00:
+        return "Vendor Defined"
+    return HIDUsagePages.get(page)
+
+
+def get_hid_usage_name(page: int, usage: int):
+    """
+    Returns the name of a usage on a HID usage page, or None if it is not listed.
+    """
+    name = HIDUsages.get((page << 16) | usage)
+    if name is None and usage:
+        if page == 0x09:
+            return f"Button {usage}"
+        if page == 0x0A:
+            return f"Instance {usage}"
+    return name
+
+
+def describe_hid_usage(usage: int) -> str:
+    """
+    Names an extended usage (page << 16 | usage), or formats it as hex if it is not listed.
+    """
+    name = get_hid_usage_name(usage >> 16, usage & 0xFFFF)
+    return name if name is not None else f"0x{usage & 0xFFFF:x}"
+
+
+def describe_report_field(field) -> str:
+    """
+    Formats the position and contents of one report field, e.g. "Bits 8-15: 1 x 8 bits, Variable: Direction-X".
+    """
+    text = f"Bits {field.bit_offset}-{field.bit_offset + field.bit_length - 1}: {field.count} x {field.bit_size} bits"
+    if field.constant:
+        return f"{text}, Constant"
+    text += ", Variable" if field.variable else ", Array"
+    if not field.usages:
+        return text
+    if len(field.usages) == 1:
+        return f"{text}: {describe_hid_usage(field.usages[0])}"
+    return f"{text}: {describe_hid_usage(field.usages[0])} .. {describe_hid_usage(field.usages[-1])}"
 
 
 def get_device_bcd_string(bcdDevice: int) -> str:
@@ -59,9 +161,114 @@ def decode_country_code(code):
         return f"Unknown (0x{code:02X})"
     
 def get_language_name(tag:str):
-    """Convert a language tag to its English name."""
+    """Convert a language tag to its English name. Needs Babel, which is only imported here."""
     try:
+        from babel import Locale
         locale = Locale.parse(tag.replace('-', '_').split(",")[0].strip())
         return locale.english_name
     except Exception:
-        return tag
\ No newline at end of file
+        return tag
+
+def get_langid_name(wLANGID:int):
+    """
+    Returns the English name of a USB language ID from the precomputed LANGIDNames table. IDs added to LANGIDs
+    without regenerating the table fall back to Babel.
+    """
+    name = LANGIDNames.get(wLANGID)
+    if name is None:
+        tag = LANGIDs.get(wLANGID)
+        return get_language_name(tag) if tag is not None else None
+    return name
+
+def get_class_names(bClass: int, bSubClass: int, bProtocol: int) -> tuple:
+    """
+    Returns (class, subclass, protocol) names from the Classes table, "Unknown" where not listed.
+    """
+    class_info = Classes.get(bClass, {})
+    subclass_info = class_info.get("subclass", {}).get(bSubClass, {})
+    return (class_info.get("name", "Unknown"), subclass_info.get("name", "Unknown"),
+            subclass_info.get("protocols", {}).get(bProtocol, "Unknown"))
+
+
+def describe_endpoint_attributes(bmAttributes: int) -> str:
+    """
+    Decodes endpoint bmAttributes, e.g. "Interrupt" or "Isochronous (Asynchronous, Data endpoint)".
+    """
+    transfer_type_str = ("Control", "Isochronous", "Bulk", "Interrupt")[bmAttributes & 0x03]
+    if bmAttributes & 0x03 == 1:  # Isochronous
+        sync_type_str = ("No Synchronization", "Asynchronous", "Adaptive", "Synchronous")[(bmAttributes >> 2) & 0x03]
+        usage_type_str = ("Data endpoint", "Feedback endpoint", "Implicit feedback Data endpoint", "Reserved")[(bmAttributes >> 4) & 0x03]
+        return f"{transfer_type_str} ({sync_type_str}, {usage_type_str})"
+    return transfer_type_str
+
+
+def describe_ss_companion_attributes(bmAttributes: int, transfer_type: int) -> str:
+    """
+    Decodes SuperSpeed Endpoint Companion bmAttributes, which depend on the parent endpoint's transfer type.
+    """
+    if transfer_type == 2:  # Bulk
+        return f"MaxStreams: {bmAttributes & 0x1F}"
+    elif transfer_type == 1:  # Isochronous
+        ssp = "SS+" if bmAttributes & 0x80 else "No SS+"
+        return f"Mult: {bmAttributes & 0x03}, {ssp}"
+    return f"0x{bmAttributes:02x} (Undecoded for type {transfer_type})"
+
+
+def _hid_main_item_flags(bits: int) -> str:
+    flags = [ "Constant" if bits & 0x01 else "Data",
+              "Variable" if bits & 0x02 else "Array",
+              "Relative" if bits & 0x04 else "Absolute",
+              "Wrap" if bits & 0x08 else "No Wrap",
+              "Non Linear" if bits & 0x10 else "Linear",
+              "No Preferred" if bits & 0x20 else "Preferred State",
+              "Null State" if bits & 0x40 else "No Null",
+              "Volatile" if bits & 0x80 else "Non Volatile",
+              "Buffered Bytes" if bits & 0x100 else "Bit Field"]
+    return ', '.join(f for f in flags if 'No ' not in f)
+
+# Input/Output/Feature flag strings for every combination of the nine defined bits
+HID_MAIN_ITEM_FLAGS = tuple(_hid_main_item_flags(bits) for bits in range(0x200))
+HID_COLLECTION_TYPES = {0: "Physical", 1: "Application", 2: "Logical", 3: "Report",
+                        4: "Named Array", 5: "Usage Switch", 6: "Usage Modifier"}
+
+def describe_hid_item(prefix: int, item_data: int) -> str:
+    """
+    Formats one HID report descriptor item, e.g. "Usage Page: 0x1" or "Input (Data, Variable, Absolute)".
+    """
+    size, item_type, tag, item_name = HIDItemPrefixes[prefix]
+    if item_type == 0:  # Main Items
+        if tag == 0x8 or tag == 0x9 or tag == 0xb:  # Input, Output, Feature
+            return f"{item_name} ({HID_MAIN_ITEM_FLAGS[item_data & 0x1FF]})"
+        elif tag == 0xa:  # Collection
+            return f"Collection ({HID_COLLECTION_TYPES.get(item_data, 'Vendor Defined')})"
+        elif tag == 0xc:  # End Collection
+            return "End Collection"
+    return f"{item_name}: 0x{item_data:x}"
+
+
+def describe_hid_items(items) -> list:
+    """
+    Formats the items of a report descriptor in order, naming usage pages and the usages of
+    Usage, Usage Minimum and Usage Maximum items from the current (pushed and popped) usage page.
+    """
+    texts = []
+    page, stack = 0, []
+    for prefix, item_data in items:
+        text = describe_hid_item(prefix, item_data)
+        item = prefix & 0xFC
+        if item == 0x04:  # Usage Page
+            page = item_data
+            name = get_hid_usage_page_name(page)
+        elif item == 0x08 or item == 0x18 or item == 0x28:  # Usage, Usage Minimum, Usage Maximum
+            if prefix & 0x03 == 3:  # A 4-byte usage carries its own page in the high word
+                name = get_hid_usage_name(item_data >> 16, item_data & 0xFFFF)
+            else:
+                name = get_hid_usage_name(page, item_data)
+        else:
+            if item == 0xA4:  # Push
+                stack.append(page)
+            elif item == 0xB4 and stack:  # Pop
+                page = stack.pop()
+            name = None
+        texts.append(text if name is None else f"{text} ({name})")
+    return texts
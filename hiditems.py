@@ -0,0 +1,31 @@
+# Copyright (c) 2025 Darshan P. All rights reserved.
+
+# This work is licensed under the terms of the MIT license.
+# For a copy, see <https://opensource.org/licenses/MIT>.
+
+'''
+HID report descriptor item prefixes (HID 1.11, 6.2.2.2), decoded once for all 256 byte values. Shared by the
+decoder (`descriptors.py`), the layout state machine (`reports.py`) and the item formatting in `helpers.py`,
+so that none of them has to import another just for this table.
+'''
+
+from typing import NamedTuple
+from extras.classes import More
+
+class HIDItemPrefix(NamedTuple):
+    '''What a report descriptor item prefix byte encodes, see `HIDItemPrefixes`.'''
+    size: int  # Data bytes following the prefix: 0, 1, 2 or 4
+    type: int  # 0:Main, 1:Global, 2:Local, 3:Reserved
+    tag: int
+    name: str
+
+def _hid_item_prefix(prefix: int) -> HIDItemPrefix:
+    if prefix == 0xFE:  # Long item, its size is in the following byte
+        return HIDItemPrefix(0, 3, 0xF, "Long Item")
+    # Item names are keyed on tag and type, the low two bits only give the data size
+    name = More["hid-item"].get(prefix & 0xFC, f"Unknown Tag 0x{prefix:02x}")
+    return HIDItemPrefix((0, 1, 2, 4)[prefix & 0x03], (prefix & 0x0C) >> 2, prefix >> 4, name)
+
+# Every possible prefix byte, decoded once
+HIDItemPrefixes = tuple(_hid_item_prefix(prefix) for prefix in range(256))
+HIDItemSizes = bytes(entry.size for entry in HIDItemPrefixes)
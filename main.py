@@ -6,10 +6,22 @@
 import tempfile
 import os
 import subprocess
-from graphviz import Digraph
-from processing import LoadHexArray, ProcessAndGenerateFlow, addWatermark
+import sys
+import time
+from functools import partial
+from typing import TYPE_CHECKING
+from processing import __version__, LoadHexArray, ProcessAndGenerateFlow, renderWatermarked
+from scheduler import RenderScheduler
+from cache import RenderCache
+from descriptors import ParseDescriptors, StreamDescriptors
+from export import DumpJSON, NodeToDict
+from readers import ReadDumps, HexChunks
+import json
 import argparse
 
+if TYPE_CHECKING:  # graphviz is only imported once something is rendered
+    from graphviz import Digraph
+
 def USBGetDescriptorVisualizer():
     '''
         ## `main`
@@ -22,6 +34,15 @@ def USBGetDescriptorVisualizer():
           - `data` (str, optional): Space-separated hex bytes from GET_DESCRIPTOR command.
           - `--save` (str, optional): Output filename (e.g., `output` saves as `output.png`). Defaults to `usb_descriptors.png`.
           - `--render` (flag): If set, opens visualization for viewing.
+          - `--batch` (paths, optional): Dump or capture files, or directories of them, to decode in one run. Each output is saved next to its input.
+          - `--input-format` (str, optional): Format of the `--batch` files: `hex`, `binary`, `multi`, `usbmon` or `pcap`. Auto-detected by default.
+          - `--decode-jobs` (int, optional): Number of processes decoding in parallel in batch mode (default 1).
+          - `--jobs` (int, optional): Number of GraphViz renders to run in parallel in batch mode. Defaults to the CPU count.
+          - `--cache` (str, optional): Directory of previously rendered outputs keyed on the descriptor bytes. Used by batch mode and `--save`.
+          - `--cache-size` (int, optional): Size limit of the cache directory in MB (default 512).
+          - `--stream` (flag): Decode `stdin` incrementally and print one NDJSON line per descriptor as soon as it is complete.
+          - `--serve` (str, optional): `[HOST:]PORT` to run the local HTTP decode/render server on, see `server.py`.
+          - `--format` (str, optional): `png` (default), `svg` or `pdf` for vector output, or `json`/`ndjson` to output the decoded descriptors without GraphViz.
 
         ### Behavior
         1. **Parse Arguments**: Uses `argparse` to handle `data`, `--save`, and `--render`.
@@ -31,7 +52,7 @@ def USBGetDescriptorVisualizer():
            - Assumes little-endian format.
         3. **Decode Descriptors**: Processes bytes into Standard, Audio Class, or HID Class USB descriptors.
         4. **Visualize**: Generates GraphViz graph showing descriptor hierarchy.
-        5. **Save Output**: Saves PNG to `--save` filename or `usb_descriptors.png`.
+        5. **Save Output**: Saves PNG (or SVG/PDF) to `--save` filename or `usb_descriptors.png`.
         6. **Render**: If `--render` is set, opens PNG for viewing.
 
         ### Returns
@@ -41,6 +62,11 @@ def USBGetDescriptorVisualizer():
         ```bash
         python3 main.py --save output --render  12 01 00 03 00 00 00 09 69 00 20 04 89 00 01 02 03 01  # Saves as output.png, displays
         cat usb_descriptors_dump.txt | python3 main.py  # Reads stdin, saves as usb_descriptors.png
+        python3 main.py --format json 12 01 00 03 00 00 00 09 69 00 20 04 89 00 01 02 03 01  # Prints decoded fields as JSON
+        python3 main.py --batch dumps/ --jobs 4  # Saves dumps/<name>.png for every dumps/<name>.txt
+        python3 main.py --format svg --save output  12 01 00 03 00 00 00 09 69 00 20 04 89 00 01 02 03 01  # Saves as output.svg
+        tail -c +0 -f descriptors.bin | python3 main.py --stream --input-format binary  # Prints each descriptor as it arrives
+        python3 main.py --batch enumeration.pcapng  # Saves enumeration_bus<N>-dev<M>.png for every device in the capture
         ```
     '''
     parser = argparse.ArgumentParser(description="""
@@ -55,8 +81,31 @@ def USBGetDescriptorVisualizer():
                                      The source code of this project is available on <https://github.com/thisisthedarshan/USB-GetDescriptor-Visualizer/>""")
     parser.add_argument('--save', type=str, nargs='?', default=None, help="Save output (defaults as usb_descriptors.png)")
     parser.add_argument('--render', action='store_true', help="Render and display output")
+    parser.add_argument('--batch', type=str, nargs='+', metavar='PATH', help="Decode every dump or capture file (or every *.txt, *.bin, *.pcap, *.pcapng in a directory) and save each output next to its input")
+    parser.add_argument('--input-format', type=str, default='auto', choices=['auto', 'hex', 'binary', 'multi', 'usbmon', 'pcap'], help="Format of the --batch files: hex text dumps, raw binary, multi-device dumps, usbmon text or pcap/pcapng captures (default auto-detects)")
+    parser.add_argument('--jobs', type=int, default=None, metavar='N', help="Number of parallel GraphViz renders in batch mode (defaults to the CPU count)")
+    parser.add_argument('--decode-jobs', type=int, default=1, metavar='N', help="Number of processes decoding dumps in parallel in batch mode (default 1)")
+    parser.add_argument('--cache', type=str, default=None, metavar='DIR', help="Reuse outputs of previously rendered descriptors from this directory (batch mode and --save)")
+    parser.add_argument('--cache-size', type=int, default=512, metavar='MB', help="Size limit of the --cache directory, least recently used outputs are evicted first (default 512)")
+    parser.add_argument('--format', type=str, default='png', choices=['png', 'svg', 'pdf', 'json', 'ndjson'], help="Output format. svg/pdf are vector images with the watermark as text, json/ndjson print the decoded descriptors without running GraphViz (default png)")
+    parser.add_argument('--serve', type=str, default=None, metavar='[HOST:]PORT', help="Run a local HTTP server that decodes and renders POSTed descriptors, sharing --cache and --jobs worker threads")
+    parser.add_argument('--stream', action='store_true', help="Decode stdin as it arrives and print one NDJSON line per descriptor (hex text, or raw bytes with --input-format binary)")
     parser.add_argument("data", nargs="*", help="Data to be processed")
     args = parser.parse_args()
+    cache = RenderCache(args.cache, args.cache_size * 1024 * 1024, __version__) if args.cache else None
+    if args.batch and args.format in ('json', 'ndjson'):
+        failures = exportBatch(args.batch, args.format, args.save, args.input_format, args.decode_jobs)
+        sys.exit(1 if failures else 0)
+    if args.batch:
+        failures = processBatch(args.batch, args.jobs, cache, args.input_format, args.decode_jobs, args.format)
+        sys.exit(1 if failures else 0)
+    if args.serve:
+        from server import Serve
+        Serve(args.serve, args.jobs, cache)
+        return
+    if args.stream:
+        streamDescriptors(args.input_format, args.save)
+        return
     # Get descriptors from args
     input_data = " ".join(args.data)
     if len(input_data) <= 9:
@@ -65,10 +114,24 @@ def USBGetDescriptorVisualizer():
         print("\n")
     descriptors = LoadHexArray(input_data)
 
-    dot = Digraph()  # Prepare an instance
+    if args.format in ('json', 'ndjson'):
+        text = DumpJSON(ParseDescriptors(descriptors), ndjson=args.format == 'ndjson')
+        if args.save is not None:
+            filename = (args.save if args.save != "" else "usb_descriptors") + "." + args.format
+            with open(filename, 'w', encoding='utf-8') as f:
+                f.write(text + "\n")
+            print(f"Saved as {filename}")
+        else:
+            print(text)
+        return
+
+    fmt = args.format
+    if cache is not None and args.save is not None and not args.render:
+        filename = args.save if args.save != "" else "usb_descriptors"
+        if cache.fetch(descriptors, fmt, f"{filename}.{fmt}"):
+            print(f"Saved as {filename}.{fmt} (from cache)")
+            return
 
-    dot.clear()  # Clear previous nodes
-    # Print debug descriptors
     dot = ProcessAndGenerateFlow(descriptors)
     
     # Check if passed through command line :)
@@ -80,43 +143,251 @@ def USBGetDescriptorVisualizer():
       print("3. Save and render")
       choice = input("Enter 1, 2, or 3: ")
       if choice == "1":
-            dot.render('usb_descriptors', format='png', cleanup=True)
-            addWatermark("usb_descriptors.png")
-            print("Saved as usb_descriptors.png")
+            renderToFile(dot, 'usb_descriptors', fmt=fmt)
+            print(f"Saved as usb_descriptors.{fmt}")
       elif choice == "2":
-            viewTemp(dot)
+            viewTemp(dot, fmt)
       elif choice == "3":
-            dot.render('usb_descriptors', format='png', view=True, cleanup=True)
-            addWatermark("usb_descriptors.png")
-            print("Saved as usb_descriptors.png and displayed")
+            renderToFile(dot, 'usb_descriptors', view=True, fmt=fmt)
+            print(f"Saved as usb_descriptors.{fmt} and displayed")
       else:
             print("Invalid choice, no action taken")
         
     # Perform actions based on arguments
     if args.save is not None and args.render:
         filename = args.save if args.save != "" else "usb_descriptors"
-        dot.render(filename, format='png', view=True, cleanup=True)
-        addWatermark(filename+".png")
-        print(f"Saved as {filename}.png and displayed")
+        renderToFile(dot, filename, view=True, fmt=fmt)
+        print(f"Saved as {filename}.{fmt} and displayed")
     elif args.save is not None:
         filename = args.save if args.save != "" else "usb_descriptors"
-        dot.render(filename, format='png', cleanup=True)
-        addWatermark(filename+".png")
-        print(f"Saved as {filename}.png")
+        output = renderToFile(dot, filename, fmt=fmt)
+        if cache is not None:
+            cache.store(descriptors, fmt, output)
+        print(f"Saved as {output}")
     elif args.render:
-        viewTemp(dot)
+        viewTemp(dot, fmt)
+
+def renderToFile(dot:'Digraph', filename:str, view:bool=False, fmt:str='png') -> str:
+    """
+    Renders `dot` to `<filename>.<fmt>` and returns the output path. The output is piped from GraphViz and
+    watermarked in memory, so the only disk access is the final write. PNGs get the raster strip, SVGs get
+    the watermark as text elements and PDFs as a graph label, so vector output is never rasterised.
+    """
+    output = f"{filename}.{fmt}"
+    data = renderWatermarked(dot, fmt)
+    with open(output, 'wb') as f:
+        f.write(data)
+    if view:
+        import graphviz
+        graphviz.view(output)
+    return output
+
+BATCH_EXTENSIONS = (".txt", ".bin", ".pcap", ".pcapng")
+
+def collectBatchInputs(paths:list) -> list:
+    """Expands directories to their dump and capture files (sorted) and keeps files as given."""
+    inputs = []
+    for path in paths:
+        if os.path.isdir(path):
+            inputs.extend(sorted(os.path.join(path, name) for name in os.listdir(path)
+                                 if name.endswith(BATCH_EXTENSIONS) and os.path.isfile(os.path.join(path, name))))
+        else:
+            inputs.append(path)
+    return inputs
+
+def readBatchInputs(inputs, input_format:str='auto'):
+    """
+    Yields `(path, label, descriptors, error)` for every descriptor chain in `inputs`. Captures hold one chain
+    per device, told apart by `label` (see `readers.ReadDumps`). A file that cannot be read yields a single
+    entry with the exception in `error`.
+    """
+    for path in inputs:
+        try:
+            for label, descriptors in ReadDumps(path, input_format):
+                yield path, label, descriptors, None
+        except Exception as e:
+            yield path, "", None, e
+
+def outputStem(path:str, label:str) -> str:
+    """Output path without extension: `<dump>` for plain dumps, `<capture>_<label>` for a device in a capture."""
+    stem = os.path.splitext(path)[0]
+    return f"{stem}_{label}" if label else stem
+
+class BatchItem:
+    """One descriptor chain moving through batch mode."""
+    __slots__ = ("path", "label", "output", "descriptors", "dot", "decode_seconds", "error", "cached")
+
+    def __init__(self, path:str, label:str="", fmt:str='png'):
+        self.path = path
+        self.label = label
+        self.output = f"{outputStem(path, label)}.{fmt}"
+        self.descriptors = None
+        self.dot = None
+        self.decode_seconds = 0.0
+        self.error = None
+        self.cached = False
+
+    @property
+    def source(self) -> str:
+        return f"{self.path} [{self.label}]" if self.label else self.path
+
+def readBatchItems(inputs, cache:RenderCache=None, input_format:str='auto', copy:bool=False, fmt:str='png'):
+    """
+    Lazily yields an undecoded `BatchItem` for every descriptor chain in `inputs`, serving cache hits on the way.
+    `copy` turns memory-mapped input into `bytes` so the item can be sent to a worker process.
+    """
+    start = time.perf_counter()
+    for path, label, descriptors, error in readBatchInputs(inputs, input_format):
+        item = BatchItem(path, label, fmt)
+        item.descriptors = bytes(descriptors) if copy and descriptors is not None else descriptors
+        item.error = error
+        if error is None and cache is not None:
+            try:
+                item.cached = cache.fetch(item.descriptors, fmt, item.output)
+            except Exception as e:
+                item.error = e
+        item.decode_seconds = time.perf_counter() - start
+        yield item
+        start = time.perf_counter()
+
+def decodeBatchItem(item:BatchItem) -> tuple:
+    """Decode job for `RenderScheduler`: returns the graph for an item (None if it failed to read or is cached) and the decode time."""
+    if item.error is not None or item.cached:
+        return None, 0.0
+    start = time.perf_counter()
+    dot = ProcessAndGenerateFlow(item.descriptors)
+    return dot, time.perf_counter() - start
+
+def decodeBatch(inputs, cache:RenderCache=None, input_format:str='auto', decode_jobs:int=1, fmt:str='png'):
+    """
+    Lazily yields a decoded `BatchItem` for every descriptor chain in `inputs`, in input order. Cache hits are
+    served here and skip decoding. With `decode_jobs` above 1 the chains are decoded on that many processes.
+    """
+    scheduler = RenderScheduler(decode_jobs, processes=decode_jobs > 1)
+    for item, future in scheduler.map(decodeBatchItem, readBatchItems(inputs, cache, input_format, copy=decode_jobs > 1, fmt=fmt)):
+        try:
+            item.dot, seconds = future.result()
+            item.decode_seconds += seconds
+        except Exception as e:
+            item.error = e
+        yield item
+
+def renderBatchItem(item:BatchItem, cache:RenderCache=None) -> float:
+    """Render job for `RenderScheduler`: saves the output next to the dump and returns the render time in seconds."""
+    if item.error is not None:
+        raise item.error
+    if item.cached:
+        return 0.0
+    start = time.perf_counter()
+    stem, ext = os.path.splitext(item.output)
+    renderToFile(item.dot, stem, fmt=ext[1:])
+    if cache is not None:
+        cache.store(item.descriptors, ext[1:], item.output)
+    item.dot = None  # Let the graph go as soon as it is rendered
+    return time.perf_counter() - start
+
+def processBatch(paths:list, jobs:int=None, cache:RenderCache=None, input_format:str='auto', decode_jobs:int=1, fmt:str='png') -> int:
+    """
+    Decodes every dump in `paths` on `decode_jobs` processes and renders them on a `RenderScheduler` with
+    `jobs` workers, saving `<dump>.<fmt>` next to each input. Dumps already in `cache` are copied from it.
+    Per-file timings are printed in input order as they complete. Returns the number of dumps that failed.
+    """
+    scheduler = RenderScheduler(jobs)
+    batch_start = time.perf_counter()
+    total = failures = 0
+    print(f"{'Decode (ms)':>11}  {'Render (ms)':>11}  Result")
+    for item, future in scheduler.map(partial(renderBatchItem, cache=cache), decodeBatch(collectBatchInputs(paths), cache, input_format, decode_jobs, fmt)):
+        total += 1
+        try:
+            render_seconds = future.result()
+            render_str = "cached" if item.cached else f"{render_seconds * 1000:.1f}"
+            print(f"{item.decode_seconds * 1000:>11.1f}  {render_str:>11}  {item.source} -> {item.output}")
+        except Exception as e:
+            failures += 1
+            print(f"{item.decode_seconds * 1000:>11.1f}  {'-':>11}  {item.source} failed: {e}")
+    print(f"\n{total} dumps in {time.perf_counter() - batch_start:.2f} s with {scheduler.jobs} jobs, {failures} failed")
+    if cache is not None:
+        print(cache.stats())
+    return failures
+
+def exportChain(entry:tuple, ndjson:bool=False) -> tuple:
+    """Export job for `RenderScheduler`: decodes one `readBatchInputs` entry to JSON text and returns it with the decode time."""
+    path, label, descriptors, error = entry
+    if error is not None:
+        raise error
+    start = time.perf_counter()
+    extra = {"source": path, "device": label} if label else {"source": path}
+    text = DumpJSON(ParseDescriptors(descriptors), ndjson=ndjson, **extra)
+    return text, time.perf_counter() - start
+
+def exportBatch(paths:list, fmt:str, save:str=None, input_format:str='auto', decode_jobs:int=1) -> int:
+    """
+    Decodes every dump in `paths` to JSON without rendering, on `decode_jobs` processes. `json` writes
+    `<dump>.json` next to each input. `ndjson` writes one line per dump to `save` (or stdout, with the summary
+    going to stderr). Returns the number of dumps that failed.
+    """
+    batch_start = time.perf_counter()
+    total = failures = 0
+    stream = open(save, 'w', encoding='utf-8') if fmt == 'ndjson' and save else sys.stdout
+    log = sys.stderr if fmt == 'ndjson' and stream is sys.stdout else sys.stdout
+    entries = readBatchInputs(collectBatchInputs(paths), input_format)
+    if decode_jobs > 1:  # Memory-mapped input cannot be sent to another process
+        entries = ((path, label, bytes(descriptors) if descriptors is not None else None, error)
+                   for path, label, descriptors, error in entries)
+    scheduler = RenderScheduler(decode_jobs, processes=decode_jobs > 1)
+    try:
+        for (path, label, _, _), future in scheduler.map(partial(exportChain, ndjson=fmt == 'ndjson'), entries):
+            total += 1
+            source = f"{path} [{label}]" if label else path
+            try:
+                text, seconds = future.result()
+                if fmt == 'ndjson':
+                    stream.write(text + "\n")
+                    result = "ok"
+                else:
+                    result = outputStem(path, label) + ".json"
+                    with open(result, 'w', encoding='utf-8') as f:
+                        f.write(text + "\n")
+                print(f"{seconds * 1000:>9.1f} ms  {source} -> {result}", file=log)
+            except Exception as e:
+                failures += 1
+                print(f"{'-':>9}     {source} failed: {e}", file=log)
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+    print(f"\n{total} dumps in {time.perf_counter() - batch_start:.2f} s, {failures} failed", file=log)
+    return failures
+
+def streamDescriptors(input_format:str='hex', save:str=None, chunk_size:int=4096):
+    """
+    Decodes `stdin` incrementally with `descriptors.StreamDescriptors` and writes one NDJSON line per descriptor
+    to `save` (or stdout) as soon as its bytes are complete. Every line is flushed, so the output can be tailed.
+    Only the current device/configuration/interface context is held, so memory stays constant however long the
+    stream is. Input is hex text unless `input_format` is `binary`.
+    """
+    if input_format == 'binary':
+        chunks = iter(lambda: sys.stdin.buffer.read1(chunk_size), b"")
+    else:
+        chunks = HexChunks(iter(lambda: sys.stdin.readline(chunk_size), ""))
+    stream = open(save, 'w', encoding='utf-8') if save else sys.stdout
+    try:
+        for node in StreamDescriptors(chunks):
+            stream.write(json.dumps(NodeToDict(node), ensure_ascii=False, separators=(",", ":")) + "\n")
+            stream.flush()
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
 
-def viewTemp(dot:Digraph):
+def viewTemp(dot:'Digraph', fmt:str='png'):
     with tempfile.NamedTemporaryFile(delete=False) as tmpfile:
         tmp_filename = tmpfile.name
-        dot.render(tmp_filename, format='png', view=True, cleanup=True)
-        addWatermark(tmp_filename+".png")
-        print(f"Rendered and displayed as {tmp_filename}.png")
+        output = renderToFile(dot, tmp_filename, view=True, fmt=fmt)
+        print(f"Rendered and displayed as {output}")
     # Spawn a process to delete the file after 5 minutes (300 seconds)
     if os.name == 'nt':  # Windows
-        subprocess.Popen(f'ping 127.0.0.1 -n 300 && del "{tmp_filename}.png"', shell=True)
+        subprocess.Popen(f'ping 127.0.0.1 -n 300 && del "{output}"', shell=True)
     else:  # Unix-like (Linux, macOS)
-        subprocess.Popen(f'sleep 300 && rm "{tmp_filename}.png"', shell=True)
+        subprocess.Popen(f'sleep 300 && rm "{output}"', shell=True)
 
 if __name__ == "__main__":
     USBGetDescriptorVisualizer()
\ No newline at end of file
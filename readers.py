@@ -0,0 +1,333 @@
+# Copyright (c) 2025 Darshan P. All rights reserved.
+
+# This work is licensed under the terms of the MIT license.
+# For a copy, see <https://opensource.org/licenses/MIT>.
+
+'''
+Input readers. Besides the space-separated hex text written by `dumpDescriptor.c`, descriptors can be read from
+raw binary files and pulled out of USB captures: usbmon text dumps (`/sys/kernel/debug/usb/usbmon/*u`) and
+pcap/pcapng files from Wireshark or tcpdump (Linux usbmon and Windows USBPcap link types).
+
+Captures are read one packet at a time in a single pass, so their size does not matter. Only the data stages
+of successful GET_DESCRIPTOR requests are kept, and they are grouped per device into the same kind of chain the
+dumper produces.
+'''
+
+import mmap
+import os
+import struct
+from typing import NamedTuple
+
+GET_DESCRIPTOR = 0x06
+DESCRIPTOR_REQUEST_TYPES = (0x80, 0x81)  # Device-to-host standard request to the device or an interface
+
+# pcap link types carrying USB traffic
+LINKTYPE_USB_LINUX = 189
+LINKTYPE_USB_LINUX_MMAPPED = 220
+LINKTYPE_USBPCAP = 249
+
+_USBMON_HEADER = {"<": struct.Struct("<QBBBBHbbqiiII8s"), ">": struct.Struct(">QBBBBHbbqiiII8s")}
+_USBPCAP_HEADER = struct.Struct("<HQIHBHHBBI")
+_SETUP = struct.Struct("<BBHHH")
+
+class GetDescriptorResponse(NamedTuple):
+    '''Data stage of one GET_DESCRIPTOR request seen in a capture.'''
+    bus: int
+    device: int
+    bDescriptorType: int
+    bDescriptorIndex: int
+    wIndex: int
+    data: bytes
+
+def CompleteDescriptors(data) -> bytes:
+    '''Cuts `data` after the last complete descriptor, dropping a truncated tail (short reads, 32-byte usbmon text limit).'''
+    end = 0
+    while end + 1 < len(data) and data[end] and end + data[end] <= len(data):
+        end += data[end]
+    return bytes(data[:end])
+
+def _response(bus, device, setup, data):
+    '''Builds a GetDescriptorResponse if `setup` is a GET_DESCRIPTOR whose data starts with the requested descriptor.'''
+    bmRequestType, bRequest, wValue, wIndex, _ = _SETUP.unpack(setup)
+    if bRequest != GET_DESCRIPTOR or bmRequestType not in DESCRIPTOR_REQUEST_TYPES:
+        return None
+    data = CompleteDescriptors(data)
+    # HID report descriptors have no bLength/bDescriptorType header and cannot be chained, skip them
+    if len(data) < 2 or data[1] != wValue >> 8:
+        return None
+    return GetDescriptorResponse(bus, device, wValue >> 8, wValue & 0xFF, wIndex, data)
+
+# usbmon text
+def ReadUsbmonText(lines):
+    '''
+        Yields a `GetDescriptorResponse` for every completed GET_DESCRIPTOR in usbmon text output (`u` or `t` format).
+        Note that the text interface shows at most 32 data bytes per URB, longer descriptors are cut at the last
+        complete descriptor. Capture through pcap for full data.
+    '''
+    pending = {}
+    for line in lines:
+        words = line.split()
+        if len(words) < 5 or not words[3].startswith("Ci:"):
+            continue
+        tag, event, address = words[0], words[2], words[3].split(":")
+        if len(address) == 4:  # u format: Ci:bus:device:endpoint
+            bus, device = int(address[1]), int(address[2])
+        else:  # t format: Ci:device:endpoint
+            bus, device = 0, int(address[1])
+        if event == "S":
+            if words[4] == "s" and len(words) >= 10:
+                pending[tag] = (bus, device, bytes.fromhex("".join(words[5:7])) + struct.pack(
+                    "<HHH", int(words[7], 16), int(words[8], 16), int(words[9], 16)))
+        elif event in ("C", "E"):
+            submission = pending.pop(tag, None)
+            if submission is None or event == "E" or "=" not in words:
+                continue
+            data = bytes.fromhex("".join(words[words.index("=") + 1:]))
+            response = _response(*submission, data)
+            if response is not None:
+                yield response
+
+# pcap / pcapng
+def _usbmon_packets(packet, linktype, order, pending):
+    header = _USBMON_HEADER[order]
+    if len(packet) < header.size:
+        return None
+    urb_id, event, xfer_type, epnum, devnum, busnum, flag_setup, flag_data, _, _, _, _, len_cap, setup = header.unpack_from(packet)
+    if xfer_type != 2 or not (epnum & 0x80):  # Control IN only
+        return None
+    offset = 64 if linktype == LINKTYPE_USB_LINUX_MMAPPED else 48
+    if event == ord("S"):
+        if flag_setup == 0:
+            pending[urb_id] = (busnum, devnum, setup)
+    elif event == ord("C"):
+        submission = pending.pop(urb_id, None)
+        if submission is not None and flag_data == 0:
+            return _response(*submission, packet[offset:offset + len_cap])
+    elif event == ord("E"):
+        pending.pop(urb_id, None)
+    return None
+
+def _usbpcap_packets(packet, pending):
+    if len(packet) < _USBPCAP_HEADER.size + 1:
+        return None
+    header_len, irp_id, status, _, info, bus, device, _, transfer, _ = _USBPCAP_HEADER.unpack_from(packet)
+    if transfer != 2:  # Control
+        return None
+    stage = packet[_USBPCAP_HEADER.size]
+    data = packet[header_len:]
+    if stage == 0 and not (info & 0x01) and len(data) >= 8:  # Setup stage, host to device
+        pending[irp_id] = (bus, device, bytes(data[:8]))
+    elif stage == 3 and (info & 0x01):  # Completion, device to host
+        submission = pending.pop(irp_id, None)
+        if submission is not None and status == 0:
+            return _response(*submission, data)
+    return None
+
+def _pcap_records(f, header):
+    magic = struct.unpack("<I", header[:4])[0]
+    if magic in (0xa1b2c3d4, 0xa1b23c4d):
+        order = "<"
+    elif magic in (0xd4c3b2a1, 0x4d3cb2a1):
+        order = ">"
+    else:
+        raise ValueError("not a pcap file")
+    linktype = struct.unpack(order + "I", header[20:24])[0] & 0x0FFFFFFF
+    record = struct.Struct(order + "IIII")
+    while True:
+        raw = f.read(record.size)
+        if len(raw) < record.size:
+            return
+        _, _, incl_len, _ = record.unpack(raw)
+        yield linktype, order, f.read(incl_len)
+
+def _pcapng_records(f, first):
+    order = "<"
+    linktypes = []
+    block = first
+    while True:
+        if len(block) < 8:
+            return
+        block_type = struct.unpack(order + "I", block[:4])[0]
+        if block_type == 0x0A0D0D0A:  # Section header, its byte-order magic sets the byte order for the section
+            magic = f.read(4)
+            order = "<" if magic == b"\x4d\x3c\x2b\x1a" else ">"
+            linktypes = []
+            total_length = struct.unpack(order + "I", block[4:8])[0]
+            body = magic + f.read(total_length - 12)
+        else:
+            total_length = struct.unpack(order + "I", block[4:8])[0]
+            body = f.read(total_length - 8)
+        if len(body) < total_length - 8:
+            return
+        if block_type == 0x00000001:  # Interface description
+            linktypes.append(struct.unpack_from(order + "H", body, 0)[0])
+        elif block_type == 0x00000006:  # Enhanced packet
+            interface_id, _, _, cap_len, _ = struct.unpack_from(order + "IIIII", body, 0)
+            if interface_id < len(linktypes):
+                yield linktypes[interface_id], order, body[20:20 + cap_len]
+        elif block_type == 0x00000003 and linktypes:  # Simple packet, always interface 0
+            yield linktypes[0], order, body[4:]
+        block = f.read(8)
+
+def ReadPcap(f):
+    '''Yields a `GetDescriptorResponse` for every completed GET_DESCRIPTOR in a pcap or pcapng stream opened in binary mode.'''
+    header = f.read(24)
+    if header[:4] == b"\x0a\x0d\x0d\x0a":
+        f.seek(-16, os.SEEK_CUR)  # Back to the end of the first block header
+        records = _pcapng_records(f, header[:8])
+    else:
+        records = _pcap_records(f, header)
+    pending = {}
+    for linktype, order, packet in records:
+        if linktype in (LINKTYPE_USB_LINUX, LINKTYPE_USB_LINUX_MMAPPED):
+            response = _usbmon_packets(packet, linktype, order, pending)
+        elif linktype == LINKTYPE_USBPCAP:
+            response = _usbpcap_packets(packet, pending)
+        else:
+            continue
+        if response is not None:
+            yield response
+
+def DeviceChains(responses):
+    '''
+        Groups GET_DESCRIPTOR responses into one descriptor chain per device and yields `(bus, device, bytes)`.
+
+        Repeated requests for the same descriptor (e.g. the 9-byte configuration header read before the full one)
+        keep only the longest response. Responses to address 0 are ignored since enumeration re-reads them after
+        SET_ADDRESS. When a different device descriptor shows up on an address that already has one (the address
+        was reused after an unplug), the previous device's chain is yielded right away, so only devices that are
+        currently being seen are held in memory.
+    '''
+    devices = {}
+    for response in responses:
+        if response.device == 0:
+            continue
+        address = (response.bus, response.device)
+        chain = devices.get(address)
+        key = (response.bDescriptorType, response.bDescriptorIndex, response.wIndex)
+        if chain is not None and response.bDescriptorType == 1 and key in chain and chain[key] != response.data \
+                and len(response.data) >= len(chain[key]):
+            yield address[0], address[1], b"".join(chain.values())
+            chain = None
+        if chain is None:
+            chain = devices[address] = {}
+        if len(response.data) > len(chain.get(key, b"")):
+            chain[key] = response.data
+    for (bus, device), chain in devices.items():
+        yield bus, device, b"".join(chain.values())
+
+# Multi-device dumps
+# `dumpDescriptor --all` writes every connected device to one file. Each device starts with a header line
+#   @device bus=1 port=1.4 address=5 vid=046d pid=c077
+# followed by its descriptor chain as hex bytes, exactly like a single-device dump. Lines starting with `#` are comments.
+def ReadMultiDeviceDump(lines):
+    '''Yields `(header, bytes)` for every device section, where `header` holds the `key=value` fields as strings.'''
+    header = None
+    words = []
+    for line in lines:
+        if line.startswith("@device"):
+            if header is not None:
+                yield header, bytes(int(word, 16) for word in words)
+            header = dict(field.split("=", 1) for field in line.split()[1:] if "=" in field)
+            words = []
+        elif not line.startswith("#") and header is not None:
+            words.extend(line.split())
+    if header is not None:
+        yield header, bytes(int(word, 16) for word in words)
+
+def DeviceLabel(header: dict) -> str:
+    '''File-name friendly label for a device section: `bus<N>-port<P>`, or `bus<N>-dev<M>` for root hubs.'''
+    if header.get("port", "-") != "-":
+        return f"bus{header.get('bus', 0)}-port{header['port']}"
+    return f"bus{header.get('bus', 0)}-dev{header.get('address', 0)}"
+
+# Whole files
+def ReadHex(path: str) -> bytes:
+    with open(path, 'r') as f:
+        return bytes(int(word, 16) for word in f.read().split())
+
+def ReadBinary(path: str):
+    '''
+        Memory-maps a raw binary descriptor dump. The returned memoryview can be passed straight to `ParseDescriptors`.
+        The memoryview owns the mapping: the file is closed on return, and the mapping is unmapped once the memoryview
+        and every slice taken from it are released. The map is not closed here, as closing a map that is still
+        exported raises `BufferError`.
+    '''
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return memoryview(b"")
+        return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+def HexChunks(chunks):
+    '''Converts chunks of hex text (`12 01` or `0x12 0x01`) to chunks of bytes, joining words split across chunks.'''
+    partial = ""
+    for chunk in chunks:
+        words = (partial + chunk).split()
+        # A word touching the end of the chunk may continue in the next one
+        partial = words.pop() if words and not chunk[-1:].isspace() else ""
+        if words:
+            yield bytes(int(word, 16) for word in words)
+    if partial:
+        yield bytes([int(partial, 16)])
+
+def DetectFormat(path: str) -> str:
+    '''Guesses `pcap`, `usbmon`, `multi`, `hex` or `binary` from the first bytes of `path`.'''
+    with open(path, 'rb') as f:
+        head = f.read(512)
+    if head[:4] in (b"\xd4\xc3\xb2\xa1", b"\xa1\xb2\xc3\xd4", b"\x4d\x3c\xb2\xa1", b"\xa1\xb2\x3c\x4d", b"\x0a\x0d\x0d\x0a"):
+        return "pcap"
+    try:
+        text = head.decode('ascii')
+    except UnicodeDecodeError:
+        return "binary"
+    if any(line.startswith("@device") for line in text.splitlines()):
+        return "multi"
+    words = text.split()
+    if len(words) > 3 and words[2] in ("S", "C", "E") and ":" in words[3]:
+        return "usbmon"
+    try:
+        # The last word may be cut off by the 512-byte read
+        if words and all(int(word, 16) <= 0xFF for word in words[:-1] or words):
+            return "hex"
+    except ValueError:
+        pass
+    return "binary"
+
+def _unique_labels(chains):
+    '''Appends `-2`, `-3`, ... to labels seen before, e.g. a device that re-enumerated or an address reused after an unplug.'''
+    seen = set()
+    for label, chain in chains:
+        unique, count = label, 1
+        while unique in seen:
+            count += 1
+            unique = f"{label}-{count}"
+        seen.add(unique)
+        yield unique, chain
+
+def ReadDumps(path: str, fmt: str = "auto"):
+    '''
+        Yields `(label, descriptors)` for every descriptor chain in `path`. Plain dumps (`hex`, `binary`) hold one
+        chain with an empty label; captures (`usbmon`, `pcap`) yield one chain per device labelled `bus<N>-dev<M>`
+        and multi-device dumps (`multi`) one per section labelled by `DeviceLabel`. Labels are unique within a
+        file: a label that repeats gets `-2`, `-3`, ... appended, so batch outputs never overwrite each other.
+    '''
+    yield from _unique_labels(_read_dumps(path, fmt))
+
+def _read_dumps(path: str, fmt: str):
+    if fmt == "auto":
+        fmt = DetectFormat(path)
+    if fmt == "hex":
+        yield "", ReadHex(path)
+    elif fmt == "binary":
+        yield "", ReadBinary(path)
+    elif fmt in ("usbmon", "pcap"):
+        with open(path, 'rb' if fmt == "pcap" else 'r') as f:
+            responses = ReadPcap(f) if fmt == "pcap" else ReadUsbmonText(f)
+            for bus, device, chain in DeviceChains(responses):
+                yield f"bus{bus}-dev{device}", chain
+    elif fmt == "multi":
+        with open(path, 'r') as f:
+            for header, chain in ReadMultiDeviceDump(f):
+                yield DeviceLabel(header), chain
+    else:
+        raise ValueError(f"Unknown input format: {fmt}")
@@ -0,0 +1,208 @@
+# Copyright (c) 2025 Darshan P. All rights reserved.
+
+# This work is licensed under the terms of the MIT license.
+# For a copy, see <https://opensource.org/licenses/MIT>.
+
+'''
+HID report layouts: runs the items of a report descriptor through the global/local item state machine of the
+HID specification (6.2.2) and computes where every field of every input, output and feature report sits.
+
+The result only holds integers and tuples, so it can be built once per device and reused to decode any number of
+reports captured from it.
+'''
+
+from typing import NamedTuple
+from hiditems import HIDItemPrefixes
+
+INPUT, OUTPUT, FEATURE = 0x8, 0x9, 0xB  # Main item tags
+ReportKinds = {INPUT: "Input", OUTPUT: "Output", FEATURE: "Feature"}
+
+class ReportField(NamedTuple):
+    '''`count` elements of `bit_size` bits each, starting `bit_offset` bits into the report (Report ID byte included).'''
+    bit_offset: int
+    bit_size: int
+    count: int
+    flags: int  # Data/Constant, Array/Variable, ... bits of the main item
+    logical_minimum: int
+    logical_maximum: int
+    usage_page: int
+    usages: tuple  # Extended usages (page << 16 | usage), one per element for variable fields
+
+    @property
+    def constant(self) -> bool:
+        return bool(self.flags & 0x01)
+
+    @property
+    def variable(self) -> bool:
+        return bool(self.flags & 0x02)
+
+    @property
+    def signed(self) -> bool:
+        return self.logical_minimum < 0
+
+    @property
+    def bit_length(self) -> int:
+        return self.bit_size * self.count
+
+    def usage(self, element: int) -> int:
+        '''Extended usage of one element of a variable field; the last usage repeats for the remaining elements.'''
+        if not self.usages:
+            return 0
+        return self.usages[min(element, len(self.usages) - 1)]
+
+class Report(NamedTuple):
+    '''One input, output or feature report.'''
+    kind: int  # INPUT, OUTPUT or FEATURE
+    report_id: int  # 0 when the descriptor declares no Report IDs
+    bit_length: int
+    fields: tuple  # ReportField
+
+    @property
+    def byte_length(self) -> int:
+        return (self.bit_length + 7) // 8
+
+class ReportLayout(NamedTuple):
+    '''All reports of a report descriptor, in the order they are first declared.'''
+    reports: tuple  # Report
+    numbered: bool  # Reports start with a Report ID byte
+
+    def report(self, kind: int = INPUT, report_id: int = 0):
+        for report in self.reports:
+            if report.kind == kind and report.report_id == report_id:
+                return report
+        return None
+
+def _signed(value: int, size: int) -> int:
+    bits = size * 8
+    if bits and value & (1 << (bits - 1)):
+        return value - (1 << bits)
+    return value
+
+def _usages(local: dict, count: int, variable: bool) -> tuple:
+    usages = local["usages"]
+    if local["minimum"] is not None and local["maximum"] is not None:
+        minimum, maximum = local["minimum"], local["maximum"]
+        if variable:  # Only the first `count` usages are ever assigned
+            maximum = min(maximum, minimum + max(count - len(usages), 0) - 1)
+        usages = usages + list(range(minimum, maximum + 1))
+    return tuple(usages)
+
+def ParseReportLayout(items) -> ReportLayout:
+    '''
+    ## ParseReportLayout
+
+    ### Description
+    Computes the layout of every report declared by a report descriptor. Global items (Usage Page, Logical
+    Minimum/Maximum, Report Size, Report ID, Report Count) persist until changed or popped, local items (Usage,
+    Usage Minimum/Maximum) apply to the next main item only. Each Input, Output or Feature item appends a field
+    to the report of its kind and current Report ID.
+
+    ### Parameters
+    - `items`: `HIDItem`s of a `ReportDescriptor` (its `items`), or any iterable of (prefix, data) pairs.
+
+    ### Returns
+    A `ReportLayout`.
+    '''
+    # Logical Minimum/Maximum are kept as (data, item size): whether the maximum is signed depends on the minimum,
+    # which may come after it, so both are only interpreted at the main item
+    global_state = {"page": 0, "logical_minimum": (0, 0), "logical_maximum": (0, 0), "size": 0, "report_id": 0, "count": 0}
+    stack = []
+    local = {"usages": [], "minimum": None, "maximum": None}
+    reports = {}  # (kind, report_id) -> [bit_length, fields]
+    numbered = False
+
+    for prefix, data in items:
+        size, item_type, tag, _ = HIDItemPrefixes[prefix]
+        if item_type == 0:  # Main
+            count, bit_size = global_state["count"], global_state["size"]
+            if tag in ReportKinds and count and bit_size:
+                report = reports.setdefault((tag, global_state["report_id"]), [8 if numbered else 0, []])
+                logical_minimum = _signed(*global_state["logical_minimum"])
+                # Unsigned unless the minimum is negative
+                logical_maximum = _signed(*global_state["logical_maximum"]) if logical_minimum < 0 \
+                    else global_state["logical_maximum"][0]
+                report[1].append(ReportField(report[0], bit_size, count, data, logical_minimum, logical_maximum,
+                                             global_state["page"], _usages(local, count, bool(data & 0x02))))
+                report[0] += bit_size * count
+            local = {"usages": [], "minimum": None, "maximum": None}
+        elif item_type == 1:  # Global
+            if tag == 0x0:
+                global_state["page"] = data
+            elif tag == 0x1:
+                global_state["logical_minimum"] = (data, size)
+            elif tag == 0x2:
+                global_state["logical_maximum"] = (data, size)
+            elif tag == 0x7:
+                global_state["size"] = data
+            elif tag == 0x8:
+                global_state["report_id"] = data
+                numbered = True
+            elif tag == 0x9:
+                global_state["count"] = data
+            elif tag == 0xA:
+                stack.append(dict(global_state))
+            elif tag == 0xB and stack:
+                global_state = stack.pop()
+        elif item_type == 2:  # Local
+            # Usages without a page of their own take the current Usage Page
+            usage = data if size == 4 else (global_state["page"] << 16) | data
+            if tag == 0x0:
+                local["usages"].append(usage)
+            elif tag == 0x1:
+                local["minimum"] = usage
+            elif tag == 0x2:
+                local["maximum"] = usage
+
+    return ReportLayout(tuple(Report(kind, report_id, bit_length, tuple(fields))
+                              for (kind, report_id), (bit_length, fields) in reports.items()), numbered)
+
+def DecodeReports(report: Report, data, stride: int = None) -> list:
+    '''
+    ## DecodeReports
+
+    ### Description
+    Decodes a buffer of captured reports of one layout in a single vectorised pass. Every field is cut out of all
+    reports at once with shifts and masks over a NumPy array, so the cost does not grow with Python-level work per
+    report. Requires NumPy.
+
+    ### Parameters
+    - `report`: `Report` from `ParseReportLayout`, e.g. `layout.report(reports.INPUT, 1)`.
+    - `data`: bytes-like buffer of back-to-back reports, or a 2-D `uint8` array with one report per row. Reports
+    include their Report ID byte when the layout is numbered; rows with a different ID are skipped.
+    - `stride`: Bytes per report in `data` (default `report.byte_length`), for captures padded to the packet size.
+    Ignored for 2-D arrays. A `ValueError` is raised if it, or the width of the rows, is less than `report.byte_length`.
+
+    ### Returns
+    One array of shape (reports, field.count) per field of `report`, in the same order. Fields of at most 31 bits
+    are `int32`, wider ones `int64`; fields with a negative logical minimum are sign-extended.
+    '''
+    import numpy as np
+
+    stride = stride or report.byte_length
+    if stride < report.byte_length:
+        raise ValueError(f"stride {stride} is shorter than the {report.byte_length} byte report")
+    rows = data if isinstance(data, np.ndarray) and data.ndim == 2 else np.frombuffer(data, dtype=np.uint8)
+    if rows.ndim == 1:
+        rows = rows[:len(rows) - len(rows) % stride].reshape(-1, stride)
+    elif rows.shape[1] < report.byte_length:
+        raise ValueError(f"rows of {rows.shape[1]} bytes are shorter than the {report.byte_length} byte report")
+    if report.report_id:
+        rows = rows[rows[:, 0] == report.report_id]
+
+    arrays = []
+    last = rows.shape[1] - 1
+    for field in report.fields:
+        if field.bit_size > 57:
+            raise ValueError(f"{field.bit_size} bit fields are too wide to decode")
+        offsets = field.bit_offset + np.arange(field.count, dtype=np.int64) * field.bit_size
+        first, shifts = offsets >> 3, (offsets & 7).astype(np.uint64)
+        # Gather the bytes each element spans; clipped indices only feed bits above the mask
+        value = np.zeros((rows.shape[0], field.count), dtype=np.uint64)
+        for k in range((7 + field.bit_size + 7) // 8):
+            value |= rows[:, np.minimum(first + k, last)].astype(np.uint64) << np.uint64(8 * k)
+        value = (value >> shifts) & np.uint64((1 << field.bit_size) - 1)
+        if field.signed:
+            value = value.view(np.int64)
+            value -= (value >> (field.bit_size - 1)) << field.bit_size
+        arrays.append(value.astype(np.int32 if field.bit_size <= 31 else np.int64, copy=False))
+    return arrays
@@ -0,0 +1,50 @@
+# Copyright (c) 2025 Darshan P. All rights reserved.
+
+# This work is licensed under the terms of the MIT license.
+# For a copy, see <https://opensource.org/licenses/MIT>.
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+class RenderScheduler:
+    '''
+        ## `RenderScheduler`
+
+        ### Description
+        Runs render jobs (GraphViz `dot` + watermarking) on a bounded thread pool. `dot` is a separate process,
+        so threads are enough to keep several layouts running at once.
+
+        ### Parameters
+        - `jobs` (int, optional): Number of worker threads. Defaults to the number of CPUs.
+        - `max_pending` (int, optional): Most jobs submitted but not yet reported. Defaults to `2 * jobs`.
+          Items are only pulled from the input once a slot frees up, so huge batches never hold more than
+          `max_pending` graphs in memory.
+        - `processes` (bool): Use worker processes instead of threads, for CPU-bound Python jobs such as decoding.
+          `func` and the items must then be picklable.
+    '''
+    def __init__(self, jobs: int = None, max_pending: int = None, processes: bool = False):
+        self.jobs = max(1, jobs or os.cpu_count() or 1)
+        self.max_pending = max(self.jobs, max_pending or 2 * self.jobs)
+        self.executor = ProcessPoolExecutor if processes else ThreadPoolExecutor
+
+    def map(self, func, items):
+        '''
+            Calls `func(item)` for every item in `items` on the pool and yields `(item, future)` pairs in input
+            order. Each future is already finished when yielded; call `future.result()` to get the value or
+            re-raise the job's exception.
+        '''
+        with self.executor(max_workers=self.jobs) as pool:
+            pending = deque()
+            for item in items:
+                if len(pending) >= self.max_pending:
+                    yield self._finish(pending.popleft())
+                pending.append((item, pool.submit(func, item)))
+            while pending:
+                yield self._finish(pending.popleft())
+
+    @staticmethod
+    def _finish(job):
+        item, future = job
+        future.exception()  # Waits for completion without raising
+        return item, future
@@ -0,0 +1,188 @@
+# Copyright (c) 2025 Darshan P. All rights reserved.
+
+# This work is licensed under the terms of the MIT license.
+# For a copy, see <https://opensource.org/licenses/MIT>.
+
+'''
+Local HTTP service (`main.py --serve`). One long-running interpreter keeps the vendor tables, GraphViz bindings
+and Pillow loaded, so a dashboard can decode and render every device that is plugged in without paying for Python
+startup each time. Only the standard library is used: `asyncio` accepts connections and parses requests, and the
+decoding and rendering run on a shared thread pool (GraphViz itself runs as a separate `dot` process per render).
+
+    POST /<format>   body: descriptor bytes as hex text, or raw bytes with `Content-Type: application/octet-stream`
+                     (or `?input=binary`). <format> is json, ndjson, dot, svg, png or pdf.
+    GET  /           service version, supported formats and cache statistics as JSON.
+
+Request bodies must carry a Content-Length; chunked transfer encoding is answered with 411.
+'''
+
+import asyncio
+import json
+import struct
+from urllib.parse import urlsplit, parse_qs
+from cache import RenderCache
+from descriptors import ParseDescriptors
+from export import DumpJSON
+from processing import __version__, LoadHexArray, RenderDescriptorTree, renderWatermarked
+from scheduler import RenderScheduler
+
+CONTENT_TYPES = {
+    "json": "application/json",
+    "ndjson": "application/x-ndjson",
+    "dot": "text/vnd.graphviz",
+    "svg": "image/svg+xml",
+    "png": "image/png",
+    "pdf": "application/pdf",
+}
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 411: "Length Required",
+           413: "Payload Too Large", 500: "Internal Server Error"}
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+def RenderPayload(descriptors: bytes, fmt: str) -> bytes:
+    '''
+    Decodes a descriptor chain and returns it in `fmt`, one of `CONTENT_TYPES`. Descriptors too short for their
+    type raise `HTTPError` 400, as they are the client's input and not a fault of the server.
+    '''
+    try:
+        tree = ParseDescriptors(descriptors)
+    except (struct.error, IndexError, ValueError) as e:
+        raise HTTPError(400, f"malformed descriptors: {e}")
+    if fmt in ('json', 'ndjson'):
+        return (DumpJSON(tree, ndjson=fmt == 'ndjson') + "\n").encode()
+    dot = RenderDescriptorTree(tree)
+    if fmt == 'dot':
+        return dot.source.encode()
+    return renderWatermarked(dot, fmt)
+
+class DescriptorServer:
+    '''
+        ## `DescriptorServer`
+
+        ### Description
+        Serves decode and render requests over HTTP/1.1 with keep-alive. Requests are handled concurrently: each
+        connection is an `asyncio` task and the work itself runs on one thread pool shared by all of them, sized
+        like `RenderScheduler`. Outputs are looked up in and added to the same `RenderCache` the command line uses.
+
+        ### Parameters
+        - `jobs` (int, optional): Worker threads for decoding and rendering. Defaults to the number of CPUs.
+        - `cache` (RenderCache, optional): Cache of finished outputs, shared with `--batch` and `--save`.
+        - `max_body` (int): Largest accepted request body in bytes.
+    '''
+    def __init__(self, jobs: int = None, cache: RenderCache = None, max_body: int = 16 * 1024 * 1024):
+        scheduler = RenderScheduler(jobs)
+        self.jobs = scheduler.jobs
+        self.pool = scheduler.executor(max_workers=self.jobs)
+        self.cache = cache
+        self.max_body = max_body
+        self.requests = 0
+
+    def respond(self, descriptors: bytes, fmt: str) -> bytes:
+        '''Runs on the pool: serves a cached output or renders and stores it.'''
+        if self.cache is not None:
+            data = self.cache.get(descriptors, fmt)
+            if data is not None:
+                return data
+        data = RenderPayload(descriptors, fmt)
+        if self.cache is not None:
+            self.cache.put(descriptors, fmt, data)
+        return data
+
+    def status(self) -> bytes:
+        document = {"version": __version__, "formats": list(CONTENT_TYPES), "jobs": self.jobs, "requests": self.requests}
+        if self.cache is not None:
+            document["cache"] = {"hits": self.cache.hits, "misses": self.cache.misses, "evictions": self.cache.evictions}
+        return (json.dumps(document) + "\n").encode()
+
+    async def handle_request(self, method: str, target: str, headers: dict, body: bytes) -> tuple:
+        '''Returns (status, content type, body) for one request.'''
+        url = urlsplit(target)
+        if url.path == "/":
+            if method != "GET":
+                raise HTTPError(405, "use GET")
+            return 200, CONTENT_TYPES["json"], self.status()
+        fmt = url.path.strip("/")
+        if fmt not in CONTENT_TYPES:
+            raise HTTPError(404, f"unknown format {fmt!r}, expected one of {', '.join(CONTENT_TYPES)}")
+        if method != "POST":
+            raise HTTPError(405, "send descriptors with POST")
+        binary = parse_qs(url.query).get("input", [""])[0] == "binary" or \
+            headers.get("content-type", "").startswith("application/octet-stream")
+        try:
+            descriptors = body if binary else LoadHexArray(body.decode("ascii"))
+        except (UnicodeDecodeError, ValueError) as e:
+            raise HTTPError(400, f"body is not space-separated hex: {e}")
+        if not descriptors:
+            raise HTTPError(400, "no descriptor bytes")
+        data = await asyncio.get_running_loop().run_in_executor(self.pool, self.respond, descriptors, fmt)
+        return 200, CONTENT_TYPES[fmt], data
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                keep_alive = headers.get("connection", "").lower() != "close"
+                try:
+                    try:
+                        method, target, _ = request_line.decode("latin-1").split()
+                        length = int(headers.get("content-length", 0))
+                        if length < 0:
+                            raise ValueError(length)
+                    except ValueError:
+                        keep_alive = False
+                        raise HTTPError(400, "malformed request line or Content-Length")
+                    if "transfer-encoding" in headers:
+                        keep_alive = False  # The body cannot be framed, so the connection cannot be reused
+                        raise HTTPError(411, "Transfer-Encoding is not supported, send the body with Content-Length")
+                    if length > self.max_body:
+                        keep_alive = False  # The body is not read, so the connection cannot be reused
+                        raise HTTPError(413, f"body is larger than {self.max_body} bytes")
+                    body = await reader.readexactly(length) if length else b""
+                    self.requests += 1
+                    status, content_type, data = await self.handle_request(method, target, headers, body)
+                except HTTPError as e:
+                    status, content_type, data = e.status, "text/plain", f"{e}\n".encode()
+                except asyncio.IncompleteReadError:
+                    raise  # The client went away mid-body
+                except Exception as e:
+                    status, content_type, data = 500, "text/plain", f"{type(e).__name__}: {e}\n".encode()
+                writer.write(f"HTTP/1.1 {status} {REASONS[status]}\r\nContent-Type: {content_type}\r\n"
+                             f"Content-Length: {len(data)}\r\nConnection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + data)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host: str, port: int):
+        server = await asyncio.start_server(self.handle_connection, host, port)
+        for sock in server.sockets:
+            address = sock.getsockname()
+            print(f"Serving on http://{address[0]}:{address[1]}/ with {self.jobs} jobs")
+        async with server:
+            await server.serve_forever()
+
+def Serve(address: str, jobs: int = None, cache: RenderCache = None):
+    '''Runs a `DescriptorServer` on `address` (`PORT` or `HOST:PORT`, localhost by default) until interrupted.'''
+    host, _, port = address.rpartition(":")
+    server = DescriptorServer(jobs, cache)
+    try:
+        asyncio.run(server.serve(host or "127.0.0.1", int(port)))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.pool.shutdown(cancel_futures=True)
@@ -0,0 +1,37 @@
+# Copyright (c) 2025 Darshan P. All rights reserved.
+
+# This work is licensed under the terms of the MIT license.
+# For a copy, see <https://opensource.org/licenses/MIT>.
+
+import os
+import shutil
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from extras import classes
+
+def _use_copy(tmp_path, monkeypatch):
+    '''Points extras.classes at a copy of the extras folder with no tables loaded yet.'''
+    for name in os.listdir(classes.EXTRAS):
+        if os.path.isfile(os.path.join(classes.EXTRAS, name)):
+            shutil.copy(os.path.join(classes.EXTRAS, name), tmp_path)
+    monkeypatch.setattr(classes, "EXTRAS", str(tmp_path))
+    monkeypatch.setattr(classes, "COMPILED_TABLES", str(tmp_path / "classes.marshal"))
+    monkeypatch.setattr(classes, "GENERATOR", str(tmp_path / "compileUSBIDs.py"))
+    monkeypatch.setattr(classes, "_blobs", None)
+    monkeypatch.setattr(classes, "_sources", None)
+
+def test_compiled_tables_are_used(tmp_path, monkeypatch):
+    _use_copy(tmp_path, monkeypatch)
+    assert classes._load_blobs()
+
+def test_same_size_edit_is_stale(tmp_path, monkeypatch):
+    _use_copy(tmp_path, monkeypatch)
+    source = tmp_path / "usbHIDClasses"
+    source.write_bytes(source.read_bytes().replace(b"Report", b"REPORT", 1))  # Same size, new content
+    with pytest.warns(RuntimeWarning, match="usbHIDClasses changed"):
+        assert classes._load_blobs() == {}
+    assert classes._load("hid")[0x22] == "REPORT"
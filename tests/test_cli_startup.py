@@ -0,0 +1,19 @@
+# Copyright (c) 2025 Darshan P. All rights reserved.
+
+# This work is licensed under the terms of the MIT license.
+# For a copy, see <https://opensource.org/licenses/MIT>.
+
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+import cliStartup
+
+def test_startup_within_baseline():
+    with open(cliStartup.BASELINE, encoding='utf-8') as f:
+        baseline = json.load(f)
+    # Same thresholds as benchmarks/cliStartup.py --check
+    problems = cliStartup.compare(cliStartup.measure(runs=15), baseline, tolerance=1.25, slack=10.0)
+    assert not problems, "; ".join(problems)
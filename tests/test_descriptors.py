@@ -0,0 +1,45 @@
+# Copyright (c) 2025 Darshan P. All rights reserved.
+
+# This work is licensed under the terms of the MIT license.
+# For a copy, see <https://opensource.org/licenses/MIT>.
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from descriptors import DescriptorDecoder, ParseDescriptors
+
+# Device, configuration, interface, HID and endpoint descriptors of a mouse
+MOUSE = bytes.fromhex("12 01 00 02 00 00 00 40 6d 04 77 c0 00 01 01 02 00 01 09 02 22 00 01 01 00 a0 32 "
+                      "09 04 00 00 01 03 01 02 00 09 21 11 01 00 01 22 34 00 07 05 81 03 08 00 0a")
+
+def test_feed_after_stopping_early():
+    decoder = DescriptorDecoder()
+    for first in decoder.feed(MOUSE[:30]):
+        break
+    assert first.index == 0
+    assert decoder.pending == 3  # The start of the interface descriptor
+
+    rest = list(decoder.feed(MOUSE[30:]))
+    assert [node.index for node in rest] == [2, 3, 4]
+    expected = ParseDescriptors(MOUSE).nodes[2:]
+    assert [type(node.record) for node in rest] == [type(node.record) for node in expected]
+    assert decoder.pending == 0
+
+def test_closed_generator_releases_buffer():
+    decoder = DescriptorDecoder()
+    stream = decoder.feed(MOUSE[:20])
+    next(stream)
+    stream.close()
+    assert [node.index for node in decoder.feed(MOUSE[20:])] == [1, 2, 3, 4]
+
+def test_one_byte_descriptor_is_unknown():
+    # bLength 1 has no room for a type: the next byte is shown as one and framing goes on from it
+    for data in (bytes([9, 4, 0, 0, 0, 3, 1, 2, 0, 1, 9, 4]), bytes([1, 0x21, 0, 0])):
+        parsed = [type(node.record).__name__ for node in ParseDescriptors(data).nodes]
+        fed = [type(node.record).__name__ for node in DescriptorDecoder().feed(data)]
+        assert parsed == fed
+        assert parsed[-1] == "UnknownDescriptor"
+    node = ParseDescriptors(bytes([1, 0x21, 0, 0])).nodes[0]
+    assert node.record.message == "Unknown Descriptor Type: 0x21"
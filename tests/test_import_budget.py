@@ -0,0 +1,33 @@
+# Copyright (c) 2025 Darshan P. All rights reserved.
+
+# This work is licensed under the terms of the MIT license.
+# For a copy, see <https://opensource.org/licenses/MIT>.
+
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+from importBudget import HEAVY
+
+BUDGET_MS = 150.0  # Default of benchmarks/importBudget.py --check
+MODULES = ("descriptors", "export")
+
+def test_decode_modules_stay_light():
+    code = f"import {', '.join(MODULES)}, sys; print(','.join(m for m in {HEAVY!r} if m in sys.modules))"
+    subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True)  # Warm up the bytecode cache
+    out = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=ROOT, capture_output=True,
+                         text=True, check=True)
+    assert out.stdout.strip() == "", f"decoding imports {out.stdout.strip()}"
+
+    # -X importtime writes "import time: self [us] | cumulative | name", nested imports indented under the name
+    cumulative = {}
+    for line in out.stderr.splitlines():
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2].strip() in MODULES and not fields[2].startswith("  "):
+            cumulative[fields[2].strip()] = int(fields[1]) / 1000
+    assert set(cumulative) == set(MODULES)
+    total = sum(cumulative.values())
+    assert total <= BUDGET_MS, f"import {', '.join(MODULES)} took {total:.1f} ms, budget {BUDGET_MS:.0f} ms"
@@ -0,0 +1,123 @@
+# Copyright (c) 2025 Darshan P. All rights reserved.
+
+# This work is licensed under the terms of the MIT license.
+# For a copy, see <https://opensource.org/licenses/MIT>.
+
+import io
+import os
+import struct
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from readers import (LINKTYPE_USB_LINUX, LINKTYPE_USB_LINUX_MMAPPED, LINKTYPE_USBPCAP, CompleteDescriptors,
+                     DeviceChains, ReadDumps, ReadPcap, ReadUsbmonText)
+
+MOUSE = "12 01 00 02 00 00 00 40 6d 04 77 c0 00 01 01 02 00 01"
+KEYBOARD = "12 01 00 02 00 00 00 40 6d 04 1c c3 00 01 01 02 00 01"
+
+def test_reused_address_gets_unique_labels(tmp_path):
+    dump = tmp_path / "devices.txt"
+    dump.write_text(f"@device bus=1 port=- address=5\n{MOUSE}\n"
+                    f"@device bus=1 port=- address=5\n{KEYBOARD}\n"
+                    f"@device bus=1 port=- address=5\n{MOUSE}\n")
+    chains = list(ReadDumps(str(dump)))
+    assert [label for label, _ in chains] == ["bus1-dev5", "bus1-dev5-2", "bus1-dev5-3"]
+    assert chains[1][1] == bytes.fromhex(KEYBOARD)
+
+# Synthetic captures: every format carries the same enumeration traffic
+DEVICE = bytes.fromhex(MOUSE)
+OTHER_DEVICE = bytes.fromhex(KEYBOARD)
+CONFIGURATION = bytes.fromhex("09 02 22 00 01 01 00 a0 32 09 04 00 00 01 03 01 02 00 09 21 11 01 00 01 22 34 00 "
+                              "07 05 81 03 08 00 0a")
+
+def _get_descriptor(wValue: int, wLength: int) -> bytes:
+    return struct.pack("<BBHHH", 0x80, 0x06, wValue, 0, wLength)
+
+# (URB id, bus, device, setup, data) of every GET_DESCRIPTOR
+TRAFFIC = [
+    (1, 1, 0, _get_descriptor(0x0100, 64), DEVICE),  # Before SET_ADDRESS, ignored
+    (2, 1, 5, _get_descriptor(0x0100, 18), DEVICE),
+    (3, 1, 6, _get_descriptor(0x0100, 18), OTHER_DEVICE),
+    (4, 1, 5, _get_descriptor(0x0200, 9), CONFIGURATION[:9]),
+    (5, 1, 5, _get_descriptor(0x0200, 34), CONFIGURATION),  # Longer, replaces the 9-byte read
+    (6, 1, 5, _get_descriptor(0x0200, 9), CONFIGURATION[:9]),  # Shorter, ignored
+    (7, 1, 5, _get_descriptor(0x0100, 18), OTHER_DEVICE),  # Address 5 reused by another device
+]
+# Submissions (S) and completions (C) by URB id, URB 3 completes before URB 2
+SEQUENCE = "S1 C1 S2 S3 C3 C2 S4 C4 S5 C5 S6 C6 S7 C7".split()
+
+def _events():
+    '''Yields ('S' or 'C', URB id, bus, device, setup, data) in capture order.'''
+    by_urb = {entry[0]: entry for entry in TRAFFIC}
+    for step in SEQUENCE:
+        yield (step[0], *by_urb[int(step[1:])])
+
+def _chains(responses) -> list:
+    return list(DeviceChains(responses))
+
+def _expected(limit: int = None) -> list:
+    configuration = CompleteDescriptors(CONFIGURATION[:limit]) if limit else CONFIGURATION
+    # The first device on address 5 is yielded as soon as the address is reused, the others at the end
+    return [(1, 5, DEVICE + configuration), (1, 6, OTHER_DEVICE), (1, 5, OTHER_DEVICE)]
+
+def _usbmon_packet(order: str, linktype: int, event: str, urb: int, bus: int, device: int, setup: bytes, data: bytes) -> bytes:
+    header = struct.pack(order + "QBBBBHbbqiiII8s", urb, ord(event), 2, 0x80, device, bus,
+                         0 if event == "S" else ord("-"), 0 if data else ord("<"), 0, 0, 0, len(data), len(data), setup)
+    if linktype == LINKTYPE_USB_LINUX_MMAPPED:
+        header += bytes(16)  # interval, start_frame, xfer_flags, ndesc
+    return header + data
+
+def _pcap(order: str, linktype: int, packets) -> bytes:
+    out = struct.pack(order + "IHHiIII", 0xa1b2c3d4, 2, 4, 0, 0, 65535, linktype)
+    for packet in packets:
+        out += struct.pack(order + "IIII", 0, 0, len(packet), len(packet)) + packet
+    return out
+
+def _pcapng_block(block_type: int, body: bytes) -> bytes:
+    body += bytes(-len(body) % 4)
+    return struct.pack("<II", block_type, len(body) + 12) + body + struct.pack("<I", len(body) + 12)
+
+def _usbpcap_packet(event: str, urb: int, bus: int, device: int, setup: bytes, data: bytes) -> bytes:
+    # Setup stage from the host, then completion from the device, both on the control endpoint
+    info, stage, payload = (0, 0, setup) if event == "S" else (1, 3, data)
+    return struct.pack("<HQIHBHHBBIB", 28, urb, 0, 0x0B, info, bus, device, 0x80, 2, len(payload), stage) + payload
+
+@pytest.mark.parametrize("linktype, order", [(LINKTYPE_USB_LINUX, "<"), (LINKTYPE_USB_LINUX_MMAPPED, ">")])
+def test_pcap_usbmon(linktype, order):
+    capture = _pcap(order, linktype, (_usbmon_packet(order, linktype, *event) for event in _events()))
+    assert _chains(ReadPcap(io.BytesIO(capture))) == _expected()
+
+def test_pcap_usbpcap():
+    capture = _pcap("<", LINKTYPE_USBPCAP, (_usbpcap_packet(*event) for event in _events()))
+    assert _chains(ReadPcap(io.BytesIO(capture))) == _expected()
+
+def test_pcapng():
+    capture = _pcapng_block(0x0A0D0D0A, struct.pack("<IHHq", 0x1A2B3C4D, 1, 0, -1))
+    capture += _pcapng_block(0x00000001, struct.pack("<HHI", LINKTYPE_USB_LINUX, 0, 65535))
+    for event in _events():
+        packet = _usbmon_packet("<", LINKTYPE_USB_LINUX, *event)
+        capture += _pcapng_block(0x00000006, struct.pack("<IIIII", 0, 0, 0, len(packet), len(packet)) + packet)
+    assert _chains(ReadPcap(io.BytesIO(capture))) == _expected()
+
+def test_usbmon_text():
+    lines = []
+    for event, urb, bus, device, setup, data in _events():
+        address = f"Ci:{bus}:{device:03d}:0"
+        if event == "S":
+            bmRequestType, bRequest, wValue, wIndex, wLength = struct.unpack("<BBHHH", setup)
+            lines.append(f"{urb:016x} 0 S {address} s {bmRequestType:02x} {bRequest:02x} {wValue:04x} {wIndex:04x} {wLength:04x} {wLength} <")
+        else:
+            shown = data[:32]  # The text interface shows at most 32 bytes
+            words = " ".join(shown[i:i + 4].hex() for i in range(0, len(shown), 4))
+            lines.append(f"{urb:016x} 0 C {address} 0 {len(data)} = {words}")
+    assert _chains(ReadUsbmonText(lines)) == _expected(limit=32)
+
+def test_binary_dump_outlives_its_file(tmp_path):
+    dump = tmp_path / "mouse.bin"
+    dump.write_bytes(DEVICE)
+    (label, view), = ReadDumps(str(dump), "binary")
+    assert label == "" and bytes(view) == DEVICE
+    view.release()
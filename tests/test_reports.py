@@ -0,0 +1,84 @@
+# Copyright (c) 2025 Darshan P. All rights reserved.
+
+# This work is licensed under the terms of the MIT license.
+# For a copy, see <https://opensource.org/licenses/MIT>.
+
+import os
+import random
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+from descriptors import ParseReportDescriptor
+from hidReportArrays import MOUSE, decode_python
+from reports import FEATURE, INPUT, DecodeReports, ParseReportLayout
+
+# Boot protocol mouse: 3 buttons, 5 bits of padding, X and Y from -127 to 127
+BOOT_MOUSE = bytes.fromhex("05 01 09 02 a1 01 09 01 a1 00 05 09 19 01 29 03 15 00 25 01 95 03 75 01 81 02 "
+                           "95 01 75 05 81 01 05 01 09 30 09 31 15 81 25 7f 75 08 95 02 81 06 c0 c0")
+
+GAMEPAD = bytes.fromhex(
+    "05 01 09 05 a1 01 85 01"
+    " 05 09 19 01 29 08 15 00 25 01 75 01 95 08 81 02"  # 8 buttons
+    " a4 05 01 09 30 09 31 15 81 25 7f 75 08 95 02 81 02"  # Pushed: X and Y from -127 to 127
+    " 85 02 25 ff 15 00 95 01 b1 02"  # Feature report 2: Logical Maximum 255 given before the Minimum
+    " b4 75 08 95 01 81 03"  # Popped back to report 1 and the buttons' state, no usages of its own
+    " c0")
+
+def layout(descriptor: bytes):
+    return ParseReportLayout(ParseReportDescriptor(descriptor).items)
+
+def test_boot_mouse():
+    mouse = layout(BOOT_MOUSE)
+    assert not mouse.numbered
+    report = mouse.report(INPUT)
+    buttons, padding, axes = report.fields
+    assert (buttons.bit_offset, buttons.bit_size, buttons.count) == (0, 1, 3)
+    assert buttons.usages == (0x90001, 0x90002, 0x90003) and not buttons.signed
+    assert padding.constant and (padding.bit_offset, padding.bit_length) == (3, 5)
+    assert (axes.bit_offset, axes.bit_size, axes.count) == (8, 8, 2)
+    assert (axes.logical_minimum, axes.logical_maximum) == (-127, 127) and axes.signed
+    assert axes.usages == (0x10030, 0x10031)
+    assert report.byte_length == 3
+
+def test_gamepad_report_ids_and_push_pop():
+    gamepad = layout(GAMEPAD)
+    assert gamepad.numbered
+    buttons, axes, constant = gamepad.report(INPUT, 1).fields
+    assert buttons.bit_offset == 8  # After the Report ID byte
+    assert (axes.bit_offset, axes.logical_minimum, axes.logical_maximum) == (16, -127, 127)
+    # Pop restored the 1-bit, 0..1 buttons state except for the Report Size and Count set after it
+    assert (constant.bit_offset, constant.bit_size, constant.usage_page) == (32, 8, 0x09)
+    assert (constant.logical_minimum, constant.logical_maximum) == (0, 1)
+    assert constant.usages == ()  # Local items were reset by the previous main item
+    assert gamepad.report(INPUT, 1).byte_length == 5
+
+    feature, = gamepad.report(FEATURE, 2).fields
+    assert (feature.bit_offset, feature.logical_minimum, feature.logical_maximum) == (8, 0, 255)
+    assert not feature.signed
+
+def test_decode_reports_matches_python():
+    np = pytest.importorskip("numpy")
+    report = layout(MOUSE).report(INPUT, 2)  # 16 buttons, signed 12-bit X/Y and a signed 8-bit wheel
+    assert [field.signed for field in report.fields] == [False, True, True]
+    rng = random.Random(0)
+    reports = [bytes([rng.choice((2, 2, 3))]) + rng.randbytes(report.byte_length - 1) for _ in range(500)]
+    expected = decode_python(report, b"".join(reports))  # Skips the rows of Report ID 3 too
+    assert min(min(min(row) for row in field) for field in expected[1:]) < 0
+
+    padded = b"".join(data + bytes(64 - len(data)) for data in reports)  # One report per 64-byte packet
+    for arrays in (DecodeReports(report, b"".join(reports)), DecodeReports(report, padded, stride=64),
+                   DecodeReports(report, np.frombuffer(padded, dtype=np.uint8).reshape(-1, 64))):
+        assert [array.tolist() for array in arrays] == expected
+
+def test_decode_reports_rejects_short_rows():
+    np = pytest.importorskip("numpy")
+    report = layout(MOUSE).report(INPUT, 2)
+    with pytest.raises(ValueError):
+        DecodeReports(report, bytes(64), stride=report.byte_length - 1)
+    with pytest.raises(ValueError):
+        DecodeReports(report, np.zeros((4, report.byte_length - 1), dtype=np.uint8))
@@ -0,0 +1,74 @@
+# Copyright (c) 2025 Darshan P. All rights reserved.
+
+# This work is licensed under the terms of the MIT license.
+# For a copy, see <https://opensource.org/licenses/MIT>.
+
+import asyncio
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from server import DescriptorServer
+
+INTERFACE = "09 04 00 00 00 01 01 00 00"
+
+async def _exchange(server: DescriptorServer, *requests: bytes) -> list:
+    '''Sends `requests` on one connection and returns (status, headers, body) for every response read.'''
+    listener = await asyncio.start_server(server.handle_connection, "127.0.0.1", 0)
+    port = listener.sockets[0].getsockname()[1]
+    async with listener:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        responses = []
+        for request in requests:
+            writer.write(request)
+            await writer.drain()
+            status_line = await reader.readline()
+            if not status_line:
+                break
+            headers = {}
+            while (line := await reader.readline()) not in (b"\r\n", b""):
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+            body = await reader.readexactly(int(headers["content-length"]))
+            responses.append((int(status_line.split()[1]), headers, body))
+        writer.close()
+        await writer.wait_closed()
+    return responses
+
+def _post(path: str, body: bytes, extra: str = "") -> bytes:
+    return f"POST {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\n{extra}\r\n".encode() + body
+
+def exchange(*requests: bytes, **options) -> list:
+    server = DescriptorServer(jobs=1, **options)
+    try:
+        return asyncio.run(_exchange(server, *requests))
+    finally:
+        server.pool.shutdown()
+
+def test_keep_alive_reuses_the_connection():
+    responses = exchange(b"GET / HTTP/1.1\r\n\r\n", _post("/json", INTERFACE.encode()), _post("/json", INTERFACE.encode()))
+    assert [status for status, _, _ in responses] == [200, 200, 200]
+    assert all(headers["connection"] == "keep-alive" for _, headers, _ in responses)
+    assert json.loads(responses[0][2])["requests"] == 1
+    assert responses[1][2] == responses[2][2]
+
+def test_client_errors_keep_the_connection():
+    responses = exchange(_post("/json", b"zz"), _post("/gif", b"00"), b"GET /json HTTP/1.1\r\n\r\n",
+                         b"POST / HTTP/1.1\r\n\r\n", _post("/json", INTERFACE.encode()))
+    assert [status for status, _, _ in responses] == [400, 404, 405, 405, 200]
+
+def test_zero_control_size_is_not_a_server_error():
+    # A Feature Unit with bControlSize 0 is shown as unknown instead of dividing by zero
+    status, _, body = exchange(_post("/json", f"{INTERFACE} 09 24 06 01 02 00 00 00 00".encode()))[0]
+    assert status == 200
+    assert b"bControlSize is 0" in body
+
+def test_unframed_bodies_close_the_connection():
+    for request, expected in ((b"POST /json HTTP/1.1\r\nContent-Length: x\r\n\r\n", 400),
+                              (b"POST /json HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n", 411),
+                              (_post("/json", b"00 " * 8), 413)):
+        responses = exchange(request, _post("/json", INTERFACE.encode()), max_body=16)
+        assert [status for status, _, _ in responses] == [expected]
+        assert responses[0][1]["connection"] == "close"